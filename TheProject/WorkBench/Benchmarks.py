@@ -0,0 +1,463 @@
+import sys
+import math
+import time
+import numpy as np
+
+# Performance measurements, run from this folder: python Benchmarks.py <name>  (without a name every benchmark runs)
+
+
+# Cubies with the same amount of vertices as the ones in CubeWindow (feinKoernigkeit = 2), each one kept inside its own grid cell
+def createBenchmarkCubies(cubeType, verticesPerCuby = 36 + (2*6)*12 + ((2**2)*3)*8):
+
+    listWithCubies = np.zeros((cubeType**3, verticesPerCuby), [("position", np.float32, 3), ("color", np.float32, 4)])
+    cellWidth = 3.0 / cubeType
+    # Grid position of every cuby
+    cells = np.stack(np.unravel_index(np.arange(cubeType**3), (cubeType, cubeType, cubeType)), axis = -1)
+    listWithCubies["position"] = (cells[:, None, :] + np.random.rand(cubeType**3, verticesPerCuby, 3)) * cellWidth - 1.5
+    listWithCubies["color"] = (1.0, 1.0, 1.0, 1.0)
+
+    return listWithCubies
+
+
+# Frame time of the original path (every cuby uploaded into a new buffer and drawn on its own, every frame), of one draw call per cuby from the persistent buffer and of one single draw call for the whole cube
+def benchmarkDrawCalls(cubeTypes = (3, 7), frames = 200):
+
+    # Imported here, the other benchmarks don't need a window
+    import ctypes
+    import OpenGL.GL as gl
+    import CubeBuffers
+    import CubeTesting
+
+    # Only used for its window and program (glut can only be initialised once)
+    axesData = np.zeros(6, [("position", np.float32, 3), ("color", np.float32, 4)])
+    testCube = CubeTesting.wholeCube(None, None, axesData, createBenchmarkCubies(3))
+
+    for cubeType in cubeTypes:
+        listWithCubies = createBenchmarkCubies(cubeType)
+        buffers = CubeBuffers.BufferManager(testCube.programDescriptor, listWithCubies)
+
+        # As drawCubies used to do it for every cuby in paintGL (the buffers get deleted again here, the original never did)
+        def drawOriginal():
+
+            posLoc, colorLoc = testCube.programDescriptor.attributes["position"], testCube.programDescriptor.attributes["color"]
+            gl.glUniform1f(buffers.positionScaleLoc, 1.0)
+            buffers.setTurnMatrix(np.identity(4))
+            for cuby in listWithCubies:
+                vbo = gl.glGenBuffers(1)
+                gl.glBindBuffer(gl.GL_ARRAY_BUFFER, vbo)
+                gl.glBufferData(gl.GL_ARRAY_BUFFER, cuby.nbytes, cuby, gl.GL_DYNAMIC_DRAW)
+                gl.glEnableVertexAttribArray(posLoc)
+                gl.glVertexAttribPointer(posLoc, 3, gl.GL_FLOAT, False, cuby.strides[0], ctypes.c_void_p(0))
+                gl.glEnableVertexAttribArray(colorLoc)
+                gl.glVertexAttribPointer(colorLoc, 4, gl.GL_FLOAT, False, cuby.strides[0], ctypes.c_void_p(cuby.dtype["position"].itemsize))
+                gl.glDrawArrays(gl.GL_TRIANGLES, 0, cuby.size)
+                gl.glDeleteBuffers(1, [vbo])
+            gl.glBindBuffer(gl.GL_ARRAY_BUFFER, 0)
+
+        for name, drawFunc in (("per cuby, uploaded every frame (original)", drawOriginal), ("per cuby, persistent buffer", buffers.drawEach), ("batched, persistent buffer", buffers.draw)):
+            # Warm up, the first frames include driver side uploads
+            for _ in range(10):
+                drawFunc()
+            gl.glFinish()
+
+            oldTime = time.perf_counter()
+            for _ in range(frames):
+                gl.glClear(gl.GL_COLOR_BUFFER_BIT | gl.GL_DEPTH_BUFFER_BIT)
+                drawFunc()
+                gl.glFinish()
+            frameTime = (time.perf_counter() - oldTime) / frames
+
+            print("{0}x{0} ({1} cubies), {2}: {3:.3f} ms per frame".format(cubeType, cubeType**3, name, frameTime*1000))
+
+        buffers.release()
+
+    testCube.cleanup()
+
+
+# One layer of a 3x3 (feinKoernigkeit = 3) rotated by the old per-vertex loop vs CubeGeometry.rotateCubies
+def benchmarkLayerRotation(feinKoernigkeit = 3, repetitions = 20):
+
+    import CubeGeometry
+
+    listWithCubies = createBenchmarkCubies(3, 36 + (feinKoernigkeit*6)*12 + ((feinKoernigkeit**2)*3)*8)
+    whatCubesToRotate = np.arange(27).reshape(3,3,3)[0]
+    matrix = CubeGeometry.sideRotationMatrix(0, 10*math.pi/180)
+
+    # Old way, as it used to be done in rotateCubeSide for every animation step
+    oldTime = time.perf_counter()
+    for _ in range(repetitions):
+        for cuby in [x for x in listWithCubies if np.where(x == listWithCubies)[0][0] in whatCubesToRotate]:
+            for vertex in cuby:
+                vertex["position"] = (matrix @ np.array([vertex["position"][0], vertex["position"][1], vertex["position"][2], 1]))[:3]
+    loopTime = (time.perf_counter() - oldTime) / repetitions
+
+    oldTime = time.perf_counter()
+    for _ in range(repetitions):
+        CubeGeometry.rotateCubies(listWithCubies, whatCubesToRotate, matrix)
+    kernelTime = (time.perf_counter() - oldTime) / repetitions
+
+    print("{0} vertices per layer".format(whatCubesToRotate.size * listWithCubies.shape[1]))
+    print("per vertex loop: {0:.3f} ms, rotateCubies: {1:.3f} ms, speedup: {2:.0f}x".format(loopTime*1000, kernelTime*1000, loopTime/kernelTime))
+
+
+# Bytes sent to the GPU after one layer turn: whole buffer vs only the ranges of the turned cubies (no window needed, the ranges are the ones BufferManager.upload uses)
+def benchmarkLayerUpload(cubeType = 9):
+
+    import CubeBuffers
+    import CubeGeometry
+
+    listWithCubies = createBenchmarkCubies(cubeType)
+    cubyBytes = listWithCubies[0].nbytes
+    cubeOrder, cubySlots = CubeGeometry.createCubeIndex(cubeType)
+
+    # Outer layer of each axis, they lie differently inside the buffer
+    for axis in range(3):
+        layer = cubySlots[np.take(cubeOrder, 0, axis = axis)]
+        starts, stops = CubeBuffers.contiguousRanges(layer)
+        partialBytes = int(np.sum(stops - starts)) * cubyBytes
+        print("{0}x{0}, axis {1}: whole buffer {2} KiB, turned layer {3} KiB in {4} ranges ({5:.0f}x less)".format(cubeType, axis, listWithCubies.nbytes // 1024, partialBytes // 1024, len(starts), listWithCubies.nbytes / partialBytes))
+
+
+# Startup time of the whole cube geometry (CubeGeometry.createRoundedCubies) for different cube sizes and roundness factors
+def benchmarkGeometry(cubeTypes = (3, 5, 7), feinKoernigkeiten = (2, 5, 8), repetitions = 5):
+
+    import CubeGeometry
+
+    for cubeType in cubeTypes:
+        cubyFaceWidth, cubyRoundedPartWidth, fTRC = CubeGeometry.roundedCubyDimensions(cubeType)
+        faceColors = CubeGeometry.stickerColors(cubeType)
+        for feinKoernigkeit in feinKoernigkeiten:
+            oldTime = time.perf_counter()
+            for _ in range(repetitions):
+                listWithCubies = CubeGeometry.createRoundedCubies(cubeType, feinKoernigkeit, cubyFaceWidth, cubyRoundedPartWidth, fTRC, faceColors)
+            buildTime = (time.perf_counter() - oldTime) / repetitions
+
+            print("{0}x{0}, feinKoernigkeit {1}: {2} vertices in {3:.1f} ms".format(cubeType, feinKoernigkeit, listWithCubies.size, buildTime*1000))
+
+
+# Vertex memory of one private mesh per cuby vs one shared template mesh plus per cuby instance data (see CubeBuffers.InstancedBufferManager)
+def benchmarkInstancing(cubeTypes = (3, 10, 15), feinKoernigkeit = 3):
+
+    import CubeGeometry
+
+    for cubeType in cubeTypes:
+        cubyFaceWidth, cubyRoundedPartWidth, fTRC = CubeGeometry.roundedCubyDimensions(cubeType)
+        template = CubeGeometry.createRoundedCubyMesh(feinKoernigkeit, cubyFaceWidth, cubyRoundedPartWidth)
+        # Per vertex: position + color, per instance: 4x4 matrix + 6 face colors + turning flag (all float32)
+        vertexBytes = cubeType**3 * len(template) * (3 + 4) * 4
+        instancedBytes = template.nbytes + cubeType**3 * (16 + 6*4 + 1) * 4
+
+        print("{0}x{0}: one mesh per cuby {1:.1f} MiB, instanced {2:.2f} MiB ({3:.0f}x less)".format(cubeType, vertexBytes / 2**20, instancedBytes / 2**20, vertexBytes / instancedBytes))
+
+
+# Vertex bytes per cuby, per layer turn upload and per recoloring (e.g. a new color scheme) for every vertex format (CubeGeometry.vertexFormats), plus the largest position error of the compact ones
+def benchmarkVertexFormat(cubeTypes = (3, 7), feinKoernigkeit = 3, stickerTableWidth = 256):
+
+    import CubeBuffers
+    import CubeGeometry
+
+    for cubeType in cubeTypes:
+        cubyFaceWidth, cubyRoundedPartWidth, fTRC = CubeGeometry.roundedCubyDimensions(cubeType)
+        listWithCubies = CubeGeometry.createRoundedCubies(cubeType, feinKoernigkeit, cubyFaceWidth, cubyRoundedPartWidth, fTRC, CubeGeometry.stickerColors(cubeType))
+
+        cubeOrder, cubySlots = CubeGeometry.createCubeIndex(cubeType)
+        starts, stops = CubeBuffers.contiguousRanges(cubySlots[np.take(cubeOrder, 0, axis = 0)])
+        turnedCubies = int(np.sum(stops - starts))
+        # Same size as CubeBuffers.StickerTable's texture
+        stickerTableBytes = -(-(1 + 6*cubeType**3) // stickerTableWidth) * stickerTableWidth * 4
+
+        for vertexFormat in CubeGeometry.vertexFormats:
+            cubies, positionScale = CubeGeometry.convertVertices(listWithCubies, vertexFormat)
+            positionError = np.max(np.abs(cubies["position"] * positionScale - listWithCubies["position"]))
+            # With sticker ids only the sticker table has to be sent again, otherwise every vertex
+            recolorBytes = stickerTableBytes if "sticker" in cubies.dtype.names else cubies.nbytes
+
+            print("{0}x{0}, {1}: {2} bytes per vertex, {3} bytes per cuby, {4} KiB per layer turn, {5:.1f} KiB per recoloring, largest position error {6:.2e}".format(
+                cubeType, vertexFormat, cubies.dtype.itemsize, cubies[0].nbytes, turnedCubies * cubies[0].nbytes // 1024, recolorBytes / 1024, positionError))
+
+
+# Cubies and triangles of the whole cube with and without the hidden inner cubies (CubeGeometry.visibleCubies), plus how many triangles would be left if only faces which can ever be seen were drawn
+def benchmarkCulling(cubeTypes = (2, 3, 5, 7, 10, 15), feinKoernigkeit = 3):
+
+    import CubeGeometry
+
+    for cubeType in cubeTypes:
+        keptCubies = np.count_nonzero(CubeGeometry.visibleCubies(cubeType))
+        allTriangles, keptTriangles, visibleTriangles = CubeGeometry.triangleCounts(cubeType, feinKoernigkeit)
+
+        print("{0}x{0}: {1} of {2} cubies, {3} of {4} triangles ({5:.0f}% less), visible faces only {6}".format(
+            cubeType, keptCubies, cubeType**3, keptTriangles, allTriangles, 100 * (1 - keptTriangles / allTriangles), visibleTriangles))
+
+
+# Triangles with the wrong winding (CubeGeometry.windingErrors, has to be 0 for GL_CULL_FACE) and the share of triangles back face culling skips for a few whole cube rotations (computed on the CPU like the GPU would)
+def benchmarkWinding(cubeTypes = (2, 3, 5), feinKoernigkeiten = (1, 2, 3, 5, 8), angles = ((0.0, 0.0, 0.0), (0.4, -0.7, 0.2), (2.0, 1.0, -0.5))):
+
+    import CubeGeometry
+
+    for cubeType in cubeTypes:
+        cubyFaceWidth, cubyRoundedPartWidth, fTRC = CubeGeometry.roundedCubyDimensions(cubeType)
+        for feinKoernigkeit in feinKoernigkeiten:
+            listWithCubies = CubeGeometry.createRoundedCubies(cubeType, feinKoernigkeit, cubyFaceWidth, cubyRoundedPartWidth, fTRC, CubeGeometry.stickerColors(cubeType))
+            errors = int(np.sum(CubeGeometry.windingErrors(listWithCubies)))
+
+            positions = np.concatenate((listWithCubies["position"].reshape(-1, 3), np.ones((listWithCubies.size, 1))), axis = 1)
+            culledShares = []
+            for xAngle, yAngle, zAngle in angles:
+                projected = positions @ CubeGeometry.modelViewProjectionMatrix(xAngle, yAngle, zAngle).T
+                triangles = (projected[:, :2] / projected[:, 3:]).reshape(-1, 3, 2)
+                # Counter clockwise on the screen --> front facing
+                sides = triangles[:, 1:] - triangles[:, :1]
+                culledShares.append(np.mean(sides[:, 0, 0] * sides[:, 1, 1] - sides[:, 0, 1] * sides[:, 1, 0] <= 0))
+
+            print("{0}x{0}, feinKoernigkeit {1}: {2} of {3} triangles wound the wrong way, {4:.0f}% culled on average".format(
+                cubeType, feinKoernigkeit, errors, listWithCubies.size // 3, 100 * np.mean(culledShares)))
+
+
+# Sticker texture mode (CubeStickers) for big cubes: setup time, time of one layer turn on the CPU, texels sent after an inner and an outer layer turn, compared to the vertex data the instanced mode sends for the same turn
+def benchmarkStickerTexture(cubeTypes = (10, 100, 300), repetitions = 20):
+
+    import CubeGeometry
+    import CubeStickers
+
+    for cubeType in cubeTypes:
+        oldTime = time.perf_counter()
+        stickerCube = CubeStickers.StickerCube(cubeType)
+        setupTime = time.perf_counter() - oldTime
+
+        matrix = CubeGeometry.quarterTurnMatrix(1)[:3,:3]
+        oldTime = time.perf_counter()
+        for _ in range(repetitions):
+            innerStickers = stickerCube.turn(0, 1, matrix)
+        turnTime = (time.perf_counter() - oldTime) / repetitions
+        outerStickers = stickerCube.turn(0, 0, matrix)
+
+        # Texels FaceStateTexture sends: the bounding rectangle of the moved stickers on every face
+        def sentTexels(stickers):
+            faces, rows, columns = np.unravel_index(stickers, stickerCube.faceStates.shape)
+            return sum((np.ptp(rows[faces == face]) + 1) * (np.ptp(columns[faces == face]) + 1) for face in np.unique(faces))
+
+        # Instanced mode: 4x4 matrix + 6 colors per turned cuby (float32)
+        instancedBytes = cubeType**2 * (16 + 6*4) * 4
+        print("{0}x{0}: setup {1:.1f} ms, layer turn {2:.2f} ms, texels (1 byte each) sent for an inner layer {3}, for an outer layer {4}, instanced mode {5:.1f} KiB per layer turn".format(
+            cubeType, setupTime*1000, turnTime*1000, sentTexels(innerStickers), sentTexels(outerStickers), instancedBytes / 1024))
+
+
+# GeometryCache: building the cubies (first start) against memory mapping them from the cache (every later start), in a temporary directory so the real cache stays as it is
+def benchmarkGeometryCache(cubeTypes = (3, 7, 15), feinKoernigkeit = 8):
+
+    import tempfile
+    import CubeGeometry
+    import GeometryCache
+
+    with tempfile.TemporaryDirectory() as directory:
+        GeometryCache.cache = GeometryCache.GeometryCache(directory, 2**31)
+        for cubeType in cubeTypes:
+            cubyFaceWidth, cubyRoundedPartWidth, fTRC = CubeGeometry.roundedCubyDimensions(cubeType)
+            arguments = (cubeType, feinKoernigkeit, cubyFaceWidth, cubyRoundedPartWidth, fTRC, CubeGeometry.stickerColors(cubeType), CubeGeometry.visibleCubies(cubeType))
+
+            oldTime = time.perf_counter()
+            built = GeometryCache.createRoundedCubies(*arguments)
+            coldTime = time.perf_counter() - oldTime
+            oldTime = time.perf_counter()
+            loaded = GeometryCache.createRoundedCubies(*arguments)
+            warmTime = time.perf_counter() - oldTime
+
+            print("{0}x{0}, feinKoernigkeit {1}: {2:.1f} MiB, built and stored in {3:.1f} ms, loaded in {4:.2f} ms, identical: {5}".format(
+                cubeType, feinKoernigkeit, built.nbytes / 2**20, coldTime*1000, warmTime*1000, np.array_equal(built, loaded)))
+            del loaded
+        GeometryCache.cache = GeometryCache.GeometryCache()
+
+
+# CubeState: time of one move on the logical state, and whether it shows the same facelets as CubeStickers.StickerCube (which turns like the renderer) after random keyboard moves
+def benchmarkCubeState(amountOfMoves = 1000, seed = 0):
+
+    import random
+    import CubeGeometry
+    import CubeStickers
+    import CubeState
+
+    generator = random.Random(seed)
+    listWithMoves = [generator.choice("fbtdrlmes") for _ in range(amountOfMoves)]
+
+    cubeState = CubeState.CubeState()
+    oldTime = time.perf_counter()
+    cubeState.applySequence(listWithMoves)
+    moveTime = (time.perf_counter() - oldTime) / amountOfMoves
+
+    stickerCube = CubeStickers.StickerCube(3)
+    for move in listWithMoves:
+        sideRotationMatricesArrayIndex, layer, axes, amountForth, invertAngle = CubeGeometry.sideMoves[move]
+        stickerCube.turn(*CubeStickers.turnedSlab(3, layer, axes, amountForth), CubeGeometry.quarterTurnMatrix(sideRotationMatricesArrayIndex, -1 if invertAngle else 1)[:3,:3])
+    # Same facelet in both: same place on the cube, palette color (Front, Right, Back, Left, Top, Down) --> face index of CubeState
+    places = {tuple(position): sticker for sticker, position in enumerate(stickerCube.positions)}
+    stickers = [places[tuple(position)] for position in 2*CubeState.faceletCubies + CubeState.faceletNormals]
+    paletteFaces = np.array([CubeState.faceNames.index(face) for face in "FRBLUD"])
+    matches = np.array_equal(paletteFaces[stickerCube.faceStates.reshape(-1)[stickers]], cubeState.facelets())
+
+    print("{0} moves: {1:.1f} us per move, same facelets as the sticker model: {2}".format(amountOfMoves, moveTime*1e6, matches))
+
+
+# Move tables: a 1000 move sequence applied move by move against composed into one permutation first, and a cubeOrder turn with np.rot90 against the precomputed CubeGeometry.cubeOrderTurn
+def benchmarkMoveTables(amountOfMoves = 1000, cubeType = 7, repetitions = 20, seed = 0):
+
+    import random
+    import CubeGeometry
+    import CubeState
+
+    generator = random.Random(seed)
+    listWithMoves = [generator.choice(CubeState.moveNames) for _ in range(amountOfMoves)]
+
+    oldTime = time.perf_counter()
+    cubeState = CubeState.CubeState()
+    for move in listWithMoves:
+        cubeState.apply(move)
+    oneByOneTime = time.perf_counter() - oldTime
+
+    oldTime = time.perf_counter()
+    composed = CubeState.composeMoves(listWithMoves)
+    composeTime = time.perf_counter() - oldTime
+    oldTime = time.perf_counter()
+    composedState = CubeState.CubeState().multiply(composed)
+    applyTime = time.perf_counter() - oldTime
+
+    print("{0} moves: one by one {1:.2f} ms, composing {2:.2f} ms, applying the composed sequence {3:.1f} us, same state: {4}".format(
+        amountOfMoves, oneByOneTime*1000, composeTime*1000, applyTime*1e6, composedState == cubeState))
+
+    cubeOrder, _ = CubeGeometry.createCubeIndex(cubeType)
+    oldTime = time.perf_counter()
+    for _ in range(repetitions):
+        for _, layer, axes, amountForth, _ in CubeGeometry.sideMoves.values():
+            cubeOrder = np.rot90(cubeOrder, amountForth, axes = axes)
+            cubeOrder[layer] = np.rot90(cubeOrder[layer], 3)
+            cubeOrder = np.rot90(cubeOrder, 4-amountForth, axes = axes)
+    rot90Time = (time.perf_counter() - oldTime) / (repetitions * len(CubeGeometry.sideMoves))
+
+    tableOrder, _ = CubeGeometry.createCubeIndex(cubeType)
+    oldTime = time.perf_counter()
+    for _ in range(repetitions):
+        for _, layer, axes, amountForth, _ in CubeGeometry.sideMoves.values():
+            permutation, _ = CubeGeometry.cubeOrderTurn(cubeType, layer, axes, amountForth)
+            tableOrder = tableOrder.ravel()[permutation].reshape(tableOrder.shape)
+    tableTime = (time.perf_counter() - oldTime) / (repetitions * len(CubeGeometry.sideMoves))
+
+    print("{0}x{0} cubeOrder turn: np.rot90 {1:.1f} us, precomputed permutation {2:.1f} us, same cubeOrder: {3}".format(
+        cubeType, rot90Time*1e6, tableTime*1e6, np.array_equal(cubeOrder, tableOrder)))
+
+
+# CubeBatch: state-moves per second for one move on all the cubes, one move per cube (keyboard moves, as scramble does by default, and all moves) and a composed 100 move sequence, checked against CubeState for some of the cubes
+# One move per cube stays below the 10 million per second aimed at (see CubeBatch.applyPerCube)
+def benchmarkCubeBatch(count = 1000000, amountOfMoves = 20, seed = 0):
+
+    import CubeState
+    import CubeBatch
+
+    generator = np.random.default_rng(seed)
+    cubeBatch = CubeBatch.CubeBatch.solved(count)
+
+    listWithMoves = [CubeState.moveNames[index] for index in generator.integers(len(CubeState.moveNames), size = amountOfMoves)]
+    oldTime = time.perf_counter()
+    for move in listWithMoves:
+        cubeBatch.apply(move)
+    sameMoveTime = time.perf_counter() - oldTime
+
+    oldTime = time.perf_counter()
+    keyboardMoves = cubeBatch.scramble(amountOfMoves, generator = generator)
+    keyboardTime = time.perf_counter() - oldTime
+
+    oldTime = time.perf_counter()
+    perCubeMoves = cubeBatch.scramble(amountOfMoves, CubeState.moveNames, generator)
+    perCubeTime = time.perf_counter() - oldTime
+
+    sequence = [CubeState.moveNames[index] for index in generator.integers(len(CubeState.moveNames), size = 100)]
+    oldTime = time.perf_counter()
+    cubeBatch.applySequence(sequence)
+    sequenceTime = time.perf_counter() - oldTime
+
+    matches = all(cubeBatch.state(index) == CubeState.CubeState().applySequence(listWithMoves + [CubeState.moveNames[move] for move in np.concatenate((keyboardMoves[:, index], perCubeMoves[:, index]))] + sequence)
+                  for index in generator.integers(count, size = 20))
+
+    print("{0} cubes: same move {1:.1f}, one move per cube {2:.1f} (keyboard moves) / {3:.1f} (all moves, target 10), composed sequence {4:.0f} million state-moves per second, same as CubeState: {5}".format(
+        count, count*amountOfMoves / sameMoveTime / 1e6, count*amountOfMoves / keyboardTime / 1e6, count*amountOfMoves / perCubeTime / 1e6, count*len(sequence) / sequenceTime / 1e6, matches))
+
+
+# MoveNotation: a long random algorithm (written the way people write them, with wide moves and rotations) --> time to compile it, animated turns before and after merging, and whether the result still does the same
+def benchmarkNotation(amountOfMoves = 1000, seed = 0):
+
+    import random
+    import CubeState
+    import MoveNotation
+
+    generator = random.Random(seed)
+    text = " ".join(generator.choice(list(MoveNotation.notationMoves)) + generator.choice(("", "2", "'")) for _ in range(amountOfMoves))
+
+    oldTime = time.perf_counter()
+    runs = MoveNotation.compileSequence(text)
+    compileTime = time.perf_counter() - oldTime
+
+    unmerged = MoveNotation.stateMoves(MoveNotation.parse(text))
+    merged = MoveNotation.animationMoves(runs)
+    same = CubeState.CubeState().applySequence(unmerged) == CubeState.CubeState().applySequence([tuple(move) for move in merged])
+
+    print("{0} moves: compiled in {1:.2f} ms, {2} layer turns to animate instead of {3}, shortest notation {4} moves, same state: {5}".format(
+        amountOfMoves, compileTime*1000, len(merged), len(unmerged), len(MoveNotation.notation(runs).split()), same))
+
+
+# CubeSolver: time to build its tables (into an empty cache) and to load them again, then solution length and time for random cubes, and whether every solution solves its cube
+def benchmarkSolver(count = 50, amountOfMoves = 30, seed = 0):
+
+    import random
+    import tempfile
+    import CubeState
+    import CubeSolver
+    import GeometryCache
+
+    defaultTableCache, defaultTables = CubeSolver.tableCache, CubeSolver.tables
+    with tempfile.TemporaryDirectory() as directory:
+        CubeSolver.tableCache = GeometryCache.GeometryCache(directory, 2**31)
+        oldTime = time.perf_counter()
+        CubeSolver.SolverTables()
+        buildTime = time.perf_counter() - oldTime
+        oldTime = time.perf_counter()
+        CubeSolver.tables = CubeSolver.SolverTables()
+        loadTime = time.perf_counter() - oldTime
+
+        generator = random.Random(seed)
+        solveTimes, lengths, solved = [], [], True
+        for _ in range(count):
+            cubeState = CubeState.CubeState().applySequence([generator.choice(CubeState.moveNames) for _ in range(amountOfMoves)])
+            oldTime = time.perf_counter()
+            solution = CubeSolver.solve(cubeState)
+            solveTimes.append(time.perf_counter() - oldTime)
+            lengths.append(len(solution))
+            solved = solved and cubeState.copy().applySequence(solution).isSolved()
+
+        CubeSolver.tableCache, CubeSolver.tables = defaultTableCache, defaultTables
+
+    print("Tables built in {0:.1f} s, loaded in {1:.2f} s, {2} random cubes: {3:.1f} moves on average (at most {4}), solved in {5:.0f} ms on average (at most {6:.0f} ms), all solved: {7}".format(
+        buildTime, loadTime, count, sum(lengths) / count, max(lengths), sum(solveTimes) / count * 1000, max(solveTimes) * 1000, solved))
+
+
+benchmarks = {
+    "drawcalls": benchmarkDrawCalls,
+    "layerrotation": benchmarkLayerRotation,
+    "layerupload": benchmarkLayerUpload,
+    "geometry": benchmarkGeometry,
+    "instancing": benchmarkInstancing,
+    "vertexformat": benchmarkVertexFormat,
+    "culling": benchmarkCulling,
+    "winding": benchmarkWinding,
+    "stickertexture": benchmarkStickerTexture,
+    "geometrycache": benchmarkGeometryCache,
+    "cubestate": benchmarkCubeState,
+    "movetables": benchmarkMoveTables,
+    "cubebatch": benchmarkCubeBatch,
+    "notation": benchmarkNotation,
+    "solver": benchmarkSolver,
+}
+
+
+if __name__ == "__main__":
+
+    for name in sys.argv[1:] or benchmarks:
+        print("--- " + name)
+        benchmarks[name]()
@@ -0,0 +1,176 @@
+import time
+from collections import deque
+from PyQt5.QtCore import Qt, QTimer
+
+
+# One animation --> start: called once when it's its turn, update: called on every tick with the progress (0.0 to 1.0), finish: called once the progress has reached 1.0
+class Animation():
+
+    def __init__(self, duration, update, start = None, finish = None):
+
+        self.duration = duration
+        self.update = update
+        self.start = start
+        self.finish = finish
+
+
+# Plays animations one after the other, driven by a timer and the elapsed time instead of blocking the event loop with repaint() and sleep()
+class AnimationScheduler():
+
+    def __init__(self, widget, interval = 16):
+
+        # Widget to redraw after each tick
+        self.widget = widget
+        # Animations waiting for their turn and the one currently playing
+        self.animations = deque()
+        self.current = None
+        self.startTime = 0.0
+
+        # Only runs while there is something to animate
+        self.timer = QTimer()
+        self.timer.setTimerType(Qt.PreciseTimer)
+        self.timer.setInterval(interval)
+        self.timer.timeout.connect(self.tick)
+
+        # Time stamps of the last painted frames, used for the frame rate
+        self.frameTimes = deque(maxlen = 60)
+
+        # Called whenever no animation is left, may add new ones (see MoveQueue)
+        self.refill = None
+
+
+    def add(self, animation):
+
+        self.animations.append(animation)
+        self.wake()
+
+
+    # Start ticking again if the scheduler was idle
+    def wake(self):
+
+        if not self.timer.isActive():
+            # Nothing was playing, so whatever comes next starts now
+            self.startTime = time.perf_counter()
+            self.timer.start()
+
+
+    def isAnimating(self):
+
+        return self.current is not None or len(self.animations) > 0
+
+
+    def tick(self):
+
+        now = time.perf_counter()
+
+        # Animations which are shorter than one tick (e.g. during a scramble) all get played within the same tick
+        while True:
+            if self.current is None:
+                if not self.animations and self.refill:
+                    self.refill()
+                if not self.animations:
+                    self.timer.stop()
+                    break
+                self.current = self.animations.popleft()
+                if self.current.start:
+                    self.current.start()
+
+            progress = 1.0 if self.current.duration <= 0 else min(1.0, (now - self.startTime) / self.current.duration)
+            self.current.update(progress)
+            if progress < 1.0:
+                break
+
+            if self.current.finish:
+                self.current.finish()
+            # The next animation starts where this one should have ended, so a sequence keeps its pace even if a tick came late
+            self.startTime = min(now, self.startTime + self.current.duration)
+            self.current = None
+
+        self.widget.update()
+
+
+    # Jump to the end of the current and every waiting animation right away (moves still in a MoveQueue are not touched)
+    def finishAll(self):
+
+        while self.current is not None or self.animations:
+            if self.current is None:
+                self.current = self.animations.popleft()
+                if self.current.start:
+                    self.current.start()
+            self.current.update(1.0)
+            if self.current.finish:
+                self.current.finish()
+            self.current = None
+
+        self.timer.stop()
+
+
+    # Called by paintGL
+    def recordFrame(self):
+
+        self.frameTimes.append(time.perf_counter())
+
+
+    # Frames per second over the last painted frames
+    def frameRate(self):
+
+        if len(self.frameTimes) < 2 or self.frameTimes[-1] == self.frameTimes[0]:
+            return 0.0
+
+        return (len(self.frameTimes) - 1) / (self.frameTimes[-1] - self.frameTimes[0])
+
+
+# Moves waiting to be animated --> they are only handed to the scheduler one at a time, so until then consecutive moves on the same axis can still be merged (R R -> R2, R R' -> nothing, R L R -> R2 L)
+class MoveQueue():
+
+    # startMove: function(move, quarterTurns, duration) which animates a move, moveAxes: move -> axis it turns around
+    def __init__(self, scheduler, startMove, moveAxes):
+
+        self.scheduler = scheduler
+        self.startMove = startMove
+        self.moveAxes = moveAxes
+        # [move, quarterTurns (1 to 3), duration of a quarter turn]
+        self.pendingMoves = []
+
+        scheduler.refill = self.playNext
+
+
+    def push(self, move, quarterTurns = 1, duration = 0.15):
+
+        # Moves on the same axis commute, so look back past them for the same move
+        merged = False
+        for index in range(len(self.pendingMoves)-1, -1, -1):
+            pendingMove = self.pendingMoves[index]
+            if self.moveAxes[pendingMove[0]] != self.moveAxes[move]:
+                break
+            if pendingMove[0] == move:
+                pendingMove[1] = (pendingMove[1] + quarterTurns) % 4
+                # A full turn is no turn at all
+                if pendingMove[1] == 0:
+                    del self.pendingMoves[index]
+                merged = True
+                break
+
+        if not merged and quarterTurns % 4:
+            self.pendingMoves.append([move, quarterTurns % 4, duration])
+
+        if self.pendingMoves:
+            self.scheduler.wake()
+
+
+    def playNext(self):
+
+        if self.pendingMoves:
+            move, quarterTurns, duration = self.pendingMoves.pop(0)
+            self.startMove(move, quarterTurns, duration)
+
+
+    # Drop every move which hasn't started yet (the one currently playing still finishes)
+    def cancel(self):
+
+        self.pendingMoves.clear()
+
+
+    def __len__(self):
+
+        return len(self.pendingMoves)
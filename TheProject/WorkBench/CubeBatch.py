@@ -0,0 +1,122 @@
+import numpy as np
+import CubeState
+
+
+# Many 3x3x3 cubes at once as their facelets (colors, in the order of CubeState.facelets), for analysis and dataset generation, with the move tables of CubeState (the same moves CubeWindow turns its cubies with)
+# facelets is a (K, 54) uint8 array stored facelet by facelet (Fortran order): one move for all K cubes then only moves 54 contiguous rows of K bytes each around
+
+
+# Per row of CubeState.faceletMoveTable the facelets the move changes and where their colors come from
+changedFacelets = [np.flatnonzero(permutation != np.arange(54)) for permutation in CubeState.faceletMoveTable]
+sourceFacelets = [permutation[changed] for permutation, changed in zip(CubeState.faceletMoveTable, changedFacelets)]
+
+
+class CubeBatch():
+
+    def __init__(self, facelets):
+
+        facelets = np.asarray(facelets, dtype = np.uint8)
+        if facelets.ndim != 2 or facelets.shape[1] != 54:
+            raise ValueError("Facelets have to be a (K, 54) array, not " + str(facelets.shape))
+        self.facelets = np.asfortranarray(facelets)
+
+
+    # count solved cubes
+    @classmethod
+    def solved(cls, count):
+
+        return cls(np.broadcast_to(CubeState.CubeState().facelets(), (count, 54)))
+
+
+    @classmethod
+    def fromStates(cls, states):
+
+        return cls(np.array([state.facelets() for state in states]).reshape(-1, 54))
+
+
+    def __len__(self):
+
+        return len(self.facelets)
+
+
+    # Cube number index as a CubeState
+    def state(self, index):
+
+        return CubeState.CubeState.fromFacelets(self.facelets[index])
+
+
+    # One move (name or keyboard letter, see CubeState.moveNames) quarterTurns times for every cube --> one gather
+    def apply(self, move, quarterTurns = 1):
+
+        index = CubeState.moveIndex(move, quarterTurns)
+        if index is not None:
+            self.permute(CubeState.faceletMoveTable[index])
+
+        return self
+
+
+    # A whole sequence (see CubeState.applySequence) for every cube, composed first --> one gather, however long the sequence is
+    def applySequence(self, sequence):
+
+        return self.permute(CubeState.composeFaceletPermutation(sequence))
+
+
+    # Same facelet permutation for every cube (facelets after = facelets before[:, permutation])
+    def permute(self, permutation):
+
+        # Transposed, the facelets are C ordered: whole rows get picked
+        self.facelets = self.facelets.T[permutation].T
+
+        return self
+
+
+    # One move per cube: moves holds a row of CubeState.faceletMoveTable (see CubeState.moveNames, e.g. from CubeState.sequenceIndexes) per cube, -1 for no move
+    # Per move used, only the facelets it changes get blended in (chunkSize cubes at a time, so the masks stay in the cache): n[d] ^= (n[d] ^ o[s]) & mask
+    # --> about 8 million state-moves per second (one core) for the keyboard moves, fewer the more different moves (the rotations change 52 facelets): below the 10 million aimed at, far below one move for all cubes (see apply)
+    def applyPerCube(self, moves, chunkSize = 65536):
+
+        moves = np.asarray(moves)
+        if moves.shape != (len(self),):
+            raise ValueError("One move per cube needed, got " + str(moves.shape) + " for " + str(len(self)) + " cubes")
+        if len(moves) and (moves.min() < -1 or moves.max() >= len(CubeState.faceletMoveTable)):
+            raise ValueError("Moves have to be rows of CubeState.faceletMoveTable or -1")
+
+        # Transposed, every facelet is a contiguous row of K bytes
+        old = self.facelets.T
+        new = old.copy()
+        blended = np.empty(min(chunkSize, len(self)), dtype = np.uint8)
+        for start in range(0, len(self), chunkSize):
+            chunk = slice(start, start + chunkSize)
+            movesOfChunk, oldOfChunk, newOfChunk, blendedOfChunk = moves[chunk], old[:, chunk], new[:, chunk], blended[:len(moves[chunk])]
+            for move in np.unique(movesOfChunk):
+                if move < 0:
+                    continue
+                mask = np.negative((movesOfChunk == move).view(np.uint8))
+                for changed, source in zip(changedFacelets[move], sourceFacelets[move]):
+                    np.bitwise_xor(newOfChunk[changed], oldOfChunk[source], out = blendedOfChunk)
+                    blendedOfChunk &= mask
+                    newOfChunk[changed] ^= blendedOfChunk
+        self.facelets = new.T
+
+        return self
+
+
+    # amountOfMoves random moves per cube out of moveNames (all of CubeState.moveNames if None, default: the keyboard moves), generator: np.random.Generator for reproducible scrambles
+    # --> the moves as (amountOfMoves, K) rows of CubeState.faceletMoveTable
+    def scramble(self, amountOfMoves, moveNames = tuple(CubeState.keyboardMoves.values()), generator = None):
+
+        generator = np.random.default_rng() if generator is None else generator
+        choices = np.array([CubeState.moveIndexes[name] for name in (moveNames or CubeState.moveNames)])
+        moves = choices[generator.integers(len(choices), size = (amountOfMoves, len(self)))]
+        for movesOfAllCubes in moves:
+            self.applyPerCube(movesOfAllCubes)
+
+        return moves
+
+
+    # Whether every face has one color --> bool per cube
+    def isSolved(self):
+
+        faces = self.facelets.T.reshape(6, 9, len(self))
+
+        return np.all(faces == faces[:, 4:5], axis = (0, 1))
@@ -0,0 +1,547 @@
+import ctypes
+import numpy as np
+import OpenGL.GL as gl
+
+
+# Sorted object indexes -> (starts, stops) of the runs of consecutive indexes, e.g. [0,1,2,6,7] -> ([0,6], [3,8])
+def contiguousRanges(objectIndexes):
+
+    objectIndexes = np.unique(np.ravel(objectIndexes).astype(int))
+    if objectIndexes.size == 0:
+        return objectIndexes, objectIndexes
+
+    # A new run starts wherever the gap to the previous index is bigger than 1
+    breaks = np.flatnonzero(np.diff(objectIndexes) > 1) + 1
+    starts = objectIndexes[np.concatenate(([0], breaks))]
+    stops = objectIndexes[np.concatenate((breaks - 1, [objectIndexes.size - 1]))] + 1
+
+    return starts, stops
+
+
+# OpenGL type of each numpy type a vertex field can have
+glTypes = {
+    np.dtype(np.float32): gl.GL_FLOAT,
+    np.dtype(np.int16): gl.GL_SHORT,
+    np.dtype(np.uint16): gl.GL_UNSIGNED_SHORT,
+    np.dtype(np.uint8): gl.GL_UNSIGNED_BYTE,
+}
+
+
+# Sends the dirty objects of listWithObjects (one row per object) into vbo --> returns the amount of bytes uploaded
+def uploadObjects(vbo, listWithObjects, dirtyObjects, orphanThreshold):
+
+    if not dirtyObjects:
+        return 0
+
+    gl.glBindBuffer(gl.GL_ARRAY_BUFFER, vbo)
+
+    if len(dirtyObjects) >= orphanThreshold * len(listWithObjects):
+        # Orphaning: the driver hands out fresh storage instead of waiting for the GPU to finish drawing from the old one
+        gl.glBufferData(gl.GL_ARRAY_BUFFER, listWithObjects.nbytes, None, gl.GL_DYNAMIC_DRAW)
+        gl.glBufferSubData(gl.GL_ARRAY_BUFFER, 0, listWithObjects.nbytes, listWithObjects)
+        return listWithObjects.nbytes
+
+    # One sub range update per run of consecutive dirty objects (e.g. 3 runs of 3 cubies for a turned front layer of a 3x3)
+    objectBytes = listWithObjects[0].nbytes
+    uploadedBytes = 0
+    for start, stop in zip(*contiguousRanges(list(dirtyObjects))):
+        gl.glBufferSubData(gl.GL_ARRAY_BUFFER, int(start) * objectBytes, int(stop - start) * objectBytes, listWithObjects[start:stop])
+        uploadedBytes += int(stop - start) * objectBytes
+
+    return uploadedBytes
+
+
+# Owns every buffer the cubies need on the GPU: created once in initializeGL, re-uploaded only when the vertex data changed, deleted on teardown
+class BufferManager():
+
+    # programDescriptor: linked shader program with its resolved locations (CubeProgram.ProgramDescriptor), listWithObjects: contiguous numpy array with one vertex array per object (cuby), mode: how to draw the vertices,
+    # positionScale: what the shader multiplies the positions by (only compact vertices need something else than 1.0, see CubeGeometry.vertexFormats), textures: textures the shader reads (e.g. the StickerTable of vertex formats with sticker ids), uploaded and bound together with the buffer
+    def __init__(self, programDescriptor, listWithObjects, mode = gl.GL_TRIANGLES, positionScale = 1.0, textures = ()):
+
+        # All objects live back to back in one interleaved buffer, so the whole array has to be one contiguous block (np.array of the cubies is)
+        self.listWithObjects = listWithObjects
+        self.mode = mode
+
+        # Per object ranges inside the buffer (in vertices): object i starts at firsts[i] and has counts[i] vertices
+        self.verticesPerObject = self.listWithObjects.shape[1]
+        self.firsts = np.arange(len(self.listWithObjects), dtype = np.int32) * self.verticesPerObject
+        self.counts = np.full(len(self.listWithObjects), self.verticesPerObject, dtype = np.int32)
+
+        # "Interpretation rules" of every vertex field the program has an attribute for --> location, amount of values, value type, normalized (integer colors 0 to 255 -> 0.0 to 1.0), offset in bytes inside one vertex (as a C variable)
+        dtype = self.listWithObjects.dtype
+        self.vertexAttributes = [
+            (programDescriptor.attributes[name], int(np.prod(dtype[name].shape)), glTypes[dtype[name].base], name == "color" and np.issubdtype(dtype[name].base, np.integer), ctypes.c_void_p(dtype.fields[name][1]))
+            for name in dtype.names if name in programDescriptor.attributes
+        ]
+        # .strides[-1] returns the length in bytes of one vertex
+        self.objectStride = self.listWithObjects.strides[-1]
+
+        # Locations of the matrix which rotates the turning side and of the position scale, already resolved by the program descriptor (-1 if the program has no position scale)
+        self.turnMatrixLoc = programDescriptor.uniforms["turnMatrix"]
+        self.positionScaleLoc = programDescriptor.uniforms.get("positionScale", -1)
+        self.positionScale = positionScale
+        self.textures = textures
+
+        # One single Vbo for all objects
+        self.vbo = gl.glGenBuffers(1)
+        # The Vao stores the "interpretation rules" of the Vbo, so they only have to be set once (not available on every context, e.g. legacy macOS ones)
+        self.useVao = bool(gl.glGenVertexArrays)
+        self.vao = gl.glGenVertexArrays(1) if self.useVao else None
+
+        # Specifies to which target the buffer is bound (GL_ARRAY_BUFFER)
+        gl.glBindBuffer(gl.GL_ARRAY_BUFFER, self.vbo)
+        # Allocate the storage once --> target, complete length in bytes of data, data, way of usage (GL_DYNAMIC_DRAW because the data changes whenever a side is turned)
+        gl.glBufferData(gl.GL_ARRAY_BUFFER, self.listWithObjects.nbytes, self.listWithObjects, gl.GL_DYNAMIC_DRAW)
+
+        if self.useVao:
+            gl.glBindVertexArray(self.vao)
+            self.setAttribPointers()
+            gl.glBindVertexArray(0)
+        gl.glBindBuffer(gl.GL_ARRAY_BUFFER, 0)
+
+        # Indexes of the objects whose vertex data changed since the last upload (everything has just been uploaded)
+        self.dirtyObjects = set()
+        # Bytes sent to the GPU by the last upload (i.e. in the last frame) and since the buffer was created
+        self.bytesUploadedLastFrame = 0
+        self.bytesUploadedTotal = self.listWithObjects.nbytes
+        # If at least this share of the buffer is dirty, the whole buffer is orphaned and streamed anew instead of updated range by range
+        self.orphanThreshold = 0.5
+        # Prevents deleting the buffers twice
+        self.released = False
+
+
+    # Enable "connection" or "communication" between the bound buffer and the attributes in the program
+    def setAttribPointers(self):
+
+        # "Interpretation rules" for the VertexAttribArray --> location, amount of values, value type, normalized, data length in bytes, offset
+        for loc, size, glType, normalized, offset in self.vertexAttributes:
+            gl.glEnableVertexAttribArray(loc)
+            gl.glVertexAttribPointer(loc, size, glType, normalized, self.objectStride, offset)
+
+
+    # Called whenever the vertex data of some objects has been changed on the CPU side
+    def markDirty(self, objectIndexes):
+
+        self.dirtyObjects.update(int(index) for index in np.ravel(objectIndexes))
+
+
+    # Re-upload the vertex data into the storage allocated in __init__, but only the ranges of the objects which changed
+    def upload(self):
+
+        self.bytesUploadedLastFrame = uploadObjects(self.vbo, self.listWithObjects, self.dirtyObjects, self.orphanThreshold)
+        for texture in self.textures:
+            self.bytesUploadedLastFrame += texture.upload()
+        self.bytesUploadedTotal += self.bytesUploadedLastFrame
+        self.dirtyObjects.clear()
+
+
+    # Bind the buffer and its interpretation rules
+    def bind(self):
+
+        if self.useVao:
+            gl.glBindVertexArray(self.vao)
+        else:
+            gl.glBindBuffer(gl.GL_ARRAY_BUFFER, self.vbo)
+            self.setAttribPointers()
+        for texture in self.textures:
+            texture.bind()
+
+
+    # Leave no Vao bound, Qt uses its own ones when composing the widget
+    def unbind(self):
+
+        if self.useVao:
+            gl.glBindVertexArray(0)
+        for texture in self.textures:
+            texture.unbind()
+
+
+    # Upload a 4x4 matrix (numpy convention: matrix @ vertex) to the turnMatrix uniform, OpenGL expects it column by column
+    def setTurnMatrix(self, turnMatrix):
+
+        gl.glUniformMatrix4fv(self.turnMatrixLoc, 1, gl.GL_FALSE, np.ascontiguousarray(turnMatrix.T, dtype = np.float32))
+
+
+    # Draw every object with one single call, no matter how many there are --> while a side is turning, one call for the resting objects and one for the turning ones (rotated by turnMatrix on the GPU)
+    def draw(self, turningObjects = (), turnMatrix = None):
+
+        self.upload()
+        self.bind()
+
+        gl.glUniform1f(self.positionScaleLoc, self.positionScale)
+        self.setTurnMatrix(np.identity(4))
+        if len(turningObjects) == 0:
+            gl.glDrawArrays(self.mode, 0, self.listWithObjects.size)
+        else:
+            turning = np.zeros(len(self.listWithObjects), dtype = bool)
+            turning[np.ravel(turningObjects)] = True
+
+            gl.glMultiDrawArrays(self.mode, self.firsts[~turning], self.counts[~turning], int(np.count_nonzero(~turning)))
+            self.setTurnMatrix(turnMatrix)
+            gl.glMultiDrawArrays(self.mode, self.firsts[turning], self.counts[turning], int(np.count_nonzero(turning)))
+
+        self.unbind()
+
+
+    # Old way: one draw call per object, only kept to compare frame times
+    def drawEach(self):
+
+        self.upload()
+        self.bind()
+        gl.glUniform1f(self.positionScaleLoc, self.positionScale)
+        self.setTurnMatrix(np.identity(4))
+        for first, count in zip(self.firsts, self.counts):
+            gl.glDrawArrays(self.mode, int(first), int(count))
+        self.unbind()
+
+
+    # Needs a current context, called on widget teardown
+    def release(self):
+
+        if self.released:
+            return
+
+        gl.glDeleteBuffers(1, [self.vbo])
+        if self.useVao:
+            gl.glDeleteVertexArrays(1, [self.vao])
+
+        self.released = True
+
+
+# Colors of all stickers in a small texture (one RGBA texel per sticker id, see CubeGeometry.stickerTable) --> recoloring, highlighting or dimming stickers only means sending this texture again, not a single vertex
+class StickerTable():
+
+    # programDescriptor: program made of CubeProgram.paletteVertexShaderCode, colors: one color (0.0 to 1.0) per sticker id, width: texels per row (a power of 2, see CubeProgram.paletteFragmentShaderCode)
+    def __init__(self, programDescriptor, colors, width = 256, textureUnit = 0):
+
+        self.textureUnit = textureUnit
+        self.stickerCount = len(colors)
+        # As few rows as possible, the last one may be partly unused
+        self.texels = np.zeros((-(-self.stickerCount // width), width, 4), dtype = np.uint8)
+        self.setColors(colors)
+
+        self.tableLoc = programDescriptor.uniforms["stickerTable"]
+        self.tableSizeLoc = programDescriptor.uniforms["stickerTableSize"]
+
+        # Nearest texel, no mipmaps: every lookup hits exactly one sticker
+        self.texture = gl.glGenTextures(1)
+        gl.glBindTexture(gl.GL_TEXTURE_2D, self.texture)
+        gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_MIN_FILTER, gl.GL_NEAREST)
+        gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_MAG_FILTER, gl.GL_NEAREST)
+        gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_WRAP_S, gl.GL_CLAMP_TO_EDGE)
+        gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_WRAP_T, gl.GL_CLAMP_TO_EDGE)
+        gl.glTexImage2D(gl.GL_TEXTURE_2D, 0, gl.GL_RGBA8, width, len(self.texels), 0, gl.GL_RGBA, gl.GL_UNSIGNED_BYTE, self.texels)
+        gl.glBindTexture(gl.GL_TEXTURE_2D, 0)
+
+        # Everything has just been uploaded
+        self.dirty = False
+        self.bytesUploadedTotal = self.texels.nbytes
+        self.released = False
+
+
+    # colors: one color (0.0 to 1.0) per sticker id, or only the ones of stickerIds --> sent with the next upload
+    def setColors(self, colors, stickerIds = None):
+
+        texels = self.texels.reshape(-1, 4)
+        colors = np.rint(np.clip(colors, 0.0, 1.0) * 255)
+        if stickerIds is None:
+            texels[:self.stickerCount] = colors
+        else:
+            texels[np.ravel(stickerIds).astype(int)] = colors
+        self.dirty = True
+
+
+    # Send the whole table again if a color changed (a few KiB even for big cubes) --> returns the amount of bytes uploaded
+    def upload(self):
+
+        if not self.dirty:
+            return 0
+
+        gl.glBindTexture(gl.GL_TEXTURE_2D, self.texture)
+        gl.glTexSubImage2D(gl.GL_TEXTURE_2D, 0, 0, 0, self.texels.shape[1], self.texels.shape[0], gl.GL_RGBA, gl.GL_UNSIGNED_BYTE, self.texels)
+        gl.glBindTexture(gl.GL_TEXTURE_2D, 0)
+        self.dirty = False
+        self.bytesUploadedTotal += self.texels.nbytes
+
+        return self.texels.nbytes
+
+
+    # Bind the texture to its unit and tell the program where to find it
+    def bind(self):
+
+        gl.glActiveTexture(gl.GL_TEXTURE0 + self.textureUnit)
+        gl.glBindTexture(gl.GL_TEXTURE_2D, self.texture)
+        gl.glUniform1i(self.tableLoc, self.textureUnit)
+        gl.glUniform2f(self.tableSizeLoc, self.texels.shape[1], self.texels.shape[0])
+
+
+    def unbind(self):
+
+        gl.glActiveTexture(gl.GL_TEXTURE0 + self.textureUnit)
+        gl.glBindTexture(gl.GL_TEXTURE_2D, 0)
+
+
+    # Needs a current context, called on teardown
+    def release(self):
+
+        if self.released:
+            return
+
+        gl.glDeleteTextures(1, [self.texture])
+
+        self.released = True
+
+
+# Sticker state of a cubeType x cubeType cube as a texture (see CubeStickers.StickerCube) --> one byte (palette index) per sticker, the 6 faces stacked on top of each other (cubeType wide, 6*cubeType high)
+# After a layer turn only the rectangles of the stickers which moved get sent again, a row or a column per side face (plus the whole face for an outer layer)
+class FaceStateTexture():
+
+    # programDescriptor: program made of CubeProgram.stickerShellVertexShaderCode, faceStates: (6, cubeType, cubeType) uint8 palette indexes, kept by the caller and read again for everything marked dirty
+    def __init__(self, programDescriptor, faceStates, textureUnit = 1):
+
+        self.faceStates = faceStates
+        self.textureUnit = textureUnit
+        self.cubeType = faceStates.shape[1]
+
+        self.statesLoc = programDescriptor.uniforms["faceStates"]
+        self.cubeTypeLoc = programDescriptor.uniforms["cubeType"]
+
+        self.texture = gl.glGenTextures(1)
+        gl.glBindTexture(gl.GL_TEXTURE_2D, self.texture)
+        gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_MIN_FILTER, gl.GL_NEAREST)
+        gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_MAG_FILTER, gl.GL_NEAREST)
+        gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_WRAP_S, gl.GL_CLAMP_TO_EDGE)
+        gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_WRAP_T, gl.GL_CLAMP_TO_EDGE)
+        # Rows of one byte texels aren't 4 byte aligned
+        gl.glPixelStorei(gl.GL_UNPACK_ALIGNMENT, 1)
+        gl.glTexImage2D(gl.GL_TEXTURE_2D, 0, gl.GL_LUMINANCE8, self.cubeType, 6 * self.cubeType, 0, gl.GL_LUMINANCE, gl.GL_UNSIGNED_BYTE, self.faceStates)
+        gl.glBindTexture(gl.GL_TEXTURE_2D, 0)
+
+        # Per face: [first row, first column, last row + 1, last column + 1] of everything changed since the last upload, None if nothing changed
+        self.dirtyRectangles = [None] * 6
+        self.bytesUploadedTotal = self.faceStates.nbytes
+        self.released = False
+
+
+    # Called whenever the stickers at the given flat indexes of faceStates have changed
+    def markDirty(self, stickerIndexes):
+
+        faces, rows, columns = np.unravel_index(np.ravel(stickerIndexes).astype(int), self.faceStates.shape)
+        for face in np.unique(faces):
+            onFace = faces == face
+            rectangle = [rows[onFace].min(), columns[onFace].min(), rows[onFace].max() + 1, columns[onFace].max() + 1]
+            old = self.dirtyRectangles[face]
+            if old is not None:
+                rectangle = [min(old[0], rectangle[0]), min(old[1], rectangle[1]), max(old[2], rectangle[2]), max(old[3], rectangle[3])]
+            self.dirtyRectangles[face] = rectangle
+
+
+    # One sub image per face with changed stickers --> returns the amount of bytes uploaded
+    def upload(self):
+
+        if not any(self.dirtyRectangles):
+            return 0
+
+        uploadedBytes = 0
+        gl.glBindTexture(gl.GL_TEXTURE_2D, self.texture)
+        gl.glPixelStorei(gl.GL_UNPACK_ALIGNMENT, 1)
+        for face, rectangle in enumerate(self.dirtyRectangles):
+            if rectangle is None:
+                continue
+            firstRow, firstColumn, lastRow, lastColumn = (int(value) for value in rectangle)
+            texels = np.ascontiguousarray(self.faceStates[face, firstRow:lastRow, firstColumn:lastColumn])
+            gl.glTexSubImage2D(gl.GL_TEXTURE_2D, 0, firstColumn, face * self.cubeType + firstRow, lastColumn - firstColumn, lastRow - firstRow, gl.GL_LUMINANCE, gl.GL_UNSIGNED_BYTE, texels)
+            uploadedBytes += texels.nbytes
+        gl.glBindTexture(gl.GL_TEXTURE_2D, 0)
+
+        self.dirtyRectangles = [None] * 6
+        self.bytesUploadedTotal += uploadedBytes
+
+        return uploadedBytes
+
+
+    def bind(self):
+
+        gl.glActiveTexture(gl.GL_TEXTURE0 + self.textureUnit)
+        gl.glBindTexture(gl.GL_TEXTURE_2D, self.texture)
+        gl.glUniform1i(self.statesLoc, self.textureUnit)
+        gl.glUniform1f(self.cubeTypeLoc, self.cubeType)
+
+
+    def unbind(self):
+
+        gl.glActiveTexture(gl.GL_TEXTURE0 + self.textureUnit)
+        gl.glBindTexture(gl.GL_TEXTURE_2D, 0)
+        gl.glActiveTexture(gl.GL_TEXTURE0)
+
+
+    def release(self):
+
+        if self.released:
+            return
+
+        gl.glDeleteTextures(1, [self.texture])
+
+        self.released = True
+
+
+# Whether the current context can draw instanced (OpenGL 3.3, or older ones with instanced arrays), legacy contexts (e.g. plain OpenGL 2.1) can't
+def instancingSupported():
+
+    return bool(gl.glVertexAttribDivisor) and bool(gl.glDrawArraysInstanced)
+
+
+# Instanced alternative to BufferManager: one template mesh shared by every object, each object (instance) only has its own 4x4 matrix and 6 face colors --> vertex memory no longer grows with the amount of cubies
+class InstancedBufferManager():
+
+    # programDescriptor: program made of CubeProgram.instancedVertexShaderCode, template: vertices with "position" and "face" (see CubeGeometry.createRoundedCubyMesh),
+    # instanceMatrices: one matrix per object (numpy convention: matrix @ vertex), kept by the caller and read again for every object marked dirty, instanceColors: 6 face colors per object
+    def __init__(self, programDescriptor, template, instanceMatrices, instanceColors):
+
+        if not instancingSupported():
+            raise RuntimeError("Instanced drawing isn't supported by this OpenGL context (glVertexAttribDivisor / glDrawArraysInstanced missing)")
+
+        self.template = template
+        self.instanceMatrices = instanceMatrices
+
+        # Per instance data, the matrices are stored column by column as OpenGL expects them
+        self.instanceData = np.zeros(len(instanceMatrices), [("matrix", np.float32, (4,4)), ("colors", np.float32, (6,4))])
+        self.instanceData["matrix"] = instanceMatrices.transpose(0, 2, 1)
+        self.instanceData["colors"] = instanceColors
+        # 1.0 for the instances which are rotated by turnMatrix
+        self.turning = np.zeros(len(instanceMatrices), dtype = np.float32)
+
+        self.posLoc = programDescriptor.attributes["position"]
+        self.faceLoc = programDescriptor.attributes["face"]
+        # A mat4 attribute takes 4 locations in a row, one per column
+        self.matrixLoc = programDescriptor.attributes["cubyMatrix"]
+        self.colorLocs = [programDescriptor.attributes["faceColor" + str(face)] for face in range(6)]
+        self.turningLoc = programDescriptor.attributes["turning"]
+        self.turnMatrixLoc = programDescriptor.uniforms["turnMatrix"]
+
+        # Template, per instance data and turning flags each get their own Vbo
+        self.vbo, self.instanceVbo, self.turningVbo = gl.glGenBuffers(3)
+        self.useVao = bool(gl.glGenVertexArrays)
+        self.vao = gl.glGenVertexArrays(1) if self.useVao else None
+
+        gl.glBindBuffer(gl.GL_ARRAY_BUFFER, self.vbo)
+        gl.glBufferData(gl.GL_ARRAY_BUFFER, self.template.nbytes, self.template, gl.GL_STATIC_DRAW)
+        gl.glBindBuffer(gl.GL_ARRAY_BUFFER, self.instanceVbo)
+        gl.glBufferData(gl.GL_ARRAY_BUFFER, self.instanceData.nbytes, self.instanceData, gl.GL_DYNAMIC_DRAW)
+        gl.glBindBuffer(gl.GL_ARRAY_BUFFER, self.turningVbo)
+        gl.glBufferData(gl.GL_ARRAY_BUFFER, self.turning.nbytes, self.turning, gl.GL_DYNAMIC_DRAW)
+
+        if self.useVao:
+            gl.glBindVertexArray(self.vao)
+            self.setAttribPointers()
+            gl.glBindVertexArray(0)
+        gl.glBindBuffer(gl.GL_ARRAY_BUFFER, 0)
+
+        # Same bookkeeping as BufferManager, but per instance
+        self.dirtyObjects = set()
+        self.bytesUploadedLastFrame = 0
+        self.bytesUploadedTotal = self.template.nbytes + self.instanceData.nbytes + self.turning.nbytes
+        self.orphanThreshold = 0.5
+        self.released = False
+
+
+    # Per vertex attributes come from the template, per instance ones (divisor 1) advance once per drawn instance
+    def setAttribPointers(self):
+
+        gl.glBindBuffer(gl.GL_ARRAY_BUFFER, self.vbo)
+        stride = self.template.strides[-1]
+        gl.glEnableVertexAttribArray(self.posLoc)
+        gl.glVertexAttribPointer(self.posLoc, 3, gl.GL_FLOAT, False, stride, ctypes.c_void_p(0))
+        gl.glEnableVertexAttribArray(self.faceLoc)
+        gl.glVertexAttribPointer(self.faceLoc, 1, gl.GL_FLOAT, False, stride, ctypes.c_void_p(self.template.dtype["position"].itemsize))
+
+        gl.glBindBuffer(gl.GL_ARRAY_BUFFER, self.instanceVbo)
+        stride = self.instanceData.strides[-1]
+        columns = [self.matrixLoc + column for column in range(4)]
+        for index, loc in enumerate(columns + self.colorLocs):
+            gl.glEnableVertexAttribArray(loc)
+            gl.glVertexAttribPointer(loc, 4, gl.GL_FLOAT, False, stride, ctypes.c_void_p(index * 16))
+            gl.glVertexAttribDivisor(loc, 1)
+
+        gl.glBindBuffer(gl.GL_ARRAY_BUFFER, self.turningVbo)
+        gl.glEnableVertexAttribArray(self.turningLoc)
+        gl.glVertexAttribPointer(self.turningLoc, 1, gl.GL_FLOAT, False, 0, ctypes.c_void_p(0))
+        gl.glVertexAttribDivisor(self.turningLoc, 1)
+
+
+    def markDirty(self, objectIndexes):
+
+        self.dirtyObjects.update(int(index) for index in np.ravel(objectIndexes))
+
+
+    # New face colors for every instance, sent with the next upload (the template mesh stays untouched)
+    def setColors(self, instanceColors):
+
+        self.instanceData["colors"] = instanceColors
+        self.markDirty(np.arange(len(self.instanceData)))
+
+
+    # Copy the matrices of the dirty instances and send only their ranges, the turning flags are sent whenever they changed
+    def upload(self, turningObjects = ()):
+
+        if self.dirtyObjects:
+            dirty = np.fromiter(self.dirtyObjects, dtype = int)
+            self.instanceData["matrix"][dirty] = self.instanceMatrices[dirty].transpose(0, 2, 1)
+        self.bytesUploadedLastFrame = uploadObjects(self.instanceVbo, self.instanceData, self.dirtyObjects, self.orphanThreshold)
+        self.dirtyObjects.clear()
+
+        turning = np.zeros(len(self.turning), dtype = np.float32)
+        turning[np.ravel(turningObjects).astype(int)] = 1.0
+        if not np.array_equal(turning, self.turning):
+            self.turning = turning
+            gl.glBindBuffer(gl.GL_ARRAY_BUFFER, self.turningVbo)
+            gl.glBufferSubData(gl.GL_ARRAY_BUFFER, 0, self.turning.nbytes, self.turning)
+            self.bytesUploadedLastFrame += self.turning.nbytes
+
+        self.bytesUploadedTotal += self.bytesUploadedLastFrame
+
+
+    def bind(self):
+
+        if self.useVao:
+            gl.glBindVertexArray(self.vao)
+        else:
+            self.setAttribPointers()
+
+
+    # Without a Vao the divisors would stay set for whatever gets drawn next
+    def unbind(self):
+
+        if self.useVao:
+            gl.glBindVertexArray(0)
+        else:
+            for loc in [self.matrixLoc + column for column in range(4)] + self.colorLocs + [self.turningLoc]:
+                gl.glVertexAttribDivisor(loc, 0)
+                gl.glDisableVertexAttribArray(loc)
+
+
+    def setTurnMatrix(self, turnMatrix):
+
+        gl.glUniformMatrix4fv(self.turnMatrixLoc, 1, gl.GL_FALSE, np.ascontiguousarray(turnMatrix.T, dtype = np.float32))
+
+
+    # Every instance with one single call, the turning ones get rotated by turnMatrix in the shader
+    def draw(self, turningObjects = (), turnMatrix = None):
+
+        self.upload(turningObjects)
+        self.bind()
+        self.setTurnMatrix(np.identity(4) if turnMatrix is None else turnMatrix)
+        gl.glDrawArraysInstanced(gl.GL_TRIANGLES, 0, len(self.template), len(self.instanceData))
+        self.unbind()
+
+
+    def release(self):
+
+        if self.released:
+            return
+
+        gl.glDeleteBuffers(3, [self.vbo, self.instanceVbo, self.turningVbo])
+        if self.useVao:
+            gl.glDeleteVertexArrays(1, [self.vao])
+
+        self.released = True
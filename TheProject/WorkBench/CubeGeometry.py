@@ -0,0 +1,443 @@
+import math
+import functools
+import numpy as np
+
+
+# Rotation matrix of a side turn by angle (radians) --> sideRotationMatricesArrayIndex 0: around z (front / back / standing), 1: around x (right / left / middle), 2: around y (top / down / equator)
+def sideRotationMatrix(sideRotationMatricesArrayIndex, angle):
+
+    cos, sin = math.cos(angle), math.sin(angle)
+
+    sideRotationMatricesArray = (
+        np.array([[cos,sin,0,0] , [-sin,cos,0,0] , [0,0,1,0] , [0,0,0,1]]),
+        np.array([[1,0,0,0] , [0,cos,sin,0] , [0,-sin,cos,0] , [0,0,0,1]]),
+        np.array([[cos,0,-sin,0] , [0,1,0,0] , [sin,0,cos,0] , [0,0,0,1]])
+    )
+
+    return sideRotationMatricesArray[sideRotationMatricesArrayIndex]
+
+
+# Vertex layouts --> "float": 28 bytes per vertex, "compact": positions as 16 bit integers (scaled back by the shader, see convertVertices) and 8 bit RGBA colors, 12 bytes per vertex
+# "palette" and "compactPalette": no color at all, only the vertex's sticker id (see stickerIds), the shader looks the color up in the sticker table (see CubeBuffers.StickerTable) --> 16 and 8 bytes per vertex, recoloring never touches the vertices
+vertexFormats = {
+    "float": np.dtype([("position", np.float32, 3), ("color", np.float32, 4)]),
+    # padding keeps every vertex 4 byte aligned
+    "compact": np.dtype([("position", np.int16, 3), ("padding", np.int16), ("color", np.uint8, 4)]),
+    "palette": np.dtype([("position", np.float32, 3), ("sticker", np.float32)]),
+    "compactPalette": np.dtype([("position", np.int16, 3), ("sticker", np.uint16)]),
+}
+
+
+# Static camera --> view: moved back a bit to zoom out, projection: perspective projection (the vertex shader divides by w itself)
+viewMatrix = np.array([[1,0,0,0] , [0,1,0,0] , [0,0,1,-4.5] , [0,0,0,1]])
+projectionMatrix = np.array([[1,0,0,0] , [0,1,0,0] , [0,0,0,-1.5] , [0,0,-1,0]])
+
+
+# Whole ModelViewProjection matrix for the given whole cube rotation angles (around x, y and z), computed once per frame instead of once per vertex in the shader
+def modelViewProjectionMatrix(xAngle, yAngle, zAngle):
+
+    modelMatrix = sideRotationMatrix(1, xAngle) @ sideRotationMatrix(2, yAngle) @ sideRotationMatrix(0, zAngle)
+
+    return projectionMatrix @ viewMatrix @ modelMatrix
+
+
+# Exact turn by quarterTurns quarter turns (signed: -1, 1 or 2), rounded so that no error accumulates in the vertex data after many turns
+def quarterTurnMatrix(sideRotationMatricesArrayIndex, quarterTurns = 1):
+
+    return np.round(sideRotationMatrix(sideRotationMatricesArrayIndex, quarterTurns*math.pi/2))
+
+
+# Quarter turns of a side move (1 to 3, the way its key turns it, see sideMoves) --> signed quarter turns of its sideRotationMatrix (-1, 1 or 2)
+def signedQuarterTurns(quarterTurns, invertAngle = False):
+
+    return ((quarterTurns + 1) % 4 - 1) * (-1 if invertAngle else 1)
+
+
+# Rotates every vertex of the given cubies at once: gathers their positions into one contiguous (N,3) float32 block, does a single matrix product and scatters the result back
+def rotateCubies(listWithCubies, cubyIndexes, matrix):
+
+    cubyIndexes = np.ravel(cubyIndexes)
+    # Fancy indexing already returns a fresh (contiguous) copy, reshape is therefore just a view
+    positions = listWithCubies["position"][cubyIndexes].reshape(-1, 3)
+    # Row vectors --> multiply by the transposed matrix, then add the translation part
+    positions = positions @ matrix[:3,:3].T.astype(np.float32) + matrix[:3,3].astype(np.float32)
+    # Integer positions (compact vertices) would otherwise get truncated
+    if np.issubdtype(listWithCubies.dtype["position"].base, np.integer):
+        positions = np.rint(positions)
+    listWithCubies["position"][cubyIndexes] = positions.reshape(len(cubyIndexes), -1, 3)
+
+
+# Rotates every cuby by its own matrix (cubyMatrices: one 3x3 matrix per cuby in listWithCubies) with one single batched product
+def rotateCubiesIndividually(listWithCubies, cubyMatrices):
+
+    positions = np.einsum("cvj,cij->cvi", listWithCubies["position"], cubyMatrices.astype(np.float32))
+    if np.issubdtype(listWithCubies.dtype["position"].base, np.integer):
+        positions = np.rint(positions)
+    listWithCubies["position"] = positions
+
+
+# Index structures of a cubeType x cubeType x cubeType cube --> cubeOrder: grid position (front to back, top to bottom, left to right) -> cuby id, cubySlots: cuby id -> index of the cuby inside listWithCubies (and therefore inside the vertex buffer)
+# keptCubies: which cubies have been built (see visibleCubies), the other ones get the slot -1, None if all of them have been built
+def createCubeIndex(cubeType, keptCubies = None):
+
+    cubyIds = np.arange(cubeType**3)
+    # Cuby ids count from the top right front corner (x first, then y, then z), the grid starts on the left
+    cubeOrder = np.empty((cubeType, cubeType, cubeType), dtype = int)
+    cubeOrder[cubyIds // cubeType**2, (cubyIds // cubeType) % cubeType, cubeType - 1 - cubyIds % cubeType] = cubyIds
+    # Every cuby has been created in id order
+    cubySlots = cubyIds.copy()
+    if keptCubies is not None:
+        cubySlots = np.full(cubeType**3, -1)
+        cubySlots[keptCubies] = np.arange(np.count_nonzero(keptCubies))
+
+    return cubeOrder, cubySlots
+
+
+# A side turn of cubeOrder (same arguments as the cube's turnCubeOrder) as precomputed grid positions --> permutation: flat cubeOrder after the turn = flat cubeOrder before it[permutation],
+# layerPositions: flat grid positions of the layer which turns (before the turn), so a turn is a single gather instead of rotating cubeOrder back and forth
+@functools.lru_cache(maxsize = None)
+def cubeOrderTurn(cubeType, layer, axes = (0,1), amountForth = 0, quarterTurns = 1):
+
+    # Turned the way cubeOrder itself used to be turned: rotate the layer to the front, turn it, rotate it back
+    positions = np.rot90(np.arange(cubeType**3).reshape(cubeType, cubeType, cubeType), amountForth, axes = axes)
+    layerPositions = positions[layer].ravel()
+    positions[layer] = np.rot90(positions[layer], 3*quarterTurns)
+    permutation = np.rot90(positions, 4-amountForth, axes = axes).ravel()
+
+    for array in (permutation, layerPositions):
+        array.flags.writeable = False
+
+    return permutation, layerPositions
+
+
+# Rounded cuby shape --> 36 vertices for the 6 colored faces, then (feinKoernigkeit*6) per rounded edge (12) and (feinKoernigkeit**2)*3 per rounded corner (8), the same layout CubeWindow has always used
+# Coordinates relative to the cuby's top right front corner (tRC) as (face width coefficients, rounded part width coefficients) per vertex
+cubyFaces = (
+    # Front
+    ((0,0,0),(0,0,0)), ((-1,0,0),(0,0,0)), ((-1,-1,0),(0,0,0)),   ((0,0,0),(0,0,0)), ((-1,-1,0),(0,0,0)), ((0,-1,0),(0,0,0)),
+    # Right
+    ((0,0,-1),(1,0,-1)), ((0,0,0),(1,0,-1)), ((0,-1,0),(1,0,-1)),   ((0,0,-1),(1,0,-1)), ((0,-1,0),(1,0,-1)), ((0,-1,-1),(1,0,-1)),
+    # Back
+    ((-1,0,-1),(0,0,-2)), ((0,0,-1),(0,0,-2)), ((0,-1,-1),(0,0,-2)),   ((-1,0,-1),(0,0,-2)), ((0,-1,-1),(0,0,-2)), ((-1,-1,-1),(0,0,-2)),
+    # Left
+    ((-1,0,0),(-1,0,-1)), ((-1,0,-1),(-1,0,-1)), ((-1,-1,-1),(-1,0,-1)),   ((-1,0,0),(-1,0,-1)), ((-1,-1,-1),(-1,0,-1)), ((-1,-1,0),(-1,0,-1)),
+    # Top
+    ((0,0,-1),(0,1,-1)), ((-1,0,-1),(0,1,-1)), ((-1,0,0),(0,1,-1)),   ((0,0,-1),(0,1,-1)), ((-1,0,0),(0,1,-1)), ((0,0,0),(0,1,-1)),
+    # Down
+    ((-1,-1,-1),(0,-1,-1)), ((0,-1,-1),(0,-1,-1)), ((0,-1,0),(0,-1,-1)),   ((-1,-1,-1),(0,-1,-1)), ((0,-1,0),(0,-1,-1)), ((-1,-1,0),(0,-1,-1)),
+)
+
+# Every rounded part is an arc (edges) or a sphere octant (corners) around a corner of the cuby's inner box (the cuby without its rounded parts), given as (0: right / top / front, 1: left / down / back) per axis
+# Edges --> inner box corners at both ends of the edge, direction where the arc starts, direction where it ends (in this order every triangle winds counter clockwise seen from outside)
+cubyEdges = (
+    # Middle: Front Top, Front Down, Back Top, Back Down
+    ((0,0,0), (1,0,0), (0,1,0), (0,0,1)),
+    ((0,1,0), (1,1,0), (0,0,1), (0,-1,0)),
+    ((0,0,1), (1,0,1), (0,0,-1), (0,1,0)),
+    ((0,1,1), (1,1,1), (0,-1,0), (0,0,-1)),
+    # Equator: Front Right, Front Left, Back Right, Back Left
+    ((0,1,0), (0,0,0), (1,0,0), (0,0,1)),
+    ((1,1,0), (1,0,0), (0,0,1), (-1,0,0)),
+    ((0,1,1), (0,0,1), (0,0,-1), (1,0,0)),
+    ((1,1,1), (1,0,1), (-1,0,0), (0,0,-1)),
+    # Standing: Right Top, Left Top, Right Down, Left Down
+    ((0,0,0), (0,0,1), (1,0,0), (0,1,0)),
+    ((1,0,0), (1,0,1), (0,1,0), (-1,0,0)),
+    ((0,1,0), (0,1,1), (0,-1,0), (1,0,0)),
+    ((1,1,0), (1,1,1), (-1,0,0), (0,-1,0)),
+)
+# Corners --> inner box corner, pole (top / down) and the two directions the rings of the octant go from and to (same winding as the edges)
+cubyCorners = (
+    # Top: Right Front, Left Front, Right Back, Left Back
+    ((0,0,0), (0,1,0), (0,0,1), (1,0,0)),
+    ((1,0,0), (0,1,0), (-1,0,0), (0,0,1)),
+    ((0,0,1), (0,1,0), (1,0,0), (0,0,-1)),
+    ((1,0,1), (0,1,0), (0,0,-1), (-1,0,0)),
+    # Down: Right Front, Left Front, Right Back, Left Back
+    ((0,1,0), (0,-1,0), (1,0,0), (0,0,1)),
+    ((1,1,0), (0,-1,0), (0,0,1), (-1,0,0)),
+    ((0,1,1), (0,-1,0), (0,0,-1), (1,0,0)),
+    ((1,1,1), (0,-1,0), (-1,0,0), (0,0,-1)),
+)
+
+
+# Vertex positions of one rounded cuby relative to its top right front corner, every trigonometric value comes from one arc table per feinKoernigkeit
+def createRoundedCubyTemplate(feinKoernigkeit, cubyFaceWidth, cubyRoundedPartWidth):
+
+    # Arc table: feinKoernigkeit steps from 0 to pi/2
+    arc = (math.pi/2) * np.arange(feinKoernigkeit + 1) / feinKoernigkeit
+    cosArc, sinArc = np.cos(arc), np.sin(arc)
+
+    faces = np.array(cubyFaces, dtype = float)
+    faces = faces[:, 0] * cubyFaceWidth + faces[:, 1] * cubyRoundedPartWidth
+
+    def innerBoxCorners(corners):
+        return -cubyFaceWidth * np.asarray(corners, dtype = float) - (0, 0, cubyRoundedPartWidth)
+
+    # Edges: arc points (edge, step, end of the edge, xyz), quad k is made of the steps k and k+1 --> two triangles (top0, top1, bottom0), (top1, bottom1, bottom0), both with the same winding
+    edges = np.array(cubyEdges, dtype = float)
+    centers = innerBoxCorners(edges[:, :2])
+    directions = cosArc[:, None] * edges[:, None, 2] + sinArc[:, None] * edges[:, None, 3]
+    arcPoints = centers[:, None, :, :] + cubyRoundedPartWidth * directions[:, :, None, :]
+    steps = (np.arange(1, feinKoernigkeit + 1)[:, None] + (-1, -1, 0, -1, 0, 0)).ravel()
+    ends = np.tile((0, 1, 0, 1, 1, 0), feinKoernigkeit)
+    edges = arcPoints[:, steps, ends].reshape(-1, 3)
+
+    # Corners: ring i (0 = pole) has i+1 points, the ring's angle runs over arc, the position on the ring from 0 to pi/2 in i steps
+    corners = np.array(cubyCorners, dtype = float)
+    rings = np.repeat(np.arange(feinKoernigkeit + 1), np.arange(1, feinKoernigkeit + 2))
+    onRing = np.arange(len(rings)) - rings * (rings + 1) // 2
+    ringAngles = (math.pi/2) * onRing / np.maximum(rings, 1)
+    directions = (cosArc[rings, None, None] * corners[:, 1]
+                  + sinArc[rings, None, None] * (np.cos(ringAngles)[:, None, None] * corners[:, 2] + np.sin(ringAngles)[:, None, None] * corners[:, 3]))
+    ringPoints = innerBoxCorners(corners[:, 0]) + cubyRoundedPartWidth * directions
+    # Ring i gets attached to ring i-1 with one triangle (top0, bottom0, bottom1) followed by pairs (top k, bottom k+1, top k+1), (bottom k+1, bottom k+2, top k+1), all with the same winding
+    triangles = []
+    for ring in range(1, feinKoernigkeit + 1):
+        top, bottom = ring * (ring - 1) // 2, ring * (ring + 1) // 2
+        k = np.arange(ring - 1)[:, None]
+        triangles += [(top, bottom, bottom + 1), (np.array((top, bottom + 1, top + 1, bottom + 1, bottom + 2, top + 1)) + k).ravel()]
+    corners = ringPoints[np.concatenate(triangles)].transpose(1, 0, 2).reshape(-1, 3)
+
+    return np.concatenate((faces, edges, corners))
+
+
+# Winding of every triangle (3 vertices in a row each) --> 1: counter clockwise seen from outside (kept by back face culling), -1: clockwise (culled even when it faces the camera), 0: no area
+# center: a point inside the mesh, every cuby is convex so outside means away from it
+def windingSigns(vertices, center):
+
+    triangles = np.reshape(vertices, (-1, 3, 3)).astype(float)
+    normals = np.cross(triangles[:, 1] - triangles[:, 0], triangles[:, 2] - triangles[:, 0])
+    outwards = np.einsum("ij,ij->i", normals, triangles.mean(axis = 1) - center)
+
+    return np.sign(np.where(np.abs(outwards) > 1e-12 * np.max(np.abs(outwards)), outwards, 0.0))
+
+
+# Amount of triangles of every cuby (listWithCubies in any vertex format) which don't wind counter clockwise seen from outside, 0 everywhere means GL_CULL_FACE can't hide any visible triangle
+def windingErrors(listWithCubies):
+
+    positions = listWithCubies["position"].astype(float)
+    # Middle of each cuby's bounding box
+    centers = (positions.min(axis = 1) + positions.max(axis = 1)) / 2
+
+    return np.array([np.count_nonzero(windingSigns(cuby, center) <= 0) for cuby, center in zip(positions, centers)])
+
+
+# Sizes of the cubies of a cubeType x cubeType x cubeType cube --> face width, rounded part width, top right front corner of the first cuby
+def roundedCubyDimensions(cubeType):
+
+    # cubeFaceWidth in OpenGL units --> add or substract 0.4 for every additional / missing cuby compared to the standard 3x3
+    cubeFaceWidth = (5.7 + (cubeType - 3)*0.4) * (10/19)
+    cubyFaceWidth = (cubeFaceWidth/cubeType)*0.8696
+    cubyRoundedPartWidth = (cubeFaceWidth/cubeType)*0.0652
+    fTRC = ((cubeFaceWidth/2)-cubyRoundedPartWidth, (cubeFaceWidth/2)-cubyRoundedPartWidth, cubeFaceWidth/2)
+
+    return cubyFaceWidth, cubyRoundedPartWidth, fTRC
+
+
+# Outward normal of every colored cuby face, in the order of cubyFaces (front, right, back, left, top, down)
+faceNormals = np.array([(0,0,1), (1,0,0), (0,0,-1), (-1,0,0), (0,1,0), (0,-1,0)])
+
+# Sticker colors --> one per face (same order as faceNormals), the last one for faces inside the cube (and the rounded parts)
+colorPalette = np.array([
+    (1.0, 0.0, 0.0, 1.0),   # Front: red
+    (0.0, 0.0, 1.0, 1.0),   # Right: blue
+    (1.0, 0.5, 0.0, 1.0),   # Back: orange
+    (0.0, 1.0, 0.0, 1.0),   # Left: green
+    (1.0, 1.0, 1.0, 1.0),   # Top: white
+    (1.0, 1.0, 0.0, 1.0),   # Down: yellow
+    (0.0, 0.0, 0.0, 1.0),   # Inside: black
+], dtype = np.float32)
+
+
+# Grid position of every cuby's center (cubeType**3, 3) in cuby widths, centered around the middle of the cube, x counts from the right, y from the top, z from the front (cuby id order)
+def gridPositions(cubeType):
+
+    cubyIds = np.arange(cubeType**3)
+
+    return (cubeType - 1) / 2 - np.stack((cubyIds % cubeType, (cubyIds // cubeType) % cubeType, cubyIds // cubeType**2), axis = -1)
+
+
+# Palette index of each face of every cuby (cubeType**3, 6) --> a face gets its sticker color if its normal points out of the cube from the cuby's grid position, black otherwise
+def stickerPaletteIndexes(cubeType):
+
+    outside = gridPositions(cubeType) @ faceNormals.T == (cubeType - 1) / 2
+
+    return np.where(outside, np.arange(6), len(colorPalette) - 1)
+
+
+# Faces which can ever be seen (cubeType**3, 6) --> the ones on the outside, and inner ones which a turning layer uncovers: the layer next to the face turns around the axis of the face's normal,
+# a quarter turned square covers everything closer to the axis than half the cube width, so only faces which reach further out (their outermost corner) can show up mid-turn
+def visibleFaces(cubeType):
+
+    positions = gridPositions(cubeType)
+    outside = positions @ faceNormals.T == (cubeType - 1) / 2
+
+    # Outermost corner of every cuby measured from each axis (x, y, z), in cuby widths
+    corners = np.abs(positions) + 0.5
+    distances = np.sqrt(np.sum(corners**2, axis = -1, keepdims = True) - corners**2)
+    uncovered = distances[:, np.argmax(np.abs(faceNormals), axis = -1)] > cubeType / 2
+
+    return outside | uncovered
+
+
+# Cubies which can ever be seen (cubeType**3 bools, cuby id order) --> the center one of a 3x3 can't, and neither can most of the inner cubies of bigger cubes
+def visibleCubies(cubeType):
+
+    return np.any(visibleFaces(cubeType), axis = -1)
+
+
+# Color of each face of every cuby (cubeType**3, 6, 4)
+def stickerColors(cubeType, palette = colorPalette):
+
+    return palette[stickerPaletteIndexes(cubeType)]
+
+
+# Top right front corner of every cuby (in cuby id order: x first, then y, then z)
+def cubyPositions(cubeType, cubyFaceWidth, cubyRoundedPartWidth, fTRC):
+
+    cubyIds = np.arange(cubeType**3)
+    cellWidth = cubyFaceWidth + 2*cubyRoundedPartWidth
+
+    return np.asarray(fTRC) - cellWidth * np.stack((cubyIds % cubeType, (cubyIds // cubeType) % cubeType, cubyIds // cubeType**2), axis = -1)
+
+
+# Every cuby of a cubeType x cubeType x cubeType cube at once --> one template broadcast over all cuby offsets, faceColors: 6 face colors per cuby (see stickerColors), the rounded parts are black
+# keptCubies: only build these cubies (bools in cuby id order, see visibleCubies), still in id order, None builds all of them
+def createRoundedCubies(cubeType, feinKoernigkeit, cubyFaceWidth, cubyRoundedPartWidth, fTRC, faceColors, keptCubies = None):
+
+    template = createRoundedCubyTemplate(feinKoernigkeit, cubyFaceWidth, cubyRoundedPartWidth)
+    cubyIds = np.arange(cubeType**3) if keptCubies is None else np.flatnonzero(keptCubies)
+
+    listWithCubies = np.empty((len(cubyIds), len(template)), vertexFormats["float"])
+    listWithCubies["position"] = cubyPositions(cubeType, cubyFaceWidth, cubyRoundedPartWidth, fTRC)[cubyIds, None, :] + template
+    listWithCubies["color"] = (0.0, 0.0, 0.0, 1.0)
+    listWithCubies["color"][:, :36] = np.repeat(np.asarray(faceColors)[cubyIds], 6, axis = 1)
+
+    return listWithCubies
+
+
+# Sticker id of every vertex (len(cubyIds), verticesPerCuby) --> 1 + 6*cubyId + face for the 36 face vertices of every cuby (see cubyFaces), 0 for the black rounded parts
+def stickerIds(cubyIds, verticesPerCuby):
+
+    ids = np.zeros((len(cubyIds), verticesPerCuby), dtype = int)
+    ids[:, :36] = 1 + 6*np.asarray(cubyIds)[:, None] + np.arange(36) // 6
+
+    return ids
+
+
+# Color of every sticker id (1 + 6*cubeType**3, 4), the row number is the id (see stickerIds) --> row 0 (rounded parts) is black, then the stickers of every cuby (see stickerColors)
+def stickerTable(stickerColors, roundedPartColor = colorPalette[-1]):
+
+    return np.concatenate((np.reshape(roundedPartColor, (1, 4)), np.reshape(stickerColors, (-1, 4))))
+
+
+# Copy of stickerColors in which every sticker of the cubies not in keptCubies (cuby ids) is dimmed to dimColor, e.g. everything but the last layer --> the black inner faces stay black
+def dimStickers(stickerColors, keptCubies, dimColor = (0.35, 0.35, 0.35, 1.0), innerColor = colorPalette[-1]):
+
+    dimmed = np.array(stickerColors, dtype = np.float32)
+    dim = np.ones(len(dimmed), dtype = bool)
+    dim[np.ravel(keptCubies).astype(int)] = False
+    dim = dim[:, None] & np.any(dimmed != innerColor, axis = -1)
+    dimmed[dim] = dimColor
+
+    return dimmed
+
+
+# Old way of recoloring, for the vertex formats with a color field: rewrite the color of every face vertex (the whole buffer has to be uploaded again afterwards), cubySlots: cuby id -> row of listWithCubies
+def recolorVertices(listWithCubies, cubySlots, stickerColors):
+
+    # Cubies which haven't been built have no slot
+    built = cubySlots >= 0
+    colors = np.repeat(np.asarray(stickerColors)[built], 6, axis = 1)
+    if np.issubdtype(listWithCubies.dtype["color"].base, np.integer):
+        colors = np.rint(np.clip(colors, 0.0, 1.0) * 255)
+    listWithCubies["color"][cubySlots[built], :36] = colors
+
+
+# Float vertices (see createRoundedCubies) -> vertices in any of the vertexFormats and the scale the shader multiplies the positions by (1.0 for float positions)
+# Integer positions: quarter turns only swap and negate coordinates, so they stay exact no matter how often the cube is turned, cubyIds: cuby id of every row (needed for the sticker ids if not every cuby has been built)
+def convertVertices(listWithCubies, vertexFormat, cubyIds = None):
+
+    dtype = vertexFormats[vertexFormat]
+    converted = np.zeros(listWithCubies.shape, dtype)
+
+    positionScale = 1.0
+    if np.issubdtype(dtype["position"].base, np.integer):
+        positionScale = float(np.abs(listWithCubies["position"]).max()) / np.iinfo(dtype["position"].base).max
+        converted["position"] = np.rint(listWithCubies["position"] / positionScale)
+    else:
+        converted["position"] = listWithCubies["position"]
+
+    if "color" in dtype.names:
+        if np.issubdtype(dtype["color"].base, np.integer):
+            converted["color"] = np.rint(np.clip(listWithCubies["color"], 0.0, 1.0) * 255)
+        else:
+            converted["color"] = listWithCubies["color"]
+    if "sticker" in dtype.names:
+        converted["sticker"] = stickerIds(np.arange(len(listWithCubies)) if cubyIds is None else cubyIds, listWithCubies.shape[1])
+
+    return converted, positionScale
+
+
+# Template mesh for instancing (see CubeBuffers.InstancedBufferManager) --> one rounded cuby around the origin, face: 0 to 5 for the colored faces (front, right, back, left, top, down), 6 for the rounded parts
+def createRoundedCubyMesh(feinKoernigkeit, cubyFaceWidth, cubyRoundedPartWidth):
+
+    positions = createRoundedCubyTemplate(feinKoernigkeit, cubyFaceWidth, cubyRoundedPartWidth)
+
+    mesh = np.empty(len(positions), [("position", np.float32, 3), ("face", np.float32)])
+    mesh["position"] = positions
+    mesh["face"] = 6
+    mesh["face"][:36] = np.arange(36) // 6
+
+    return mesh
+
+
+# One 4x4 matrix per cuby which moves the template mesh to the cuby's place, same order (and same keptCubies) as createRoundedCubies
+def createCubyMatrices(cubeType, cubyFaceWidth, cubyRoundedPartWidth, fTRC, keptCubies = None):
+
+    cubyIds = np.arange(cubeType**3) if keptCubies is None else np.flatnonzero(keptCubies)
+    cubyMatrices = np.tile(np.identity(4), (len(cubyIds), 1, 1))
+    cubyMatrices[:, :3, 3] = cubyPositions(cubeType, cubyFaceWidth, cubyRoundedPartWidth, fTRC)[cubyIds]
+
+    return cubyMatrices
+
+
+# Instanced counterpart of rotateCubies: the whole side turn goes into the cubies' matrices
+def rotateCubyMatrices(cubyMatrices, cubyIndexes, matrix):
+
+    cubyIndexes = np.ravel(cubyIndexes)
+    cubyMatrices[cubyIndexes] = matrix @ cubyMatrices[cubyIndexes]
+
+
+# Instanced counterpart of rotateCubiesIndividually (rotationMatrices: one 3x3 matrix per cuby)
+def rotateCubyMatricesIndividually(cubyMatrices, rotationMatrices):
+
+    cubyMatrices[:, :3, :] = rotationMatrices @ cubyMatrices[:, :3, :]
+
+
+# Triangles of the whole cube (feinKoernigkeit as in createRoundedCubies) --> all cubies, only the visible ones (what gets built with visibleCubies) and only the faces and rounded parts which can ever be seen
+def triangleCounts(cubeType, feinKoernigkeit):
+
+    trianglesPerCuby = (36 + (feinKoernigkeit*6)*12 + ((feinKoernigkeit**2)*3)*8) // 3
+    faces = visibleFaces(cubeType)
+    keptCubies = np.count_nonzero(np.any(faces, axis = -1))
+
+    return cubeType**3 * trianglesPerCuby, keptCubies * trianglesPerCuby, keptCubies * (trianglesPerCuby - 12) + 2 * np.count_nonzero(faces)
+
+
+# Side moves (keyboard letters) --> arguments of rotateCubeSide: side rotation matrix index (= axis), layer, axes and amountForth (which np.rot90 view of cubeOrder has the layer in front), invertAngle
+sideMoves = {
+    # Front, Back, Standing
+    "f": (0, 0, (0,1), 0, False),
+    "b": (0, 0, (0,1), 2, True),
+    "s": (0, 1, (0,1), 0, False),
+    # Right, Left, Middle
+    "r": (1, 0, (0,2), 1, False),
+    "l": (1, 0, (0,2), 3, True),
+    "m": (1, 1, (0,2), 3, True),
+    # Top, Down, Equator
+    "t": (2, 0, (0,1), 3, False),
+    "d": (2, 0, (0,1), 1, True),
+    "e": (2, 1, (0,1), 1, True),
+}
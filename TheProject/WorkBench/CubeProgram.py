@@ -0,0 +1,225 @@
+import numpy as np
+import OpenGL.GL as gl
+
+
+# Shader code shared by CubeWindow, Sandbox and CubeTesting
+    # Vertex shader
+        # uniform     --> mvpMatrix: ModelViewProjectionMatrix, computed once per frame on the CPU from the whole cube rotation angles (see CubeGeometry.modelViewProjectionMatrix)
+        #             --> turnMatrix: rotation of the side which is currently turning (identity for every other cuby)
+        #             --> positionScale: 1.0 for float positions, the scale of the integer positions of compact vertices (see CubeGeometry.vertexFormats)
+        # attribute   --> position: vertex's position
+        #             --> color: vertex's color
+        # varying     --> v_color: transmits the color to the fragment shader
+        # void main() --> main function which OpenGL executes
+                # 1) vertex calc with "4th" value (is there for the distance effect)
+                # 2) gl_position --> OpenGL's only input (vertex), left in clip space: the GPU divides by w itself and only then interpolates the varyings perspective correct
+                # 3) v_color -->  OpenGL's only input (color)
+vertexShaderCode = """
+    uniform mat4 mvpMatrix;
+    uniform mat4 turnMatrix;
+    uniform float positionScale;
+    attribute vec3 position;
+    attribute vec4 color;
+    varying vec4 v_color;
+    void main() {
+        vec4 temporary = mvpMatrix * turnMatrix * vec4(position * positionScale, 1.0);
+        gl_Position = temporary;
+        v_color = color;
+    }
+"""
+    # Fragment shader
+        # varying --> same variable as before
+        # void main() --> same
+            # 1) gl_FragColor --> OpenGL's only input (color final stage)
+fragmentShaderCode = """
+    varying vec4 v_color;
+    void main() {
+        gl_FragColor = v_color;
+    }
+"""
+
+# Every uniform and attribute the render path sets
+uniformNames = ("mvpMatrix", "turnMatrix", "positionScale")
+attributeNames = ("position", "color")
+
+# Sticker table version (vertex formats "palette" and "compactPalette", see CubeGeometry.vertexFormats): no color per vertex, only its sticker id
+    # attribute   --> sticker: row of the sticker table (see CubeGeometry.stickerIds), the same value for all 3 vertices of a triangle, so interpolating it changes nothing
+    # uniform     --> stickerTable: texture with one RGBA texel per sticker id, stored row by row (see CubeBuffers.StickerTable)
+    #             --> stickerTableSize: width and height of the texture in texels (the width is a power of 2, so the division is exact)
+paletteVertexShaderCode = """
+    uniform mat4 mvpMatrix;
+    uniform mat4 turnMatrix;
+    uniform float positionScale;
+    attribute vec3 position;
+    attribute float sticker;
+    varying float v_sticker;
+    void main() {
+        vec4 temporary = mvpMatrix * turnMatrix * vec4(position * positionScale, 1.0);
+        gl_Position = temporary;
+        v_sticker = sticker;
+    }
+"""
+paletteFragmentShaderCode = """
+    uniform sampler2D stickerTable;
+    uniform vec2 stickerTableSize;
+    varying float v_sticker;
+    void main() {
+        float sticker = floor(v_sticker + 0.5);
+        vec2 texel = vec2(mod(sticker, stickerTableSize.x), floor(sticker / stickerTableSize.x));
+        gl_FragColor = texture2D(stickerTable, (texel + 0.5) / stickerTableSize);
+    }
+"""
+paletteUniformNames = ("mvpMatrix", "turnMatrix", "positionScale", "stickerTable", "stickerTableSize")
+paletteAttributeNames = ("position", "sticker")
+
+# Sticker texture version for very big cubes (see CubeStickers): only the outside of the cube (and of the turning slab) as a few big boxes, the stickers get drawn by the fragment shader
+    # attribute   --> sticker: face (0 to 5, 6 for the black cut faces of a turning slab) and the position on the face in sticker widths (0 to cubeType)
+    # uniform     --> faceStates: palette index of every sticker, the 6 faces stacked on top of each other (see CubeBuffers.FaceStateTexture), cubeType: stickers per row
+    #             --> stickerTable, stickerTableSize: the color palette (see CubeBuffers.StickerTable)
+stickerShellVertexShaderCode = """
+    uniform mat4 mvpMatrix;
+    uniform mat4 turnMatrix;
+    attribute vec3 position;
+    attribute vec3 sticker;
+    varying vec3 v_sticker;
+    void main() {
+        vec4 temporary = mvpMatrix * turnMatrix * vec4(position, 1.0);
+        gl_Position = temporary;
+        v_sticker = sticker;
+    }
+"""
+    # Black border around every sticker, in sticker widths
+stickerShellFragmentShaderCode = """
+    uniform sampler2D faceStates;
+    uniform float cubeType;
+    uniform sampler2D stickerTable;
+    uniform vec2 stickerTableSize;
+    varying vec3 v_sticker;
+    void main() {
+        float face = floor(v_sticker.x + 0.5);
+        vec2 cell = clamp(floor(v_sticker.yz), 0.0, cubeType - 1.0);
+        vec2 inCell = v_sticker.yz - cell;
+        float index = 6.0;
+        if (face < 5.5 && min(inCell.x, inCell.y) > 0.07 && max(inCell.x, inCell.y) < 0.93) {
+            index = floor(texture2D(faceStates, (vec2(cell.x, cell.y + face * cubeType) + 0.5) / vec2(cubeType, 6.0 * cubeType)).r * 255.0 + 0.5);
+        }
+        gl_FragColor = texture2D(stickerTable, vec2(index + 0.5, 0.5) / stickerTableSize);
+    }
+"""
+stickerShellUniformNames = ("mvpMatrix", "turnMatrix", "faceStates", "cubeType", "stickerTable", "stickerTableSize")
+stickerShellAttributeNames = ("position", "sticker")
+
+# Instanced version (see CubeBuffers.InstancedBufferManager): every cuby is the same template mesh, moved into place by its own cubyMatrix
+    # attribute   --> face: which face a template vertex belongs to (0 to 5: colored faces, 6: black rounded parts)
+    #             --> cubyMatrix, faceColor0 to faceColor5, turning: per cuby (instance) values, turning is 1.0 for the cubies of the turning side
+instancedVertexShaderCode = """
+    uniform mat4 mvpMatrix;
+    uniform mat4 turnMatrix;
+    attribute vec3 position;
+    attribute float face;
+    attribute mat4 cubyMatrix;
+    attribute vec4 faceColor0;
+    attribute vec4 faceColor1;
+    attribute vec4 faceColor2;
+    attribute vec4 faceColor3;
+    attribute vec4 faceColor4;
+    attribute vec4 faceColor5;
+    attribute float turning;
+    varying vec4 v_color;
+    void main() {
+        mat4 turn = turning > 0.5 ? turnMatrix : mat4(1.0);
+        vec4 temporary = mvpMatrix * turn * cubyMatrix * vec4(position, 1.0);
+        gl_Position = temporary;
+        v_color = face < 0.5 ? faceColor0 : face < 1.5 ? faceColor1 : face < 2.5 ? faceColor2 :
+                  face < 3.5 ? faceColor3 : face < 4.5 ? faceColor4 : face < 5.5 ? faceColor5 : vec4(0.0, 0.0, 0.0, 1.0);
+    }
+"""
+instancedUniformNames = ("mvpMatrix", "turnMatrix")
+instancedAttributeNames = ("position", "face", "cubyMatrix", "faceColor0", "faceColor1", "faceColor2", "faceColor3", "faceColor4", "faceColor5", "turning")
+
+
+# Compiles and links the shader code into a program, raises a RuntimeError (after printing the log) if something goes wrong
+def compileProgram(vertexShaderCode, fragmentShaderCode):
+
+    program = gl.glCreateProgram()
+    vertexShader = gl.glCreateShader(gl.GL_VERTEX_SHADER)
+    fragmentShader = gl.glCreateShader(gl.GL_FRAGMENT_SHADER)
+
+    gl.glShaderSource(vertexShader, vertexShaderCode)
+    gl.glShaderSource(fragmentShader, fragmentShaderCode)
+
+    gl.glCompileShader(vertexShader)
+    if not gl.glGetShaderiv(vertexShader, gl.GL_COMPILE_STATUS):
+        error = gl.glGetShaderInfoLog(vertexShader).decode()
+        print(error)
+        raise RuntimeError("Vertex shader compilation error")
+
+    gl.glCompileShader(fragmentShader)
+    if not gl.glGetShaderiv(fragmentShader, gl.GL_COMPILE_STATUS):
+        error = gl.glGetShaderInfoLog(fragmentShader).decode()
+        print(error)
+        raise RuntimeError("Fragment shader compilation error")
+
+    gl.glAttachShader(program, vertexShader)
+    gl.glAttachShader(program, fragmentShader)
+
+    gl.glLinkProgram(program)
+    if not gl.glGetProgramiv(program, gl.GL_LINK_STATUS):
+        print(gl.glGetProgramInfoLog(program))
+        raise RuntimeError("Linking error")
+
+    # Detach and delete the shaders, the linked program doesn't need them anymore
+    gl.glDetachShader(program, vertexShader)
+    gl.glDetachShader(program, fragmentShader)
+    gl.glDeleteShader(vertexShader)
+    gl.glDeleteShader(fragmentShader)
+
+    return program
+
+
+# Linked program plus the locations of all its uniforms and attributes, resolved once right after linking so the render path never has to ask OpenGL for them again
+class ProgramDescriptor():
+
+    def __init__(self, vertexShaderCode = vertexShaderCode, fragmentShaderCode = fragmentShaderCode, uniformNames = uniformNames, attributeNames = attributeNames):
+
+        self.program = compileProgram(vertexShaderCode, fragmentShaderCode)
+
+        # name -> location (-1 if the shader doesn't use it, OpenGL silently ignores uploads to -1)
+        self.uniforms = {name: gl.glGetUniformLocation(self.program, name) for name in uniformNames}
+        self.attributes = {name: gl.glGetAttribLocation(self.program, name) for name in attributeNames}
+
+        # Prevents deleting the program twice
+        self.released = False
+
+
+    # Upload a 4x4 matrix (numpy convention: matrix @ vertex) to a mat4 uniform, OpenGL expects it column by column
+    def setMatrix(self, name, matrix):
+
+        gl.glUniformMatrix4fv(self.uniforms[name], 1, gl.GL_FALSE, np.ascontiguousarray(matrix.T, dtype = np.float32))
+
+
+    # Declare the program as the one being used
+    def use(self):
+
+        gl.glUseProgram(self.program)
+
+
+    # Needs a current context, called on teardown
+    def release(self):
+
+        if self.released:
+            return
+
+        gl.glUseProgram(0)
+        gl.glDeleteProgram(self.program)
+
+        self.released = True
+
+
+# Program for vertices of the given dtype (see CubeGeometry.vertexFormats): the sticker table one if the vertices have sticker ids instead of colors
+def programDescriptorFor(vertexDtype):
+
+    if "sticker" in vertexDtype.names:
+        return ProgramDescriptor(paletteVertexShaderCode, paletteFragmentShaderCode, paletteUniformNames, paletteAttributeNames)
+
+    return ProgramDescriptor()
@@ -0,0 +1,354 @@
+import os
+import time
+import functools
+import itertools
+import threading
+import numpy as np
+import CubeState
+import GeometryCache
+
+
+# Two-phase solver (Kociemba's algorithm) for CubeState.CubeState
+# Phase 1 brings the cube into the group generated by U, D, R2, L2, F2, B2 (no twisted corners, no flipped edges, the 4 middle layer edges in the middle layer), phase 2 solves it with those moves only
+# Both phases are IDA* searches over small coordinates of the cube, guided by pruning tables (exact distance to the goal for a pair of coordinates)
+# The move and pruning tables are built with numpy the first time they are needed (some seconds) and stored on disk through GeometryCache, afterwards they only get loaded
+
+
+# Has to be increased whenever the tables change, older files are never loaded again
+tableVersion = 1
+# Next to the geometry cache
+tableCache = GeometryCache.GeometryCache(os.path.join(os.path.dirname(GeometryCache.defaultDirectory), "solver"))
+
+# The 18 face moves solutions are made of (names of CubeState.moveNames): move // 3 is the face (U R F D L B, opposite faces 3 apart), move % 3 + 1 its quarter turns
+faceMoves = tuple(face + suffix for face in CubeState.faceNames for suffix in CubeState.quarterTurnSuffixes)
+# Moves of phase 2 (indexes of faceMoves)
+phase2Moves = tuple(faceMoves.index(name) for name in ("U", "U2", "U'", "R2", "F2", "D", "D2", "D'", "L2", "B2"))
+
+# Slice edges: FR, FL, BL, BR (see CubeState.edgeNames)
+sliceEdges = (8, 9, 10, 11)
+# Every way the 4 slice edges can be placed (their places), the index is the slice coordinate
+slicePlaces = np.array(list(itertools.combinations(range(12), 4)))
+sliceCoordinates = np.full(2**12, -1)
+sliceCoordinates[np.sum(1 << slicePlaces, axis = 1)] = np.arange(len(slicePlaces))
+
+twistCount, flipCount, sliceCount = 3**7, 2**11, len(slicePlaces)
+cornerCount, udEdgeCount, slicePermutationCount = 40320, 40320, 24
+
+
+# Coordinates: numpy functions on many cubes at once (one row per cube)
+
+# Orientations (N, n) --> coordinate (base digits of all but the last orientation, which follows from the others)
+def orientationCoordinate(orientations, base):
+
+    coordinates = np.zeros(len(orientations), dtype = np.int64)
+    for column in np.asarray(orientations, dtype = np.int64).T[:-1]:
+        coordinates = coordinates * base + column
+
+    return coordinates
+
+
+def orientationsFromCoordinate(coordinates, count, base):
+
+    orientations = np.zeros((len(coordinates), count), dtype = np.int64)
+    for place in range(count - 2, -1, -1):
+        coordinates, orientations[:, place] = np.divmod(coordinates, base)
+    orientations[:, -1] = -orientations[:, :-1].sum(axis = 1) % base
+
+    return orientations
+
+
+# Permutations (N, n) --> rank in lexicographic order (the order of itertools.permutations)
+def permutationCoordinate(permutations):
+
+    permutations = np.asarray(permutations, dtype = np.int64)
+    length = permutations.shape[1]
+    coordinates = np.zeros(len(permutations), dtype = np.int64)
+    for place in range(length):
+        coordinates = coordinates * (length - place) + np.sum(permutations[:, place + 1:] < permutations[:, place:place + 1], axis = 1)
+
+    return coordinates
+
+
+# Edge permutations (N, 12) --> where the slice edges are, no matter in which order
+def sliceCoordinate(edgePermutations):
+
+    return sliceCoordinates[np.sum((np.asarray(edgePermutations) >= sliceEdges[0]) << np.arange(12), axis = 1)]
+
+
+solvedSlice = int(sliceCoordinate(np.arange(12)[None])[0])
+
+
+# Move tables: coordinate after every move (coordinate, move) --> built by applying the moves to every cube a coordinate stands for at once
+
+# Corner and edge arrays of every face move (see CubeState.moves)
+def faceMoveArrays():
+
+    states = [CubeState.moves[name] for name in faceMoves]
+
+    return ([state.cornerPermutation.astype(np.intp) for state in states], [state.cornerOrientation.astype(np.int64) for state in states],
+            [state.edgePermutation.astype(np.intp) for state in states], [state.edgeOrientation.astype(np.int64) for state in states])
+
+
+def createTwistMoves():
+
+    cornerPermutations, cornerOrientations, _, _ = faceMoveArrays()
+    twists = orientationsFromCoordinate(np.arange(twistCount), 8, 3)
+
+    return np.stack([orientationCoordinate((twists[:, permutation] + orientation) % 3, 3) for permutation, orientation in zip(cornerPermutations, cornerOrientations)], axis = 1).astype(np.int16)
+
+
+def createFlipMoves():
+
+    _, _, edgePermutations, edgeOrientations = faceMoveArrays()
+    flips = orientationsFromCoordinate(np.arange(flipCount), 12, 2)
+
+    return np.stack([orientationCoordinate((flips[:, permutation] + orientation) % 2, 2) for permutation, orientation in zip(edgePermutations, edgeOrientations)], axis = 1).astype(np.int16)
+
+
+def createSliceMoves():
+
+    _, _, edgePermutations, _ = faceMoveArrays()
+    # One edge permutation per slice coordinate: the slice edges at their places, the other edges in the remaining ones
+    inSlice = np.zeros((sliceCount, 12), dtype = bool)
+    inSlice[np.arange(sliceCount)[:, None], slicePlaces] = True
+    edges = np.empty((sliceCount, 12), dtype = np.int64)
+    edges[inSlice] = np.tile(sliceEdges, sliceCount)
+    edges[~inSlice] = np.tile(np.arange(8), sliceCount)
+
+    return np.stack([sliceCoordinate(edges[:, permutation]) for permutation in edgePermutations], axis = 1).astype(np.int16)
+
+
+def createCornerMoves():
+
+    cornerPermutations, _, _, _ = faceMoveArrays()
+    corners = np.array(list(itertools.permutations(range(8))))
+
+    return np.stack([permutationCoordinate(corners[:, permutation]) for permutation in cornerPermutations], axis = 1).astype(np.int32)
+
+
+# Phase 2 only (one column per phase2Moves): the U and D layer edges never leave them there
+def createUdEdgeMoves():
+
+    _, _, edgePermutations, _ = faceMoveArrays()
+    edges = np.hstack((np.array(list(itertools.permutations(range(8)))), np.tile(sliceEdges, (udEdgeCount, 1))))
+
+    return np.stack([permutationCoordinate(edges[:, edgePermutations[move]][:, :8]) for move in phase2Moves], axis = 1).astype(np.int32)
+
+
+def createSlicePermutationMoves():
+
+    _, _, edgePermutations, _ = faceMoveArrays()
+    edges = np.hstack((np.tile(np.arange(8), (slicePermutationCount, 1)), np.array(list(itertools.permutations(sliceEdges)))))
+
+    return np.stack([permutationCoordinate(edges[:, edgePermutations[move]][:, 8:]) for move in phase2Moves], axis = 1).astype(np.int8)
+
+
+# Pruning table: distance (in moves) of every pair of coordinates (first * secondCount + second) to the solved pair, found by a breadth first search over all of them at once
+def createPruningTable(firstMoves, secondMoves, solved):
+
+    secondCount = len(secondMoves)
+    firstMoves, secondMoves = firstMoves.astype(np.int64), secondMoves.astype(np.int64)
+    distances = np.full(len(firstMoves) * secondCount, 255, dtype = np.uint8)
+    distances[solved] = 0
+
+    frontier, distance = np.array([solved]), 0
+    while len(frontier):
+        first, second = np.divmod(frontier, secondCount)
+        neighbours = (firstMoves[first] * secondCount + secondMoves[second]).ravel()
+        neighbours = np.unique(neighbours[distances[neighbours] == 255])
+        distance += 1
+        distances[neighbours] = distance
+        frontier = neighbours
+
+    return distances
+
+
+# All the tables, as python lists and bytes (much faster to index one element at a time than numpy arrays)
+class SolverTables():
+
+    def __init__(self):
+
+        def fetch(name, builder):
+            return tableCache.fetch(name, builder, version = tableVersion)
+
+        twistMoves = fetch("twistMoves", createTwistMoves)
+        flipMoves = fetch("flipMoves", createFlipMoves)
+        sliceMoves = fetch("sliceMoves", createSliceMoves)
+        cornerMoves = fetch("cornerMoves", createCornerMoves)
+        udEdgeMoves = fetch("udEdgeMoves", createUdEdgeMoves)
+        slicePermutationMoves = fetch("slicePermutationMoves", createSlicePermutationMoves)
+
+        phase2CornerMoves = cornerMoves[:, list(phase2Moves)]
+        self.twistSlicePruning = bytes(fetch("twistSlicePruning", lambda: createPruningTable(twistMoves, sliceMoves, solvedSlice)))
+        self.flipSlicePruning = bytes(fetch("flipSlicePruning", lambda: createPruningTable(flipMoves, sliceMoves, solvedSlice)))
+        self.cornerSlicePruning = bytes(fetch("cornerSlicePruning", lambda: createPruningTable(phase2CornerMoves, slicePermutationMoves, 0)))
+        self.udEdgeSlicePruning = bytes(fetch("udEdgeSlicePruning", lambda: createPruningTable(udEdgeMoves, slicePermutationMoves, 0)))
+
+        self.twistMoves, self.flipMoves, self.sliceMoves = twistMoves.tolist(), flipMoves.tolist(), sliceMoves.tolist()
+        self.cornerMoves, self.udEdgeMoves, self.slicePermutationMoves = phase2CornerMoves.tolist(), udEdgeMoves.tolist(), slicePermutationMoves.tolist()
+
+
+tables = None
+tablesLock = threading.Lock()
+
+
+# The tables, loaded (or built) only once even if several threads solve at the same time (CubeWindow solves in a background thread, see CubeWindow.Cube.startSolving)
+def loadTables():
+
+    global tables
+    with tablesLock:
+        if tables is None:
+            tables = SolverTables()
+
+    return tables
+
+
+# Whole cube rotations
+
+# Inverse of a list of move names
+def invertMoves(names):
+
+    return [base + CubeState.quarterTurnSuffixes[(-quarterTurns) % 4 - 1] for base, quarterTurns in map(CubeState.splitMoveName, reversed(names))]
+
+
+# The 24 orientations of the cube --> list of (rotation as move names, state of the rotation)
+@functools.lru_cache(maxsize = None)
+def wholeCubeRotations():
+
+    rotations = [([], CubeState.CubeState())]
+    seen = {tuple(rotations[0][1].centers)}
+    for names, _ in rotations:
+        for rotation in ("x", "y"):
+            state = CubeState.composeMoves(names + [rotation])
+            if tuple(state.centers) not in seen:
+                seen.add(tuple(state.centers))
+                rotations.append((names + [rotation], state))
+
+    return rotations
+
+
+# Rotation (move names) which brings the centers of cubeState back to where they belong, and what every face move becomes when done before that rotation (move --> rotation move rotation')
+def centerRotation(cubeState):
+
+    for names, rotation in wholeCubeRotations():
+        if np.array_equal(cubeState.centers[rotation.centers], np.arange(6)):
+            conjugated = {}
+            for move in faceMoves:
+                permutation = CubeState.composeFaceletPermutation(names + [move] + invertMoves(names))
+                conjugated[move] = next(other for other in faceMoves if np.array_equal(CubeState.faceletMoveTable[CubeState.moveIndexes[other]], permutation))
+            return names, conjugated
+
+    raise ValueError("Centers of no real cube: " + str(cubeState.centers))
+
+
+# Python rank of a permutation of 0..n-1 (same as permutationCoordinate, for one permutation)
+def permutationRank(permutation):
+
+    rank = 0
+    for place, value in enumerate(permutation):
+        rank = rank * (len(permutation) - place) + sum(other < value for other in permutation[place + 1:])
+
+    return rank
+
+
+# Solution for cubeState (face moves only, names of CubeState.moveNames) with at most maxLength moves --> None if there is none, or if timeout (seconds) ran out before one was found
+# The cube may be turned as a whole (slice moves, rotations): the solution then solves it in that orientation
+def solve(cubeState, maxLength = 22, timeout = 5.0):
+
+    tables = loadTables()
+    deadline = None if timeout is None else time.perf_counter() + timeout
+
+    rotation, conjugated = centerRotation(cubeState)
+    state = cubeState.copy()
+    if rotation:
+        state.applySequence(rotation)
+
+    twistMoves, flipMoves, sliceMoves = tables.twistMoves, tables.flipMoves, tables.sliceMoves
+    cornerMoves, udEdgeMoves, slicePermutationMoves = tables.cornerMoves, tables.udEdgeMoves, tables.slicePermutationMoves
+    twistSlicePruning, flipSlicePruning = tables.twistSlicePruning, tables.flipSlicePruning
+    cornerSlicePruning, udEdgeSlicePruning = tables.cornerSlicePruning, tables.udEdgeSlicePruning
+    edgePermutations = [CubeState.moves[name].edgePermutation.tolist() for name in faceMoves]
+    cornerPermutations = [CubeState.moves[name].cornerPermutation.tolist() for name in faceMoves]
+    # Phase 1 moves which are phase 2 moves as well can't end phase 1 (phase 1 would have been over one move earlier)
+    endsPhase1 = [move not in phase2Moves for move in range(18)]
+
+    # Moves (with their face) worth trying after a move on lastFace (6: no move yet): the same face twice, or opposite faces in both orders, would only repeat other branches
+    followingMoves = [[(move, move // 3) for move in range(18) if move // 3 not in (lastFace, lastFace - 3)] for lastFace in range(6)] + [[(move, move // 3) for move in range(18)]]
+    followingPhase2Moves = [[(column, move, move // 3) for column, move in enumerate(phase2Moves) if move // 3 not in (lastFace, lastFace - 3)] for lastFace in range(6)] + [[(column, move, move // 3) for column, move in enumerate(phase2Moves)]]
+
+    phase1Moves, phase2MovesDone = [], []
+
+    # Depth first search for the rest of phase 2 with exactly remaining moves
+    def searchPhase2(corner, udEdge, slicePermutation, remaining, lastFace):
+
+        if remaining == 0:
+            return corner == 0 and udEdge == 0 and slicePermutation == 0
+        cornerRow, udEdgeRow, slicePermutationRow = cornerMoves[corner], udEdgeMoves[udEdge], slicePermutationMoves[slicePermutation]
+        for column, move, face in followingPhase2Moves[lastFace]:
+            nextCorner, nextSlicePermutation = cornerRow[column], slicePermutationRow[column]
+            if cornerSlicePruning[nextCorner*slicePermutationCount + nextSlicePermutation] >= remaining:
+                continue
+            nextUdEdge = udEdgeRow[column]
+            if udEdgeSlicePruning[nextUdEdge*slicePermutationCount + nextSlicePermutation] >= remaining:
+                continue
+            phase2MovesDone.append(move)
+            if searchPhase2(nextCorner, nextUdEdge, nextSlicePermutation, remaining - 1, face):
+                return True
+            phase2MovesDone.pop()
+
+        return False
+
+    # Phase 1 is over: phase 2 with the moves which are left
+    def startPhase2():
+
+        if phase1Moves and not endsPhase1[phase1Moves[-1]]:
+            return False
+        corners, edges = state.cornerPermutation.tolist(), state.edgePermutation.tolist()
+        for move in phase1Moves:
+            corners = [corners[place] for place in cornerPermutations[move]]
+            edges = [edges[place] for place in edgePermutations[move]]
+        corner, udEdge, slicePermutation = permutationRank(corners), permutationRank(edges[:8]), permutationRank([edge - 8 for edge in edges[8:]])
+
+        lastFace = phase1Moves[-1] // 3 if phase1Moves else 6
+        distance = max(cornerSlicePruning[corner*slicePermutationCount + slicePermutation], udEdgeSlicePruning[udEdge*slicePermutationCount + slicePermutation])
+        for depth in range(distance, maxLength - len(phase1Moves) + 1):
+            if searchPhase2(corner, udEdge, slicePermutation, depth, lastFace):
+                return True
+
+        if deadline is not None and time.perf_counter() > deadline:
+            raise TimeoutError
+
+        return False
+
+    # Depth first search for the rest of phase 1 with exactly remaining moves
+    def searchPhase1(twist, flip, udSlice, remaining, lastFace):
+
+        if remaining == 0:
+            return startPhase2()
+        twistRow, flipRow, sliceRow = twistMoves[twist], flipMoves[flip], sliceMoves[udSlice]
+        for move, face in followingMoves[lastFace]:
+            nextTwist, nextUdSlice = twistRow[move], sliceRow[move]
+            if twistSlicePruning[nextTwist*sliceCount + nextUdSlice] >= remaining:
+                continue
+            nextFlip = flipRow[move]
+            if flipSlicePruning[nextFlip*sliceCount + nextUdSlice] >= remaining:
+                continue
+            phase1Moves.append(move)
+            if searchPhase1(nextTwist, nextFlip, nextUdSlice, remaining - 1, face):
+                return True
+            phase1Moves.pop()
+
+        return False
+
+    twist = int(orientationCoordinate(state.cornerOrientation[None], 3)[0])
+    flip = int(orientationCoordinate(state.edgeOrientation[None], 2)[0])
+    udSlice = int(sliceCoordinate(state.edgePermutation[None])[0])
+    distance = max(twistSlicePruning[twist*sliceCount + udSlice], flipSlicePruning[flip*sliceCount + udSlice])
+    try:
+        for depth in range(distance, maxLength + 1):
+            if searchPhase1(twist, flip, udSlice, depth, 6):
+                return [conjugated[faceMoves[move]] for move in phase1Moves + phase2MovesDone]
+    except TimeoutError:
+        pass
+
+    return None
@@ -0,0 +1,311 @@
+import numpy as np
+import CubeGeometry
+import CubeStickers
+
+
+# Logical state of a 3x3x3 without any geometry or OpenGL: which corner and edge cuby sits where and how it is twisted (the usual cubie view), plus which center is on which face (slice moves move them)
+# The 54 facelets are derived from it in the usual U R F D L B order, every face read row by row seen from outside (U with B on top, D with F on top, the side faces with U on top)
+# Corners and edges, their facelets and their orientations follow Kociemba's conventions, so the state can be handed to a solver as it is
+
+
+faceNames = "URFDLB"
+
+# Outward normal, direction of the columns and direction of the rows of every face (x: right, y: up, z: towards the front, like CubeGeometry.faceNormals)
+faceFrames = np.array([
+    ((0,1,0), (1,0,0), (0,0,1)),        # U
+    ((1,0,0), (0,0,-1), (0,-1,0)),      # R
+    ((0,0,1), (1,0,0), (0,-1,0)),       # F
+    ((0,-1,0), (1,0,0), (0,0,-1)),      # D
+    ((-1,0,0), (0,0,1), (0,-1,0)),      # L
+    ((0,0,-1), (-1,0,0), (0,-1,0)),     # B
+])
+
+
+# Facelet name (face letter and 1 to 9, e.g. "U9") --> index in the 54 facelets
+def faceletIndex(name):
+
+    return 9*faceNames.index(name[0]) + int(name[1]) - 1
+
+
+cornerNames = ("URF", "UFL", "ULB", "UBR", "DFR", "DLF", "DBL", "DRB")
+edgeNames = ("UR", "UF", "UL", "UB", "DR", "DF", "DL", "DB", "FR", "FL", "BL", "BR")
+
+# Facelets of every corner and edge place, the U or D facelet (F or B for the middle layer edges) first, corners clockwise
+cornerFacelets = np.array([[faceletIndex(name) for name in corner.split()] for corner in (
+    "U9 R1 F3", "U7 F1 L3", "U1 L1 B3", "U3 B1 R3", "D3 F9 R7", "D1 L9 F7", "D7 B9 L7", "D9 R9 B7")])
+edgeFacelets = np.array([[faceletIndex(name) for name in edge.split()] for edge in (
+    "U6 R2", "U8 F2", "U4 L2", "U2 B2", "D6 R8", "D2 F8", "D4 L8", "D8 B8", "F6 R4", "F4 L6", "B6 L4", "B4 R6")])
+centerFacelets = np.arange(6) * 9 + 4
+
+# Colors (face index) of every solved corner's and edge's facelets
+cornerColors = cornerFacelets // 9
+edgeColors = edgeFacelets // 9
+
+# Cuby every facelet belongs to (-1 to 1 along every axis) and its outward normal
+faceletFaces, faceletRows, faceletColumns = np.divmod(np.arange(54), 9)[0], *np.divmod(np.arange(54) % 9, 3)
+faceletNormals = faceFrames[faceletFaces, 0]
+faceletCubies = faceletNormals + faceFrames[faceletFaces, 1] * (faceletColumns - 1)[:, None] + faceFrames[faceletFaces, 2] * (faceletRows - 1)[:, None]
+
+# Keyboard letters of CubeWindow.Cube.keyboard --> move names (CubeGeometry.sideMoves turns every side the usual way: clockwise seen from that side, slices like the side named)
+keyboardMoves = {"f": "F", "b": "B", "t": "U", "d": "D", "r": "R", "l": "L", "m": "M", "e": "E", "s": "S"}
+
+
+# Where the facelets go on the given side move of CubeGeometry.sideMoves (one quarter turn) --> permutation: facelets after the move = facelets before it[permutation]
+def sideMoveFaceletPermutation(sideMove):
+
+    sideRotationMatricesArrayIndex, layer, axes, amountForth, invertAngle = CubeGeometry.sideMoves[sideMove]
+    axis, slab = CubeStickers.turnedSlab(3, layer, axes, amountForth)
+    matrix = np.rint(CubeGeometry.quarterTurnMatrix(sideRotationMatricesArrayIndex, -1 if invertAngle else 1)[:3,:3]).astype(int)
+
+    # Facelet positions in half cuby widths (integers, so the turn stays exact)
+    positions = 2*faceletCubies + faceletNormals
+    turning = faceletCubies[:, axis] + 1 == slab
+    turnedPositions = positions.copy()
+    turnedPositions[turning] = positions[turning] @ matrix.T
+
+    places = {tuple(position): facelet for facelet, position in enumerate(positions)}
+    permutation = np.empty(54, dtype = int)
+    permutation[[places[tuple(position)] for position in turnedPositions]] = np.arange(54)
+
+    return permutation
+
+
+class CubeState():
+
+    # Solved cube if nothing is given, otherwise permutation (which corner/edge/center is at every place) and orientation (how it is twisted/flipped there) of corners and edges
+    def __init__(self, cornerPermutation = range(8), cornerOrientation = (0,)*8, edgePermutation = range(12), edgeOrientation = (0,)*12, centers = range(6)):
+
+        self.cornerPermutation = np.array(cornerPermutation, dtype = np.uint8)
+        self.cornerOrientation = np.array(cornerOrientation, dtype = np.uint8)
+        self.edgePermutation = np.array(edgePermutation, dtype = np.uint8)
+        self.edgeOrientation = np.array(edgeOrientation, dtype = np.uint8)
+        self.centers = np.array(centers, dtype = np.uint8)
+
+
+    # State of a cube whose facelets are labeled: labels[i] is the solved facelet now at facelet i (only works for labels a real move sequence can produce)
+    @classmethod
+    def fromFaceletLabels(cls, labels):
+
+        labels = np.asarray(labels)
+        # Solved facelet --> the corner/edge it belongs to and which of its facelets it is
+        corners, cornerIndexes = np.full(54, -1), np.full(54, -1)
+        corners[cornerFacelets], cornerIndexes[cornerFacelets] = np.arange(8)[:, None], np.arange(3)
+        edges, edgeIndexes = np.full(54, -1), np.full(54, -1)
+        edges[edgeFacelets], edgeIndexes[edgeFacelets] = np.arange(12)[:, None], np.arange(2)
+
+        cornerLabels, edgeLabels = labels[cornerFacelets], labels[edgeFacelets]
+        # Orientation: which facelet of the place shows the corner's/edge's first facelet
+        return cls(corners[cornerLabels[:, 0]], np.argmax(cornerIndexes[cornerLabels] == 0, axis = 1),
+                   edges[edgeLabels[:, 0]], np.argmax(edgeIndexes[edgeLabels] == 0, axis = 1),
+                   labels[centerFacelets] // 9)
+
+
+    # State of a cube given by the color (face index, see faceNames) of its 54 facelets, e.g. CubeState.facelets() --> ValueError if some corner or edge doesn't exist
+    @classmethod
+    def fromFacelets(cls, facelets):
+
+        facelets = np.asarray(facelets)
+        cornerPermutation, cornerOrientation = np.zeros(8, dtype = int), np.zeros(8, dtype = int)
+        for place in range(8):
+            colors = facelets[cornerFacelets[place]]
+            # The U or D color marks the corner's first facelet
+            upOrDown = np.flatnonzero((colors == 0) | (colors == 3))
+            matches = np.flatnonzero(np.all(cornerColors == np.roll(colors, -upOrDown[0]), axis = 1)) if len(upOrDown) == 1 else []
+            if len(matches) != 1:
+                raise ValueError("No corner has the colors " + str(colors))
+            cornerPermutation[place], cornerOrientation[place] = matches[0], upOrDown[0]
+
+        edgePermutation, edgeOrientation = np.zeros(12, dtype = int), np.zeros(12, dtype = int)
+        for place in range(12):
+            colors = facelets[edgeFacelets[place]]
+            for orientation in (0, 1):
+                matches = np.flatnonzero(np.all(edgeColors == np.roll(colors, -orientation), axis = 1))
+                if len(matches):
+                    edgePermutation[place], edgeOrientation[place] = matches[0], orientation
+                    break
+            else:
+                raise ValueError("No edge has the colors " + str(colors))
+
+        return cls(cornerPermutation, cornerOrientation, edgePermutation, edgeOrientation, facelets[centerFacelets])
+
+
+    def copy(self):
+
+        return CubeState(self.cornerPermutation, self.cornerOrientation, self.edgePermutation, self.edgeOrientation, self.centers)
+
+
+    # Applies move (another CubeState, e.g. from moves) after everything done so far, in place: one gather per array
+    def multiply(self, move):
+
+        self.cornerOrientation = (self.cornerOrientation[move.cornerPermutation] + move.cornerOrientation) % 3
+        self.cornerPermutation = self.cornerPermutation[move.cornerPermutation]
+        self.edgeOrientation = self.edgeOrientation[move.edgePermutation] ^ move.edgeOrientation
+        self.edgePermutation = self.edgePermutation[move.edgePermutation]
+        self.centers = self.centers[move.centers]
+
+        return self
+
+
+    # Applies a move by name (see moveNames) or keyboard letter (see keyboardMoves), quarterTurns times --> a single multiply, whatever the quarter turns
+    def apply(self, move, quarterTurns = 1):
+
+        index = moveIndex(move, quarterTurns)
+        if index is not None:
+            self.multiply(moveStates[index])
+
+        return self
+
+
+    # Applies moves (names, keyboard letters or [move, quarterTurns] pairs) one after the other --> composed on the facelets first (see composeMoves), so the state itself only gets multiplied once
+    def applySequence(self, sequence):
+
+        return self.multiply(composeMoves(sequence))
+
+
+    # Color (face index, see faceNames) of all 54 facelets (see the top of this file for their order)
+    def facelets(self):
+
+        facelets = np.empty(54, dtype = np.uint8)
+        facelets[centerFacelets] = self.centers
+        facelets[cornerFacelets[np.arange(8)[:, None], (np.arange(3) + self.cornerOrientation[:, None]) % 3]] = cornerColors[self.cornerPermutation]
+        facelets[edgeFacelets[np.arange(12)[:, None], (np.arange(2) + self.edgeOrientation[:, None]) % 2]] = edgeColors[self.edgePermutation]
+
+        return facelets
+
+
+    # Facelets as letters, e.g. "UUUUUUUUURRRRRRRRRFFF..." when solved
+    def faceletString(self):
+
+        return "".join(faceNames[color] for color in self.facelets())
+
+
+    # Colors (face indexes) of one face (name or index) --> 3x3, rows and columns as described at the top of this file
+    def face(self, face):
+
+        face = faceNames.index(face) if isinstance(face, str) else face
+
+        return self.facelets()[9*face:9*face + 9].reshape(3, 3)
+
+
+    # Whether every face has one color (no matter where the centers went)
+    def isSolved(self):
+
+        facelets = self.facelets().reshape(6, 9)
+
+        return bool(np.all(facelets == facelets[:, :1]))
+
+
+    def __eq__(self, other):
+
+        return isinstance(other, CubeState) and all(np.array_equal(getattr(self, name), getattr(other, name))
+                                                    for name in ("cornerPermutation", "cornerOrientation", "edgePermutation", "edgeOrientation", "centers"))
+
+
+    def __repr__(self):
+
+        return "CubeState(" + self.faceletString() + ")"
+
+
+# Whole cube rotations as the side and slice moves they consist of (x turns like R, y like U, z like F)
+rotationMoves = {"x": ("R", "M'", "L'"), "y": ("U", "E'", "D'"), "z": ("F", "S", "B'")}
+baseMoves = tuple(keyboardMoves.values()) + tuple(rotationMoves)
+quarterTurnSuffixes = ("", "2", "'")
+
+
+# Move name --> base move (see baseMoves) and quarter turns (1: "R", 2: "R2", 3: "R'"), keyboard letters (see keyboardMoves) count as their move
+def splitMoveName(name):
+
+    name = keyboardMoves.get(name, name)
+    base = name.rstrip("2'")
+    suffix = name[len(base):]
+    if base not in baseMoves or suffix not in quarterTurnSuffixes:
+        raise ValueError("Unknown move: " + str(name))
+
+    return base, quarterTurnSuffixes.index(suffix) + 1
+
+
+# Row of move (name or keyboard letter) turned quarterTurns times in the move tables (see moveNames), None if that's no turn at all
+def moveIndex(move, quarterTurns = 1):
+
+    if quarterTurns == 1 and move in moveIndexes:
+        return moveIndexes[move]
+
+    base, moveQuarterTurns = splitMoveName(move)
+    quarterTurns = moveQuarterTurns * quarterTurns % 4
+    if quarterTurns == 0:
+        return None
+
+    return 3*baseMoves.index(base) + quarterTurns - 1
+
+
+# Rows of all the moves (names, keyboard letters or [move, quarterTurns] pairs) of a sequence in the move tables, moves which cancel themselves (e.g. ["R", 4]) are left out
+def sequenceIndexes(sequence):
+
+    indexes = []
+    for move in sequence:
+        move, quarterTurns = (move, 1) if isinstance(move, str) else move
+        index = moveIndex(move, quarterTurns)
+        if index is not None:
+            indexes.append(index)
+
+    return indexes
+
+
+# All the moves the tables below have a row for: every base move once, twice and three times (e.g. "R", "R2", "R'")
+moveNames = tuple(base + suffix for base in baseMoves for suffix in quarterTurnSuffixes)
+# Move name or keyboard letter --> row
+moveIndexes = {name: index for index, name in enumerate(moveNames)}
+moveIndexes.update({letter: moveIndexes[name] for letter, name in keyboardMoves.items()})
+
+
+# Facelet permutation of every move (facelets after the move = facelets before it[permutation]), the side and slice moves read off the same side moves CubeWindow turns its cubies with
+def createFaceletMoveTable():
+
+    quarterTurns = {name: sideMoveFaceletPermutation(sideMove) for sideMove, name in keyboardMoves.items()}
+
+    # First this move, then the other one
+    def then(permutation, otherPermutation):
+        return permutation[otherPermutation]
+
+    def turned(permutation, amount):
+        result = np.arange(54)
+        for _ in range(amount):
+            result = then(result, permutation)
+        return result
+
+    for rotation, parts in rotationMoves.items():
+        quarterTurns[rotation] = np.arange(54)
+        for part in parts:
+            base, amount = splitMoveName(part)
+            quarterTurns[rotation] = then(quarterTurns[rotation], turned(quarterTurns[base], amount))
+
+    return np.array([turned(quarterTurns[base], amount) for base in baseMoves for amount in (1, 2, 3)], dtype = np.intp)
+
+
+faceletMoveTable = createFaceletMoveTable()
+# Every move as the state it turns a solved cube into (same rows as faceletMoveTable)
+moveStates = [CubeState.fromFaceletLabels(permutation) for permutation in faceletMoveTable]
+moves = dict(zip(moveNames, moveStates))
+
+
+# The whole sequence (names, keyboard letters or [move, quarterTurns] pairs) as one facelet permutation --> applying it is a single gather, however long the sequence is
+def composeFaceletPermutation(sequence):
+
+    # Neighbours get composed pairwise, all pairs with one gather, until one permutation is left (log2 of the sequence's length gathers)
+    indexes = sequenceIndexes(sequence)
+    if not indexes:
+        return np.arange(54)
+
+    permutations = faceletMoveTable[indexes]
+    while len(permutations) > 1:
+        if len(permutations) % 2:
+            permutations = np.vstack((permutations, np.arange(54)))
+        permutations = np.take_along_axis(permutations[0::2], permutations[1::2], axis = 1)
+
+    return permutations[0]
+
+
+# The whole sequence as the state it turns a solved cube into, for CubeState.multiply
+def composeMoves(sequence):
+
+    return CubeState.fromFaceletLabels(composeFaceletPermutation(sequence))
@@ -0,0 +1,121 @@
+import numpy as np
+import CubeGeometry
+
+
+# Sticker texture mode for very big cubes (e.g. 100x100): instead of one mesh per cuby, the cube is six faces of stickers (palette indexes) which the shader reads from a texture (see CubeBuffers.FaceStateTexture)
+# The geometry is only the outside of at most 3 boxes: the whole cube, or while a layer turns the slab in front of it, the turning slab and the slab behind it
+
+
+# Two directions along every face (same order as CubeGeometry.faceNormals) --> u (columns) and v (rows) of the face's stickers, u x v is the outward normal, so the face quads wind counter clockwise seen from outside
+faceTangents = np.array([
+    ((1,0,0), (0,1,0)),     # Front
+    ((0,0,-1), (0,1,0)),    # Right
+    ((-1,0,0), (0,1,0)),    # Back
+    ((0,0,1), (0,1,0)),     # Left
+    ((1,0,0), (0,0,-1)),    # Top
+    ((1,0,0), (0,0,1)),     # Down
+])
+
+# Axis (0: x, 1: y, 2: z) a side rotation matrix of CubeGeometry.sideRotationMatrix turns around
+rotationAxes = (2, 0, 1)
+
+
+# Slab a side turn of rotateCubeSide turns (same arguments as CubeGeometry.createCubeIndex's cubeOrder gets turned with) --> axis (0: x, 1: y, 2: z) and index of the slab along it, counted from the negative side
+# Read from the cubeOrder of a 4x4 (where every layer lies on a different side of the middle), so it can never disagree with the cubeOrder bookkeeping of the other modes
+def turnedSlab(cubeType, layer, axes, amountForth):
+
+    cubeOrder, cubySlots = CubeGeometry.createCubeIndex(4)
+    positions = CubeGeometry.gridPositions(4)[np.rot90(cubeOrder, amountForth, axes = axes)[min(layer, 1)].ravel()]
+    axis = int(np.flatnonzero(np.ptp(positions, axis = 0) == 0)[0])
+    side = np.sign(positions[0, axis])
+
+    return axis, (cubeType - 1 - layer if side > 0 else layer)
+
+
+# Every sticker of a cubeType x cubeType x cubeType cube --> palette index per face position, plus where each sticker is so a layer turn can move them
+class StickerCube():
+
+    def __init__(self, cubeType):
+
+        self.cubeType = cubeType
+        # Palette index (see CubeGeometry.colorPalette) of every sticker --> (face, row, column), solved: face i has color i
+        self.faceStates = np.repeat(np.arange(6, dtype = np.uint8), cubeType**2).reshape(6, cubeType, cubeType)
+
+        # Center of every sticker in half sticker widths (integers, so turns stay exact), flat in faceStates order
+        faces, rows, columns = np.unravel_index(np.arange(self.faceStates.size), self.faceStates.shape)
+        self.normals = CubeGeometry.faceNormals[faces]
+        self.positions = self.normals * cubeType + faceTangents[faces, 0] * (2*columns + 1 - cubeType)[:, None] + faceTangents[faces, 1] * (2*rows + 1 - cubeType)[:, None]
+
+        # Stickers of every slab (per axis, slab 0 on the negative side), found through the center of the sticker's cuby
+        self.slabStickers = []
+        for axis in range(3):
+            slabs = ((self.positions - self.normals)[:, axis] + cubeType - 1) // 2
+            order = np.argsort(slabs, kind = "stable")
+            self.slabStickers.append(np.split(order, np.searchsorted(slabs[order], np.arange(1, cubeType))))
+
+
+    # Turns the stickers of one slab by matrix (3x3 quarter turn, see CubeGeometry.quarterTurnMatrix) --> returns the flat indexes of every sticker which changed
+    def turn(self, axis, slab, matrix):
+
+        stickers = self.slabStickers[axis][slab]
+        matrix = np.rint(matrix).astype(int)
+        positions = self.positions[stickers] @ matrix.T
+        normals = self.normals[stickers] @ matrix.T
+
+        # Face, row and column of every sticker's new place
+        faces = np.argmax(normals @ CubeGeometry.faceNormals.T, axis = -1)
+        columns = (np.einsum("ij,ij->i", positions, faceTangents[faces, 0]) + self.cubeType - 1) // 2
+        rows = (np.einsum("ij,ij->i", positions, faceTangents[faces, 1]) + self.cubeType - 1) // 2
+
+        states = self.faceStates.reshape(-1)
+        states[np.ravel_multi_index((faces, rows, columns), self.faceStates.shape)] = states[stickers].copy()
+
+        return stickers
+
+
+    # Whether every face has only one color
+    def isSolved(self):
+
+        return bool(np.all(self.faceStates == self.faceStates[:, :1, :1]))
+
+
+# Outside of the box from lower to upper (grid positions in cuby widths, the cube goes from -cubeType/2 to cubeType/2) --> 36 vertices (6 quads), position in OpenGL units (cellWidth per cuby),
+# sticker: face and position on the face in sticker widths for the faces on the outside of the cube, face 6 (black) for the faces inside it
+def createBoxVertices(cubeType, cellWidth, lower, upper):
+
+    lower, upper = np.asarray(lower, dtype = float), np.asarray(upper, dtype = float)
+    center, halfSize = (lower + upper) / 2, (upper - lower) / 2
+
+    vertices = np.zeros(36, [("position", np.float32, 3), ("sticker", np.float32, 3)])
+    # Corners of every face counter clockwise in (u, v), as two triangles
+    corners = np.array([(-1,-1), (1,-1), (1,1), (-1,-1), (1,1), (-1,1)])
+    for face, (normal, (u, v)) in enumerate(zip(CubeGeometry.faceNormals, faceTangents)):
+        faceCenter = center + normal * halfSize
+        points = faceCenter + corners[:, :1] * u * halfSize + corners[:, 1:] * v * halfSize
+        onOutside = np.isclose(faceCenter @ normal, cubeType / 2)
+
+        vertices["position"][6*face:6*face + 6] = points * cellWidth
+        vertices["sticker"][6*face:6*face + 6, 0] = face if onOutside else 6
+        vertices["sticker"][6*face:6*face + 6, 1] = points @ u + cubeType / 2
+        vertices["sticker"][6*face:6*face + 6, 2] = points @ v + cubeType / 2
+
+    return vertices
+
+
+# The 3 boxes the cube is drawn with (3, 36) --> at rest the whole cube (the other 2 boxes have no size), while the slab turns: before it, the slab itself (index 1, the only one turnMatrix applies to) and behind it
+def createSlabBoxes(cubeType, cellWidth, axis = 0, slab = None):
+
+    half = cubeType / 2
+    lower, upper = np.full(3, -half), np.full(3, half)
+    if slab is None:
+        cuts = (half, half)
+    else:
+        cuts = (slab - half, slab + 1 - half)
+
+    boxes = []
+    for start, end in ((-half, cuts[0]), cuts, (cuts[1], half)):
+        boxLower, boxUpper = lower.copy(), upper.copy()
+        boxLower[axis], boxUpper[axis] = start, end
+        boxes.append(createBoxVertices(cubeType, cellWidth, boxLower, boxUpper))
+
+    return np.array(boxes)
@@ -1,20 +1,33 @@
 from PyQt5.QtWidgets import (QOpenGLWidget)
 from PyQt5.QtGui import (QOpenGLContext, QSurfaceFormat, QSurface)
-from PyQt5.QtCore import Qt
-import time
+from PyQt5.QtCore import Qt, pyqtSignal
 import numpy as np
 import math
-import ctypes
 import OpenGL.GL as gl
 import random
+import threading
+import CubeBuffers
+import CubeProgram
+import CubeGeometry
+import CubeAnimation
+import GeometryCache
+import CubeState
+import MoveNotation
+import CubeSolver
 
 
 # class that holds the cube embedded in a qOpenGLWidget
 class Cube(QOpenGLWidget):
-    # Transfer parent and window's dimensions
-    def __init__(self, parent, length = 500, width = 500):
+    # Emitted from the solver's background thread (see startSolving), Qt delivers it in the GUI thread: the cube state which was solved and the solution (None if none has been found in time)
+    solutionFound = pyqtSignal(object, object)
+
+    # Transfer parent and window's dimensions, vertexFormat: "float", "compact", "palette" or "compactPalette" (see CubeGeometry.vertexFormats)
+    def __init__(self, parent, length = 500, width = 500, vertexFormat = "float"):
         # Call parent class constructor
         super().__init__()
+        if vertexFormat not in CubeGeometry.vertexFormats:
+            raise ValueError("Unknown vertex format: " + str(vertexFormat))
+        self.vertexFormat = vertexFormat
         self.initUI(length, width)
 
     # For all window related stuff
@@ -25,610 +38,40 @@ class Cube(QOpenGLWidget):
     # Protectet function which gets executed as right after the constructor has been called, meaning that this is the place to put all OpenGL init related calls
     def initializeGL(self):
 
-        # Nested function, as it is only being called here, makes it more ordered and will show more use in the future
-        def createNewCubeData(cubeType, cubyFaceWidth, cubyRoundedPartWidth, fTRC, colors):
-
-            # Final list which will contain all the cubies
-            listWithCubies = []
-            # Sets the "roundness" factor of the rounded parts
-            feinKoernigkeit = 2
-
-            # One cuby per loop
-            for cuby in range(cubeType**3):
-                # Empty numpy array --> 36 : Faces; (feinKoernigkeit*6)*12 : Rounded edge parts; ((feinKoernigkeit**2)*3)*8 : Rounded corner parts
-                cubyData = np.zeros(36 + (feinKoernigkeit*6)*12 + ((feinKoernigkeit**2)*3)*8, [("position", np.float32, 3), ("color", np.float32, 4)])
-                # Top right corner --> x-value: substract one unit each cuby, but reset after 3 have passed; y-value: substract one unit after 3 have passed and reset after 9 have passed, z-value: substract one unit after 9 have passed and (only theoretically) reset after 27 have passed
-                tRC = (fTRC[0]-cuby+(cuby//3 * 3), fTRC[1]-(cuby//3)+(cuby//9 * 3), fTRC[2]-(cuby//9))
-                # Colored Faces
-                # Fill the first 36 indexes
-                cubyData["position"][:36] = [
-                    # Front
-                    # Each line three vertices (therefore one triangle), 2 lines of code = one face
-                    # Start with tRC, move left, move right and down
-                    # Start with last two moves, move left and down
-                    # Repeat this same principle in a similar way
-                    tRC, (tRC[0]-cubyFaceWidth, tRC[1], tRC[2]), (tRC[0]-cubyFaceWidth, tRC[1]-cubyFaceWidth, tRC[2]),
-                    tRC, (tRC[0]-cubyFaceWidth, tRC[1]-cubyFaceWidth, tRC[2]), (tRC[0], tRC[1]-cubyFaceWidth, tRC[2]),
-                    # Right
-                    (tRC[0]+cubyRoundedPartWidth, tRC[1], tRC[2]-cubyRoundedPartWidth-cubyFaceWidth), (tRC[0]+cubyRoundedPartWidth, tRC[1], tRC[2]-cubyRoundedPartWidth), (tRC[0]+cubyRoundedPartWidth, tRC[1]-cubyFaceWidth, tRC[2]-cubyRoundedPartWidth),
-                    (tRC[0]+cubyRoundedPartWidth, tRC[1], tRC[2]-cubyRoundedPartWidth-cubyFaceWidth), (tRC[0]+cubyRoundedPartWidth, tRC[1]-cubyFaceWidth, tRC[2]-cubyRoundedPartWidth), (tRC[0]+cubyRoundedPartWidth, tRC[1]-cubyFaceWidth, tRC[2]-cubyRoundedPartWidth-cubyFaceWidth),
-                    # Back
-                    (tRC[0]-cubyFaceWidth, tRC[1], tRC[2]-2*cubyRoundedPartWidth-cubyFaceWidth), (tRC[0], tRC[1], tRC[2]-2*cubyRoundedPartWidth-cubyFaceWidth), (tRC[0], tRC[1]-cubyFaceWidth, tRC[2]-2*cubyRoundedPartWidth-cubyFaceWidth),
-                    (tRC[0]-cubyFaceWidth, tRC[1], tRC[2]-2*cubyRoundedPartWidth-cubyFaceWidth), (tRC[0], tRC[1]-cubyFaceWidth, tRC[2]-2*cubyRoundedPartWidth-cubyFaceWidth), (tRC[0]-cubyFaceWidth, tRC[1]-cubyFaceWidth, tRC[2]-2*cubyRoundedPartWidth-cubyFaceWidth),
-                    # Left
-                    (tRC[0]-cubyRoundedPartWidth-cubyFaceWidth, tRC[1], tRC[2]-cubyRoundedPartWidth), (tRC[0]-cubyRoundedPartWidth-cubyFaceWidth, tRC[1], tRC[2]-cubyRoundedPartWidth-cubyFaceWidth), (tRC[0]-cubyRoundedPartWidth-cubyFaceWidth, tRC[1]-cubyFaceWidth, tRC[2]-cubyRoundedPartWidth-cubyFaceWidth),
-                    (tRC[0]-cubyRoundedPartWidth-cubyFaceWidth, tRC[1], tRC[2]-cubyRoundedPartWidth), (tRC[0]-cubyRoundedPartWidth-cubyFaceWidth, tRC[1]-cubyFaceWidth, tRC[2]-cubyRoundedPartWidth-cubyFaceWidth), (tRC[0]-cubyRoundedPartWidth-cubyFaceWidth, tRC[1]-cubyFaceWidth, tRC[2]-cubyRoundedPartWidth),
-                    # Top
-                    (tRC[0], tRC[1]+cubyRoundedPartWidth, tRC[2]-cubyRoundedPartWidth-cubyFaceWidth), (tRC[0]-cubyFaceWidth, tRC[1]+cubyRoundedPartWidth, tRC[2]-cubyRoundedPartWidth-cubyFaceWidth), (tRC[0]-cubyFaceWidth, tRC[1]+cubyRoundedPartWidth, tRC[2]-cubyRoundedPartWidth),
-                    (tRC[0], tRC[1]+cubyRoundedPartWidth, tRC[2]-cubyRoundedPartWidth-cubyFaceWidth), (tRC[0]-cubyFaceWidth, tRC[1]+cubyRoundedPartWidth, tRC[2]-cubyRoundedPartWidth), (tRC[0], tRC[1]+cubyRoundedPartWidth, tRC[2]-cubyRoundedPartWidth),
-                    # Down
-                    (tRC[0]-cubyFaceWidth, tRC[1]-cubyRoundedPartWidth-cubyFaceWidth, tRC[2]-cubyRoundedPartWidth-cubyFaceWidth), (tRC[0], tRC[1]-cubyRoundedPartWidth-cubyFaceWidth, tRC[2]-cubyRoundedPartWidth-cubyFaceWidth), (tRC[0], tRC[1]-cubyRoundedPartWidth-cubyFaceWidth, tRC[2]-cubyRoundedPartWidth),
-                    (tRC[0]-cubyFaceWidth, tRC[1]-cubyRoundedPartWidth-cubyFaceWidth, tRC[2]-cubyRoundedPartWidth-cubyFaceWidth), (tRC[0], tRC[1]-cubyRoundedPartWidth-cubyFaceWidth, tRC[2]-cubyRoundedPartWidth), (tRC[0]-cubyFaceWidth, tRC[1]-cubyRoundedPartWidth-cubyFaceWidth, tRC[2]-cubyRoundedPartWidth),
-                ]
-
-                # Fill the colors in one at a time
-                for colorIndex in range(36):
-                    # Increment the index by 36 after each cuby
-                    cubyData["color"][colorIndex] = colors[cuby*36 + colorIndex]
-
-                # Rounded edge parts
-                    # Middle
-                        # Front Top
-                # Top corners of the first rectangle to trace
-                oldTopCorners = [(tRC[0], tRC[1]+cubyRoundedPartWidth, tRC[2]-cubyRoundedPartWidth), (tRC[0]-cubyFaceWidth, tRC[1]+cubyRoundedPartWidth, tRC[2]-cubyRoundedPartWidth)]
-                # Amount of layers (rectangles) depends on the feinKoernigkeit factor
-                for korn in range(feinKoernigkeit):
-
-                    # Bottom corners of each new layer (rectangle) --> usage of cos and sin funcs because of the curvature of the group of rectangles we want to implement
-                    # IMPORTANT: which value gets which func: sin and cos have a differently increasing slope, therefore, in order to prevent INWARD curvature, get it the correct way around
-                    oldBottomCorners = [(tRC[0], tRC[1]+(math.cos((math.pi/2) * (korn+1)/feinKoernigkeit))*cubyRoundedPartWidth, tRC[2]-(1-math.sin((math.pi/2) * (korn+1)/feinKoernigkeit))*cubyRoundedPartWidth), (tRC[0]-cubyFaceWidth, tRC[1]+(math.cos((math.pi/2) * (korn+1)/feinKoernigkeit))*cubyRoundedPartWidth, tRC[2]-(1-math.sin((math.pi/2) * (korn+1)/feinKoernigkeit))*cubyRoundedPartWidth)]
-                    # Array indexes: each rectangle takes 6 indexes (6 vertices) & Value: First two top corners, then first botton, repeat last top and finally two bottom
-                    cubyData["position"][(36+korn*6):(42+korn*6)] = [*oldTopCorners, oldBottomCorners[0], oldTopCorners[1], *oldBottomCorners]
-                    # The old bottom corners are the next rectangle's top ones
-                    oldTopCorners = oldBottomCorners
-
-                    # Same array indexes and only black as a color
-                    cubyData["color"][(36+korn*6):(42+korn*6)] = [(0.0,0.0,0.0,1.0) for _ in range(6)]
-
-                        # Front Down
-                oldTopCorners = [(tRC[0], tRC[1]-cubyRoundedPartWidth-cubyFaceWidth, tRC[2]-cubyRoundedPartWidth), (tRC[0]-cubyFaceWidth, tRC[1]-cubyRoundedPartWidth-cubyFaceWidth, tRC[2]-cubyRoundedPartWidth)]
-                for korn in range(feinKoernigkeit):
-
-                    oldBottomCorners = [(tRC[0], tRC[1]-cubyFaceWidth-(math.cos((math.pi/2) * (korn+1)/feinKoernigkeit))*cubyRoundedPartWidth, tRC[2]-(1-math.sin((math.pi/2) * (korn+1)/feinKoernigkeit))*cubyRoundedPartWidth), (tRC[0]-cubyFaceWidth, tRC[1]-cubyFaceWidth-(math.cos((math.pi/2) * (korn+1)/feinKoernigkeit))*cubyRoundedPartWidth, tRC[2]-(1-math.sin((math.pi/2) * (korn+1)/feinKoernigkeit))*cubyRoundedPartWidth)]
-                    cubyData["position"][((36+feinKoernigkeit*6)+korn*6):((42+feinKoernigkeit*6)+korn*6)] = [*oldTopCorners, oldBottomCorners[0], oldTopCorners[1], *oldBottomCorners]
-                    oldTopCorners = oldBottomCorners
-
-                    cubyData["color"][((36+feinKoernigkeit*6)+korn*6):((42+feinKoernigkeit*6)+korn*6)] = [(0.0,0.0,0.0,1.0) for _ in range(6)]
-
-                        # Back Top
-                oldTopCorners = [(tRC[0], tRC[1]+cubyRoundedPartWidth, tRC[2]-cubyFaceWidth-cubyRoundedPartWidth), (tRC[0]-cubyFaceWidth, tRC[1]+cubyRoundedPartWidth, tRC[2]-cubyFaceWidth-cubyRoundedPartWidth)]
-                for korn in range(feinKoernigkeit):
-
-                    oldBottomCorners = [(tRC[0], tRC[1]+(math.cos((math.pi/2) * (korn+1)/feinKoernigkeit))*cubyRoundedPartWidth, tRC[2]-cubyFaceWidth-(1+math.sin((math.pi/2) * (korn+1)/feinKoernigkeit))*cubyRoundedPartWidth), (tRC[0]-cubyFaceWidth, tRC[1]+(math.cos((math.pi/2) * (korn+1)/feinKoernigkeit))*cubyRoundedPartWidth, tRC[2]-cubyFaceWidth-(1+math.sin((math.pi/2) * (korn+1)/feinKoernigkeit))*cubyRoundedPartWidth)]
-                    cubyData["position"][((36+feinKoernigkeit*6*2)+korn*6):((42+feinKoernigkeit*6*2)+korn*6)] = [*oldTopCorners, oldBottomCorners[0], oldTopCorners[1], *oldBottomCorners]
-                    oldTopCorners = oldBottomCorners
-
-                    cubyData["color"][((36+feinKoernigkeit*6*2)+korn*6):((42+feinKoernigkeit*6*2)+korn*6)] = [(0.0,0.0,0.0,1.0) for _ in range(6)]
-
-                        # Back Down
-                oldTopCorners = [(tRC[0], tRC[1]-cubyRoundedPartWidth-cubyFaceWidth, tRC[2]-cubyFaceWidth-cubyRoundedPartWidth), (tRC[0]-cubyFaceWidth, tRC[1]-cubyRoundedPartWidth-cubyFaceWidth, tRC[2]-cubyFaceWidth-cubyRoundedPartWidth)]
-                for korn in range(feinKoernigkeit):
-
-                    oldBottomCorners = [(tRC[0], tRC[1]-cubyFaceWidth-(math.cos((math.pi/2) * (korn+1)/feinKoernigkeit))*cubyRoundedPartWidth, tRC[2]-cubyFaceWidth-(1+math.sin((math.pi/2) * (korn+1)/feinKoernigkeit))*cubyRoundedPartWidth), (tRC[0]-cubyFaceWidth, tRC[1]-cubyFaceWidth-(math.cos((math.pi/2) * (korn+1)/feinKoernigkeit))*cubyRoundedPartWidth, tRC[2]-cubyFaceWidth-(1+math.sin((math.pi/2) * (korn+1)/feinKoernigkeit))*cubyRoundedPartWidth)]
-                    cubyData["position"][((36+feinKoernigkeit*6*3)+korn*6):((42+feinKoernigkeit*6*3)+korn*6)] = [*oldTopCorners, oldBottomCorners[0], oldTopCorners[1], *oldBottomCorners]
-                    oldTopCorners = oldBottomCorners
-
-                    cubyData["color"][((36+feinKoernigkeit*6*3)+korn*6):((42+feinKoernigkeit*6*3)+korn*6)] = [(0.0,0.0,0.0,1.0) for _ in range(6)]
-
-                    # Equator
-                        # Front Right
-                oldTopCorners = [(tRC[0], tRC[1]-cubyFaceWidth, tRC[2]), tRC]
-                for korn in range(feinKoernigkeit):
-
-                    oldBottomCorners = [(tRC[0]+(math.sin((math.pi/2) * (korn+1)/feinKoernigkeit))*cubyRoundedPartWidth, tRC[1]-cubyFaceWidth, tRC[2]-(1-math.cos((math.pi/2) * (korn+1)/feinKoernigkeit))*cubyRoundedPartWidth), (tRC[0]+(math.sin((math.pi/2) * (korn+1)/feinKoernigkeit))*cubyRoundedPartWidth, tRC[1], tRC[2]-(1-math.cos((math.pi/2) * (korn+1)/feinKoernigkeit))*cubyRoundedPartWidth)]
-                    cubyData["position"][((36+feinKoernigkeit*6*4)+korn*6):((42+feinKoernigkeit*6*4)+korn*6)] = [*oldTopCorners, oldBottomCorners[0], oldTopCorners[1], *oldBottomCorners]
-                    oldTopCorners = oldBottomCorners
-
-                    cubyData["color"][((36+feinKoernigkeit*6*4)+korn*6):((42+feinKoernigkeit*6*4)+korn*6)] = [(0.0,0.0,0.0,1.0) for _ in range(6)]
-
-                        # Front Left
-                oldTopCorners = [(tRC[0]-cubyFaceWidth, tRC[1]-cubyFaceWidth, tRC[2]), (tRC[0]-cubyFaceWidth, tRC[1], tRC[2])]
-                for korn in range(feinKoernigkeit):
-
-                    oldBottomCorners = [(tRC[0]-cubyFaceWidth-(math.sin((math.pi/2) * (korn+1)/feinKoernigkeit))*cubyRoundedPartWidth, tRC[1]-cubyFaceWidth, tRC[2]-(1-math.cos((math.pi/2) * (korn+1)/feinKoernigkeit))*cubyRoundedPartWidth), (tRC[0]-cubyFaceWidth-(math.sin((math.pi/2) * (korn+1)/feinKoernigkeit))*cubyRoundedPartWidth, tRC[1], tRC[2]-(1-math.cos((math.pi/2) * (korn+1)/feinKoernigkeit))*cubyRoundedPartWidth)]
-                    cubyData["position"][((36+feinKoernigkeit*6*5)+korn*6):((42+feinKoernigkeit*6*5)+korn*6)] = [*oldTopCorners, oldBottomCorners[0], oldTopCorners[1], *oldBottomCorners]
-                    oldTopCorners = oldBottomCorners
-
-                    cubyData["color"][((36+feinKoernigkeit*6*5)+korn*6):((42+feinKoernigkeit*6*5)+korn*6)] = [(0.0,0.0,0.0,1.0) for _ in range(6)]
-
-                        # Back Right
-                oldTopCorners = [(tRC[0], tRC[1]-cubyFaceWidth, tRC[2]-cubyFaceWidth-2*cubyRoundedPartWidth), (tRC[0], tRC[1], tRC[2]-cubyFaceWidth-2*cubyRoundedPartWidth)]
-                for korn in range(feinKoernigkeit):
-
-                    oldBottomCorners = [(tRC[0]+(math.sin((math.pi/2) * (korn+1)/feinKoernigkeit))*cubyRoundedPartWidth, tRC[1]-cubyFaceWidth, tRC[2]-cubyFaceWidth-(1+math.cos((math.pi/2) * (korn+1)/feinKoernigkeit))*cubyRoundedPartWidth), (tRC[0]+(math.sin((math.pi/2) * (korn+1)/feinKoernigkeit))*cubyRoundedPartWidth, tRC[1], tRC[2]-cubyFaceWidth-(1+math.cos((math.pi/2) * (korn+1)/feinKoernigkeit))*cubyRoundedPartWidth)]
-                    cubyData["position"][((36+feinKoernigkeit*6*6)+korn*6):((42+feinKoernigkeit*6*6)+korn*6)] = [*oldTopCorners, oldBottomCorners[0], oldTopCorners[1], *oldBottomCorners]
-                    oldTopCorners = oldBottomCorners
-
-                    cubyData["color"][((36+feinKoernigkeit*6*6)+korn*6):((42+feinKoernigkeit*6*6)+korn*6)] = [(0.0,0.0,0.0,1.0) for _ in range(6)]
-
-                        # Back Left
-                oldTopCorners = [(tRC[0]-cubyFaceWidth, tRC[1]-cubyFaceWidth, tRC[2]-cubyFaceWidth-2*cubyRoundedPartWidth), (tRC[0]-cubyFaceWidth, tRC[1], tRC[2]-cubyFaceWidth-2*cubyRoundedPartWidth)]
-                for korn in range(feinKoernigkeit):
-
-                    oldBottomCorners = [(tRC[0]-cubyFaceWidth-(math.sin((math.pi/2) * (korn+1)/feinKoernigkeit))*cubyRoundedPartWidth, tRC[1]-cubyFaceWidth, tRC[2]-cubyFaceWidth-(1+math.cos((math.pi/2) * (korn+1)/feinKoernigkeit))*cubyRoundedPartWidth), (tRC[0]-cubyFaceWidth-(math.sin((math.pi/2) * (korn+1)/feinKoernigkeit))*cubyRoundedPartWidth, tRC[1], tRC[2]-cubyFaceWidth-(1+math.cos((math.pi/2) * (korn+1)/feinKoernigkeit))*cubyRoundedPartWidth)]
-                    cubyData["position"][((36+feinKoernigkeit*6*7)+korn*6):((42+feinKoernigkeit*6*7)+korn*6)] = [*oldTopCorners, oldBottomCorners[0], oldTopCorners[1], *oldBottomCorners]
-                    oldTopCorners = oldBottomCorners
-
-                    cubyData["color"][((36+feinKoernigkeit*6*7)+korn*6):((42+feinKoernigkeit*6*7)+korn*6)] = [(0.0,0.0,0.0,1.0) for _ in range(6)]
-
-                    # Standing
-                        # Right Top
-                oldTopCorners = [(tRC[0], tRC[1]+cubyRoundedPartWidth, tRC[2]-cubyRoundedPartWidth), (tRC[0], tRC[1]+cubyRoundedPartWidth, tRC[2]-cubyFaceWidth-cubyRoundedPartWidth)]
-                for korn in range(feinKoernigkeit):
-
-                    oldBottomCorners = [(tRC[0]+(math.sin((math.pi/2) * (korn+1)/feinKoernigkeit))*cubyRoundedPartWidth, tRC[1]+(math.cos((math.pi/2) * (korn+1)/feinKoernigkeit))*cubyRoundedPartWidth, tRC[2]-cubyRoundedPartWidth), (tRC[0]+(math.sin((math.pi/2) * (korn+1)/feinKoernigkeit))*cubyRoundedPartWidth, tRC[1]+(math.cos((math.pi/2) * (korn+1)/feinKoernigkeit))*cubyRoundedPartWidth, tRC[2]-cubyFaceWidth-cubyRoundedPartWidth)]
-                    cubyData["position"][((36+feinKoernigkeit*6*8)+korn*6):((42+feinKoernigkeit*6*8)+korn*6)] = [*oldTopCorners, oldBottomCorners[0], oldTopCorners[1], *oldBottomCorners]
-                    oldTopCorners = oldBottomCorners
-
-                    cubyData["color"][((36+feinKoernigkeit*6*8)+korn*6):((42+feinKoernigkeit*6*8)+korn*6)] = [(0.0,0.0,0.0,1.0) for _ in range(6)]
-
-                        # Left Top
-                oldTopCorners = [(tRC[0]-cubyFaceWidth, tRC[1]+cubyRoundedPartWidth, tRC[2]-cubyRoundedPartWidth), (tRC[0]-cubyFaceWidth, tRC[1]+cubyRoundedPartWidth, tRC[2]-cubyFaceWidth-cubyRoundedPartWidth)]
-                for korn in range(feinKoernigkeit):
-
-                    oldBottomCorners = [(tRC[0]-cubyFaceWidth-(math.sin((math.pi/2) * (korn+1)/feinKoernigkeit))*cubyRoundedPartWidth, tRC[1]+(math.cos((math.pi/2) * (korn+1)/feinKoernigkeit))*cubyRoundedPartWidth, tRC[2]-cubyRoundedPartWidth), (tRC[0]-cubyFaceWidth-(math.sin((math.pi/2) * (korn+1)/feinKoernigkeit))*cubyRoundedPartWidth, tRC[1]+(math.cos((math.pi/2) * (korn+1)/feinKoernigkeit))*cubyRoundedPartWidth, tRC[2]-cubyFaceWidth-cubyRoundedPartWidth)]
-                    cubyData["position"][((36+feinKoernigkeit*6*9)+korn*6):((42+feinKoernigkeit*6*9)+korn*6)] = [*oldTopCorners, oldBottomCorners[0], oldTopCorners[1], *oldBottomCorners]
-                    oldTopCorners = oldBottomCorners
-
-                    cubyData["color"][((36+feinKoernigkeit*6*9)+korn*6):((42+feinKoernigkeit*6*9)+korn*6)] = [(0.0,0.0,0.0,1.0) for _ in range(6)]
-
-                        # Right Down
-                oldTopCorners = [(tRC[0], tRC[1]-cubyFaceWidth-cubyRoundedPartWidth, tRC[2]-cubyRoundedPartWidth), (tRC[0], tRC[1]-cubyFaceWidth-cubyRoundedPartWidth, tRC[2]-cubyFaceWidth-cubyRoundedPartWidth)]
-                for korn in range(feinKoernigkeit):
-
-                    oldBottomCorners = [(tRC[0]+(math.sin((math.pi/2) * (korn+1)/feinKoernigkeit))*cubyRoundedPartWidth, tRC[1]-cubyFaceWidth-(math.cos((math.pi/2) * (korn+1)/feinKoernigkeit))*cubyRoundedPartWidth, tRC[2]-cubyRoundedPartWidth), (tRC[0]+(math.sin((math.pi/2) * (korn+1)/feinKoernigkeit))*cubyRoundedPartWidth, tRC[1]-cubyFaceWidth-(math.cos((math.pi/2) * (korn+1)/feinKoernigkeit))*cubyRoundedPartWidth, tRC[2]-cubyFaceWidth-cubyRoundedPartWidth)]
-                    cubyData["position"][((36+feinKoernigkeit*6*10)+korn*6):((42+feinKoernigkeit*6*10)+korn*6)] = [*oldTopCorners, oldBottomCorners[0], oldTopCorners[1], *oldBottomCorners]
-                    oldTopCorners = oldBottomCorners
-
-                    cubyData["color"][((36+feinKoernigkeit*6*10)+korn*6):((42+feinKoernigkeit*6*10)+korn*6)] = [(0.0,0.0,0.0,1.0) for _ in range(6)]
-
-                        # Left Down
-                oldTopCorners = [(tRC[0]-cubyFaceWidth, tRC[1]-cubyFaceWidth-cubyRoundedPartWidth, tRC[2]-cubyRoundedPartWidth), (tRC[0]-cubyFaceWidth, tRC[1]-cubyFaceWidth-cubyRoundedPartWidth, tRC[2]-cubyFaceWidth-cubyRoundedPartWidth)]
-                for korn in range(feinKoernigkeit):
-
-                    oldBottomCorners = [(tRC[0]-cubyFaceWidth-(math.sin((math.pi/2) * (korn+1)/feinKoernigkeit))*cubyRoundedPartWidth, tRC[1]-cubyFaceWidth-(math.cos((math.pi/2) * (korn+1)/feinKoernigkeit))*cubyRoundedPartWidth, tRC[2]-cubyRoundedPartWidth), (tRC[0]-cubyFaceWidth-(math.sin((math.pi/2) * (korn+1)/feinKoernigkeit))*cubyRoundedPartWidth, tRC[1]-cubyFaceWidth-(math.cos((math.pi/2) * (korn+1)/feinKoernigkeit))*cubyRoundedPartWidth, tRC[2]-cubyFaceWidth-cubyRoundedPartWidth)]
-                    cubyData["position"][((36+feinKoernigkeit*6*11)+korn*6):((42+feinKoernigkeit*6*11)+korn*6)] = [*oldTopCorners, oldBottomCorners[0], oldTopCorners[1], *oldBottomCorners]
-                    oldTopCorners = oldBottomCorners
-
-                    cubyData["color"][((36+feinKoernigkeit*6*11)+korn*6):((42+feinKoernigkeit*6*11)+korn*6)] = [(0.0,0.0,0.0,1.0) for _ in range(6)]
-
-                # Rounded corner parts
-                    # Top
-                        # Right Front
-                # Same as withe the rounded edge parts, only that you begin with one top corner
-                oldTopCorners = [(tRC[0], tRC[1]+cubyRoundedPartWidth, tRC[2]-cubyRoundedPartWidth)]
-                # Again, the amount of triangles depends on the feinKoernigkeit factor
-                for korn in range(feinKoernigkeit):
-
-                    # Using tuples inside the lists because of list comprehension: bottom corners --> the higher the korn index, the more corners in the list (one additional with each iteration)
-                    oldBottomCorners = [
-                                        (tRC[0]+math.sin((k/(1+korn))*(math.pi/2)) * (math.sin((math.pi/2) * (korn+1)/feinKoernigkeit)*cubyRoundedPartWidth),
-                                        tRC[1]+(math.cos((math.pi/2) * (korn+1)/feinKoernigkeit))*cubyRoundedPartWidth,
-                                        tRC[2]-(1-math.sin((math.pi/2) * (korn+1)/feinKoernigkeit))*cubyRoundedPartWidth-((1-math.cos((k/(1+korn))*(math.pi/2))) * math.sin((math.pi/2) * (korn+1)/feinKoernigkeit)*cubyRoundedPartWidth)) for k in range(korn+2)
-                    ]
-                    # List with tuples of vertices (triangles)
-                    tempList = []
-                    # Only after the first iteration
-                    if korn != 0:
-                        # Add triangles --> ALWAYS IN PAIRS OF TWO (amount of triangles is uneven, so you add the first and then the rest in pairs)
-                        tempList = [(oldTopCorners[k], oldTopCorners[k+1], oldBottomCorners[k+1], oldBottomCorners[k+1], oldBottomCorners[k+2], oldTopCorners[k+1]) for k in range(korn)]
-                    # Insert the first triangle at the first index
-                    tempList.insert(0, (oldTopCorners[0], oldBottomCorners[0], oldBottomCorners[1]))
-
-                    # Remove tuple "coat" which only purpose was to be able to use list comprehension
-                    tempList2 = []
-                    # Iterate through the first list
-                    for e in tempList:
-                        # Append as many elements to the tempList2 as there is elements (vertices) in e (tuple)
-                        for d in range(len([*e])):
-                            tempList2.append(e[d])
-
-                    # Seems complicated and, well, it is: 36 --> faces; feinKoernigkeit*6*12 --> rounded edge parts;
-                    #                                     -((0**korn)-1)*(korn**2)*3*1) --> 1) -((0**korn)-1) = 0 on the first iteration and = 1 on every other (needed because of the power in the next segment which can't be 0 but has to)
-                    #                                                                       2) (korn**2)*3*1) --> amount of vertices used in the previous iteration
-                    cubyData["position"][((36+feinKoernigkeit*6*12-((0**korn)-1)*(korn**2)*3*1)):((36+feinKoernigkeit*6*12+((korn+1)**2)*3*1))] = tempList2
-                    # Same indexes as before, and again only black as color
-                    cubyData["color"][((36+feinKoernigkeit*6*12-((0**korn)-1)*(korn**2)*3*1)):((36+feinKoernigkeit*6*12+((korn+1)**2)*3*1))] = [(0.0,0.0,0.0,1.0) for _ in range(len(tempList2))]
-                    # Same procedure as with the rounded edge parts
-                    oldTopCorners = oldBottomCorners
-                        # Left Front
-                oldTopCorners = [(tRC[0]-cubyFaceWidth, tRC[1]+cubyRoundedPartWidth, tRC[2]-cubyRoundedPartWidth)]
-                for korn in range(feinKoernigkeit):
-
-                    oldBottomCorners = [
-                                        (tRC[0]-cubyFaceWidth-math.sin((k/(1+korn))*(math.pi/2)) * (math.sin((math.pi/2) * (korn+1)/feinKoernigkeit)*cubyRoundedPartWidth),
-                                        tRC[1]+(math.cos((math.pi/2) * (korn+1)/feinKoernigkeit))*cubyRoundedPartWidth,
-                                        tRC[2]-(1-math.sin((math.pi/2) * (korn+1)/feinKoernigkeit))*cubyRoundedPartWidth-((1-math.cos((k/(1+korn))*(math.pi/2))) * math.sin((math.pi/2) * (korn+1)/feinKoernigkeit)*cubyRoundedPartWidth)) for k in range(korn+2)
-                    ]
-
-                    tempList = []
-                    if korn != 0:
-                        tempList = [(oldTopCorners[k], oldTopCorners[k+1], oldBottomCorners[k+1], oldBottomCorners[k+1], oldBottomCorners[k+2], oldTopCorners[k+1]) for k in range(korn)]
-                    tempList.insert(0, (oldTopCorners[0], oldBottomCorners[0], oldBottomCorners[1]))
-
-                    tempList2 = []
-                    for e in tempList:
-                        for d in range(len([*e])):
-                            tempList2.append(e[d])
-
-                    cubyData["position"][((36+feinKoernigkeit*6*12+((feinKoernigkeit**2)*3)*1-((0**korn)-1)*(korn**2)*3*1)):((36+feinKoernigkeit*6*12+((feinKoernigkeit**2)*3)*1+((korn+1)**2)*3*1))] = tempList2
-                    cubyData["color"][((36+feinKoernigkeit*6*12+((feinKoernigkeit**2)*3)*1-((0**korn)-1)*(korn**2)*3*1)):((36+feinKoernigkeit*6*12+((feinKoernigkeit**2)*3)*1+((korn+1)**2)*3*1))] = [(0.0,0.0,0.0,1.0) for _ in range(len(tempList2))]
-                    oldTopCorners = oldBottomCorners
-
-                        # Right Back
-                oldTopCorners = [(tRC[0], tRC[1]+cubyRoundedPartWidth, tRC[2]-cubyFaceWidth-cubyRoundedPartWidth)]
-                for korn in range(feinKoernigkeit):
-
-                    oldBottomCorners = [
-                                        (tRC[0]+(math.cos((k/(1+korn))*(math.pi/2))) * (math.sin((math.pi/2) * (korn+1)/feinKoernigkeit)*cubyRoundedPartWidth),
-                                        tRC[1]+(math.cos((math.pi/2) * (korn+1)/feinKoernigkeit))*cubyRoundedPartWidth,
-                                        tRC[2]-cubyFaceWidth-(1-math.sin((math.pi/2) * (korn+1)/feinKoernigkeit))*cubyRoundedPartWidth-((1+math.sin((k/(1+korn))*(math.pi/2))) * math.sin((math.pi/2) * (korn+1)/feinKoernigkeit)*cubyRoundedPartWidth)) for k in range(korn+2)
-                    ]
-
-                    tempList = []
-                    if korn != 0:
-                        tempList = [(oldTopCorners[k], oldTopCorners[k+1], oldBottomCorners[k+1], oldBottomCorners[k+1], oldBottomCorners[k+2], oldTopCorners[k+1]) for k in range(korn)]
-                    tempList.insert(0, (oldTopCorners[0], oldBottomCorners[0], oldBottomCorners[1]))
-
-                    tempList2 = []
-                    for e in tempList:
-                        for d in range(len([*e])):
-                            tempList2.append(e[d])
-
-                    cubyData["position"][((36+feinKoernigkeit*6*12+((feinKoernigkeit**2)*3)*2-((0**korn)-1)*(korn**2)*3*1)):((36+feinKoernigkeit*6*12+((feinKoernigkeit**2)*3)*2+((korn+1)**2)*3*1))] = tempList2
-                    cubyData["color"][((36+feinKoernigkeit*6*12+((feinKoernigkeit**2)*3)*2-((0**korn)-1)*(korn**2)*3*1)):((36+feinKoernigkeit*6*12+((feinKoernigkeit**2)*3)*2+((korn+1)**2)*3*1))] = [(0.0,0.0,0.0,1.0) for _ in range(len(tempList2))]
-                    oldTopCorners = oldBottomCorners
-                        # Left Back
-                oldTopCorners = [(tRC[0]-cubyFaceWidth, tRC[1]+cubyRoundedPartWidth, tRC[2]-cubyFaceWidth-cubyRoundedPartWidth)]
-                for korn in range(feinKoernigkeit):
-
-                    oldBottomCorners = [
-                                        (tRC[0]-cubyFaceWidth-(math.cos((k/(1+korn))*(math.pi/2))) * (math.sin((math.pi/2) * (korn+1)/feinKoernigkeit)*cubyRoundedPartWidth),
-                                        tRC[1]+(math.cos((math.pi/2) * (korn+1)/feinKoernigkeit))*cubyRoundedPartWidth,
-                                        tRC[2]-cubyFaceWidth-(1-math.sin((math.pi/2) * (korn+1)/feinKoernigkeit))*cubyRoundedPartWidth-((1+math.sin((k/(1+korn))*(math.pi/2))) * math.sin((math.pi/2) * (korn+1)/feinKoernigkeit)*cubyRoundedPartWidth)) for k in range(korn+2)
-                    ]
-
-                    tempList = []
-                    if korn != 0:
-                        tempList = [(oldTopCorners[k], oldTopCorners[k+1], oldBottomCorners[k+1], oldBottomCorners[k+1], oldBottomCorners[k+2], oldTopCorners[k+1]) for k in range(korn)]
-                    tempList.insert(0, (oldTopCorners[0], oldBottomCorners[0], oldBottomCorners[1]))
-
-                    tempList2 = []
-                    for e in tempList:
-                        for d in range(len([*e])):
-                            tempList2.append(e[d])
-
-                    cubyData["position"][((36+feinKoernigkeit*6*12+((feinKoernigkeit**2)*3)*3-((0**korn)-1)*(korn**2)*3*1)):((36+feinKoernigkeit*6*12+((feinKoernigkeit**2)*3)*3+((korn+1)**2)*3*1))] = tempList2
-                    cubyData["color"][((36+feinKoernigkeit*6*12+((feinKoernigkeit**2)*3)*3-((0**korn)-1)*(korn**2)*3*1)):((36+feinKoernigkeit*6*12+((feinKoernigkeit**2)*3)*3+((korn+1)**2)*3*1))] = [(0.0,0.0,0.0,1.0) for _ in range(len(tempList2))]
-                    oldTopCorners = oldBottomCorners
-
-                    # Down
-                        # Right Front
-                oldTopCorners = [(tRC[0], tRC[1]-cubyFaceWidth-cubyRoundedPartWidth, tRC[2]-cubyRoundedPartWidth)]
-                for korn in range(feinKoernigkeit):
-
-                    oldBottomCorners = [
-                                        (tRC[0]+math.sin((k/(1+korn))*(math.pi/2)) * (math.sin((math.pi/2) * (korn+1)/feinKoernigkeit)*cubyRoundedPartWidth),
-                                        tRC[1]-cubyFaceWidth-(math.cos((math.pi/2) * (korn+1)/feinKoernigkeit))*cubyRoundedPartWidth,
-                                        tRC[2]-(1-math.sin((math.pi/2) * (korn+1)/feinKoernigkeit))*cubyRoundedPartWidth-((1-math.cos((k/(1+korn))*(math.pi/2))) * math.sin((math.pi/2) * (korn+1)/feinKoernigkeit)*cubyRoundedPartWidth)) for k in range(korn+2)
-                    ]
-
-                    tempList = []
-                    if korn != 0:
-                        tempList = [(oldTopCorners[k], oldTopCorners[k+1], oldBottomCorners[k+1], oldBottomCorners[k+1], oldBottomCorners[k+2], oldTopCorners[k+1]) for k in range(korn)]
-                    tempList.insert(0, (oldTopCorners[0], oldBottomCorners[0], oldBottomCorners[1]))
-
-                    tempList2 = []
-                    for e in tempList:
-                        for d in range(len([*e])):
-                            tempList2.append(e[d])
-
-                    cubyData["position"][((36+feinKoernigkeit*6*12+((feinKoernigkeit**2)*3)*4-((0**korn)-1)*(korn**2)*3*1)):((36+feinKoernigkeit*6*12+((feinKoernigkeit**2)*3)*4+((korn+1)**2)*3*1))] = tempList2
-                    cubyData["color"][((36+feinKoernigkeit*6*12+((feinKoernigkeit**2)*3)*4-((0**korn)-1)*(korn**2)*3*1)):((36+feinKoernigkeit*6*12+((feinKoernigkeit**2)*3)*4+((korn+1)**2)*3*1))] = [(0.0,0.0,0.0,1.0) for _ in range(len(tempList2))]
-                    oldTopCorners = oldBottomCorners
-                        # Left Front
-                oldTopCorners = [(tRC[0]-cubyFaceWidth, tRC[1]-cubyFaceWidth-cubyRoundedPartWidth, tRC[2]-cubyRoundedPartWidth)]
-                for korn in range(feinKoernigkeit):
-
-                    oldBottomCorners = [
-                                        (tRC[0]-cubyFaceWidth-math.sin((k/(1+korn))*(math.pi/2)) * (math.sin((math.pi/2) * (korn+1)/feinKoernigkeit)*cubyRoundedPartWidth),
-                                        tRC[1]-cubyFaceWidth-(math.cos((math.pi/2) * (korn+1)/feinKoernigkeit))*cubyRoundedPartWidth,
-                                        tRC[2]-(1-math.sin((math.pi/2) * (korn+1)/feinKoernigkeit))*cubyRoundedPartWidth-((1-math.cos((k/(1+korn))*(math.pi/2))) * math.sin((math.pi/2) * (korn+1)/feinKoernigkeit)*cubyRoundedPartWidth)) for k in range(korn+2)
-                    ]
-
-                    tempList = []
-                    if korn != 0:
-                        tempList = [(oldTopCorners[k], oldTopCorners[k+1], oldBottomCorners[k+1], oldBottomCorners[k+1], oldBottomCorners[k+2], oldTopCorners[k+1]) for k in range(korn)]
-                    tempList.insert(0, (oldTopCorners[0], oldBottomCorners[0], oldBottomCorners[1]))
-
-                    tempList2 = []
-                    for e in tempList:
-                        for d in range(len([*e])):
-                            tempList2.append(e[d])
-
-                    cubyData["position"][((36+feinKoernigkeit*6*12+((feinKoernigkeit**2)*3)*5-((0**korn)-1)*(korn**2)*3*1)):((36+feinKoernigkeit*6*12+((feinKoernigkeit**2)*3)*5+((korn+1)**2)*3*1))] = tempList2
-                    cubyData["color"][((36+feinKoernigkeit*6*12+((feinKoernigkeit**2)*3)*5-((0**korn)-1)*(korn**2)*3*1)):((36+feinKoernigkeit*6*12+((feinKoernigkeit**2)*3)*5+((korn+1)**2)*3*1))] = [(0.0,0.0,0.0,1.0) for _ in range(len(tempList2))]
-                    oldTopCorners = oldBottomCorners
-
-                        # Right Back
-                oldTopCorners = [(tRC[0], tRC[1]-cubyFaceWidth-cubyRoundedPartWidth, tRC[2]-cubyFaceWidth-cubyRoundedPartWidth)]
-                for korn in range(feinKoernigkeit):
-
-                    oldBottomCorners = [
-                                        (tRC[0]+(math.cos((k/(1+korn))*(math.pi/2))) * (math.sin((math.pi/2) * (korn+1)/feinKoernigkeit)*cubyRoundedPartWidth),
-                                        tRC[1]-cubyFaceWidth-(math.cos((math.pi/2) * (korn+1)/feinKoernigkeit))*cubyRoundedPartWidth,
-                                        tRC[2]-cubyFaceWidth-(1-math.sin((math.pi/2) * (korn+1)/feinKoernigkeit))*cubyRoundedPartWidth-((1+math.sin((k/(1+korn))*(math.pi/2))) * math.sin((math.pi/2) * (korn+1)/feinKoernigkeit)*cubyRoundedPartWidth)) for k in range(korn+2)
-                    ]
-
-                    tempList = []
-                    if korn != 0:
-                        tempList = [(oldTopCorners[k], oldTopCorners[k+1], oldBottomCorners[k+1], oldBottomCorners[k+1], oldBottomCorners[k+2], oldTopCorners[k+1]) for k in range(korn)]
-                    tempList.insert(0, (oldTopCorners[0], oldBottomCorners[0], oldBottomCorners[1]))
-
-                    tempList2 = []
-                    for e in tempList:
-                        for d in range(len([*e])):
-                            tempList2.append(e[d])
-
-                    cubyData["position"][((36+feinKoernigkeit*6*12+((feinKoernigkeit**2)*3)*6-((0**korn)-1)*(korn**2)*3*1)):((36+feinKoernigkeit*6*12+((feinKoernigkeit**2)*3)*6+((korn+1)**2)*3*1))] = tempList2
-                    cubyData["color"][((36+feinKoernigkeit*6*12+((feinKoernigkeit**2)*3)*6-((0**korn)-1)*(korn**2)*3*1)):((36+feinKoernigkeit*6*12+((feinKoernigkeit**2)*3)*6+((korn+1)**2)*3*1))] = [(0.0,0.0,0.0,1.0) for _ in range(len(tempList2))]
-                    oldTopCorners = oldBottomCorners
-                        # Left Back
-                oldTopCorners = [(tRC[0]-cubyFaceWidth, tRC[1]-cubyFaceWidth-cubyRoundedPartWidth, tRC[2]-cubyFaceWidth-cubyRoundedPartWidth)]
-                for korn in range(feinKoernigkeit):
-
-                    oldBottomCorners = [
-                                        (tRC[0]-cubyFaceWidth-(math.cos((k/(1+korn))*(math.pi/2))) * (math.sin((math.pi/2) * (korn+1)/feinKoernigkeit)*cubyRoundedPartWidth),
-                                        tRC[1]-cubyFaceWidth-(math.cos((math.pi/2) * (korn+1)/feinKoernigkeit))*cubyRoundedPartWidth,
-                                        tRC[2]-cubyFaceWidth-(1-math.sin((math.pi/2) * (korn+1)/feinKoernigkeit))*cubyRoundedPartWidth-((1+math.sin((k/(1+korn))*(math.pi/2))) * math.sin((math.pi/2) * (korn+1)/feinKoernigkeit)*cubyRoundedPartWidth)) for k in range(korn+2)
-                    ]
-
-                    tempList = []
-                    if korn != 0:
-                        tempList = [(oldTopCorners[k], oldTopCorners[k+1], oldBottomCorners[k+1], oldBottomCorners[k+1], oldBottomCorners[k+2], oldTopCorners[k+1]) for k in range(korn)]
-                    tempList.insert(0, (oldTopCorners[0], oldBottomCorners[0], oldBottomCorners[1]))
-
-                    tempList2 = []
-                    for e in tempList:
-                        for d in range(len([*e])):
-                            tempList2.append(e[d])
-
-                    cubyData["position"][((36+feinKoernigkeit*6*12+((feinKoernigkeit**2)*3)*7-((0**korn)-1)*(korn**2)*3*1)):((36+feinKoernigkeit*6*12+((feinKoernigkeit**2)*3)*7+((korn+1)**2)*3*1))] = tempList2
-                    cubyData["color"][((36+feinKoernigkeit*6*12+((feinKoernigkeit**2)*3)*7-((0**korn)-1)*(korn**2)*3*1)):((36+feinKoernigkeit*6*12+((feinKoernigkeit**2)*3)*7+((korn+1)**2)*3*1))] = [(0.0,0.0,0.0,1.0) for _ in range(len(tempList2))]
-                    oldTopCorners = oldBottomCorners
-                # Append the newly created cuby data to the list0
-                listWithCubies.append(cubyData)
-            # Return final list
-            return listWithCubies
-
+        # Colors of every cuby's faces, computed from its grid position (see CubeGeometry.stickerColors)
+        self.stickerColors = CubeGeometry.stickerColors(3)
+        # Whether everything but the last layer is dimmed (key G)
+        self.lastLayerOnly = False
+        # Only the cubies which can ever be seen get built, even mid-turn (here: all but the center one, see CubeGeometry.visibleCubies)
+        keptCubies = CubeGeometry.visibleCubies(3)
 
         # Final Rubik's Cube - or at least a list with all you need for the cube's correct display
-        listWithConditionsInitiales = [createNewCubeData(
-                        # Cube type, cubyFace ratio, rounded part ratio
-                        3, 0.8696, 0.0652,
+        # All cubies get built at once by CubeGeometry.createRoundedCubies (faces, rounded edges and rounded corners, see CubeGeometry.createRoundedCubyTemplate)
+        # It goes through GeometryCache, so after the first start they only get memory mapped from disk (see GeometryCache.GeometryCache.fetch)
+        listWithConditionsInitiales = [GeometryCache.createRoundedCubies(
+                        # Cube type, "roundness" factor of the rounded parts (feinKoernigkeit), cubyFace ratio, rounded part ratio
+                        3, 2, 0.8696, 0.0652,
                         # FirstTopRightCorner position
                         (1.4348,1.4348,1.5),
 
-                        # Colors
-
-                        # Six tuples = six verteces' colors = one face
-                        # Six lines = six faces = one cube
-                        # 9 blocks of six lines each = one layer of cubes
-                        [
-                        (1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0),
-                        (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-
-                        (1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-
-                        (1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0),
-                        (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-
-                        (1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0),
-                        (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-
-                        (1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,0.0), (0.0,0.0,0.0,0.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-
-                        (1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0),
-                        (0.0,0.0,0.0,0.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-
-                        (1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0),
-                        (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0),
-
-                        (1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,0.0), (0.0,0.0,0.0,0.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0),
-
-                        (1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0),
-                        (0.0,0.0,0.0,0.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0),
-
-
-
-
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0),
-                        (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,0.0), (0.0,0.0,0.0,0.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0),
-                        (0.0,0.0,0.0,0.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0),
-
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,0.0), (0.0,0.0,0.0,0.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0),
-
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0),
-                        (0.0,0.0,0.0,0.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0),
-
-
-
-
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0),
-                        (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0),
-                        (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0),
-                        (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0),
-                        (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,0.0), (0.0,0.0,0.0,0.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0),
-                        (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0),
-                        (0.0,0.0,0.0,0.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0),
-                        (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0),
-
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,0.0), (0.0,0.0,0.0,0.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0),
-
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0),
-                        (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0),
-                        (0.0,0.0,0.0,0.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0),
-                        ]
+                        # Colors of every cuby's faces
+                        self.stickerColors,
+                        keptCubies
                 )
         ]
 
 
         # Other vars
-            # Convert list to numpy array
-        self.listWithCubies = np.array(listWithConditionsInitiales[0])
-            # 3-dimensional numpy array, used to keep track of the cubies' positions
-        self.cubeOrder = np.arange(27).reshape(3,3,3)
+            # Numpy array with one vertex array per cuby
+        self.listWithCubies = listWithConditionsInitiales[0]
+            # Other vertex formats: compact ones have 16 bit integer positions the shader multiplies by positionScale, palette ones sticker ids instead of colors (see CubeGeometry.vertexFormats)
+        self.positionScale = 1.0
+        if self.vertexFormat != "float":
+            self.listWithCubies, self.positionScale = CubeGeometry.convertVertices(self.listWithCubies, self.vertexFormat, np.flatnonzero(keptCubies))
+            # Logical state of the cube (which cuby is where and how it is twisted, see CubeState), updated on every move the cubies play, so questions like "is it solved?" never have to look at the geometry
+        self.cubeState = CubeState.CubeState()
+            # 3-dimensional numpy array, used to keep track of the cubies' positions (cuby ids) & cuby id -> index of the cuby in listWithCubies (-1 if it hasn't been built), so the cubies of a layer can be picked directly
+        self.cubeOrder, self.cubySlots = CubeGeometry.createCubeIndex(3, keptCubies)
             # Angles for whole cube rotations
         self.angles = [0.0,0.0,0.0]
             # Keeps track of where in the list above what axis rotation or angle value is stored (because they change positions)
@@ -636,14 +79,21 @@ class Cube(QOpenGLWidget):
             # Keeps track of how many times the cube has been turned alongside one certain axis (increments by 90° every 45° away from the nearest value that is congruent 0 mod(90°))
         self.difStartPosXRot, self.difStartYRot, self.difStartZRot = 0.0, 0.0, 0.0
 
-            # Reorder the 3-dimensional array because I choose (don't ask me why) a different layou to start with
-        for i in range(27):
-            self.cubeOrder[i//9][(i - i%3 - 2*(i//3))%3][2-i%3] = i
-
             # numpy array which stores the cubies to rotate
         self.whatCubesToRotate = np.array([])
-            # Default angle value (in radians, OpenGL works that way) for every step of the side rotation animation
-        self.angleValue = 10*math.pi/180
+            # Cubies which are being turned right now and the matrix the GPU rotates them by (identity while no side is turning)
+        self.turningCubies = np.array([], dtype = int)
+        self.turnMatrix = np.identity(4)
+            # Duration in seconds of a side turn (quarter turn) and of a whole cube rotation (arrow keys)
+        self.turnDuration = 0.15
+        self.wholeCubeRotationDuration = 0.1
+            # Plays the turns from a timer, so the event loop never gets blocked
+        self.scheduler = CubeAnimation.AnimationScheduler(self)
+            # Side moves wait here until the scheduler is free, merging with each other if possible
+        self.moveQueue = CubeAnimation.MoveQueue(self.scheduler, self.playMove, {move: sideMove[0] for move, sideMove in CubeGeometry.sideMoves.items()})
+            # Background thread searching a solution (Enter, see startSolving), None while there is none
+        self.solverThread = None
+        self.solutionFound.connect(self.playSolution)
             # Cursors old x position (when it is clicked)
         self.oldMouseXPos = 0
             # Same for y
@@ -656,100 +106,34 @@ class Cube(QOpenGLWidget):
         gl.glDepthMask(gl.GL_TRUE)
         # Default
         gl.glDepthFunc(gl.GL_LESS)
+        # Every generated triangle winds counter clockwise seen from outside (see CubeGeometry.windingErrors), so the ones facing away never get rasterized
+        gl.glEnable(gl.GL_CULL_FACE)
+        gl.glFrontFace(gl.GL_CCW)
+        gl.glCullFace(gl.GL_BACK)
 
         # Launch program init
         self.initProgram()
 
+        # Sticker ids instead of colors: the shader takes the colors from a small texture, which is all a recoloring has to send
+        self.stickerTable = None
+        if "sticker" in self.listWithCubies.dtype.names:
+            self.stickerTable = CubeBuffers.StickerTable(self.programDescriptor, CubeGeometry.stickerTable(self.stickerColors))
+
+        # Upload the cubies once, from now on their buffers only get touched when a side is turned
+        self.buffers = CubeBuffers.BufferManager(self.programDescriptor, self.listWithCubies, positionScale = self.positionScale, textures = [self.stickerTable] if self.stickerTable else [])
+        # The context is destroyed together with the widget, free the GPU memory right before that happens
+        self.context().aboutToBeDestroyed.connect(self.cleanupGL)
+
 
     # OpenGL shader compilation and program creation
     def initProgram(self):
 
-        # Shader code
-            # Vertex shader
-                # uniform     --> angles: whole cube rotation angles (keeps the same value for every vertex)
-                # attribute   --> position: vertex's position
-                #             --> color: vertex's color
-                # varying     --> v_color: transmits the color to the fragment shader
-                # mat4        --> ModelViewProjectionMatrix, standard stuff
-                # void main() --> main function which OpenGL executes
-                        # 1) modelMatrix entries depending on angles
-                        # 2) viewMatrix static, just there to zoom out a bit
-                        # 3) projectionMatrix --> perspective projection
-                        # 4) vertex calc with "4th" value (is there for the distance effect)
-                        # 5) gl_position --> OpenGL's only input (vertex)
-                        # 6) v_color -->  OpenGL's only input (color)
-        vertexShaderCode = """
-            uniform vec3 angles;
-            attribute vec3 position;
-            attribute vec4 color;
-            varying vec4 v_color;
-            mat4 modelMatrix;
-            mat4 viewMatrix;
-            mat4 projectionMatrix;
-            void main() {
-                modelMatrix = mat4(1,0,0,0,  0,cos(angles.x),-sin(angles.x),0,  0,sin(angles.x),cos(angles.x),0,  0,0,0,1) *
-                              mat4(cos(angles.y),0,sin(angles.y),0,  0,1,0,0,  -sin(angles.y),0,cos(angles.y),0,  0,0,0,1) *
-                              mat4(cos(angles.z),-sin(angles.z),0,0,  sin(angles.z),cos(angles.z),0,0,  0,0,1,0,  0,0,0,1);
-                viewMatrix = mat4(1,0,0,0,  0,1,0,0,  0,0,1,0,  0,0,-4.5,1);
-                projectionMatrix = mat4(1,0,0,0,  0,1,0,0,  0,0,0,-1, 0,0,-1.5,0);
-                vec4 temporary = projectionMatrix * viewMatrix * modelMatrix * vec4(position, 1.0);
-                gl_Position = temporary / temporary.w;
-                v_color = color;
-            }
-        """
-            # fragment shader
-                # varying --> same variable as before
-                # void main() --> same
-                    # 1) gl_FragColor --> OpenGL's only input (color final stage)
-        fragmentShaderCode = """
-            varying vec4 v_color;
-            void main() {
-                gl_FragColor = v_color;
-            }
-        """
-
-        # Compile and link shader code
-            # Create program
-        self.program = gl.glCreateProgram()
-            # Create shaders
-        vertexShader = gl.glCreateShader(gl.GL_VERTEX_SHADER)
-        fragmentShader = gl.glCreateShader(gl.GL_FRAGMENT_SHADER)
-
-            # Link shader to shader code
-        gl.glShaderSource(vertexShader, vertexShaderCode)
-        gl.glShaderSource(fragmentShader, fragmentShaderCode)
-
-            # Compile shader code
-        gl.glCompileShader(vertexShader)
-            # Error raising in case something goes wrong
-        if not gl.glGetShaderiv(vertexShader, gl.GL_COMPILE_STATUS):
-            error = gl.glGetShaderInfoLog(vertexShader).decode()
-            print(error)
-            raise RuntimeError("Vertex shader compilation error")
-
-        gl.glCompileShader(fragmentShader)
-        if not gl.glGetShaderiv(fragmentShader, gl.GL_COMPILE_STATUS):
-            error = gl.glGetShaderInfoLog(fragmentShader).decode()
-            print(error)
-            raise RuntimeError("Fragment shader compilation error")
-
-            # Attach shader to program
-        gl.glAttachShader(self.program, vertexShader)
-        gl.glAttachShader(self.program, fragmentShader)
-
-            # Put it all together or finalise the program
-        gl.glLinkProgram(self.program)
-            # More error raising
-        if not gl.glGetProgramiv(self.program, gl.GL_LINK_STATUS):
-            print(gl.glGetProgramInfoLog(self.program))
-            raise RuntimeError("Linking error")
-
-            # Detach shader, as no longer needed
-        gl.glDetachShader(self.program, vertexShader)
-        gl.glDetachShader(self.program, fragmentShader)
-
-            # Declare the program as the one being used
-        gl.glUseProgram(self.program)
+        # Compile and link the shared shader code fitting the vertex format (see CubeProgram), the locations of all uniforms and attributes get resolved right away
+        self.programDescriptor = CubeProgram.programDescriptorFor(self.listWithCubies.dtype)
+        self.program = self.programDescriptor.program
+
+        # Declare the program as the one being used
+        self.programDescriptor.use()
 
 
     # Protectet function called whenever the window is resized
@@ -773,51 +157,27 @@ class Cube(QOpenGLWidget):
             # Same but the other way around
             gl.glViewport(int((self.width/2) - (self.height/2)), 0, self.height, self.height)
 
-        # Get location of angles inside the program
-        loc = gl.glGetUniformLocation(self.program, "angles")
-        # Uplaod new 3 float type uniform values of angles to that location
-        gl.glUniform3f(loc, self.angles[self.xRotPos], self.angles[self.yRotPos], self.angles[self.zRotPos])
+        # Build the ModelViewProjection matrix from the current angles once for the whole frame and upload it (the shader only has to do one multiplication per vertex)
+        self.programDescriptor.setMatrix("mvpMatrix", CubeGeometry.modelViewProjectionMatrix(self.angles[self.xRotPos], self.angles[self.yRotPos], self.angles[self.zRotPos]))
 
         # Clear both color and depth buffer before redrawing
         gl.glClear(gl.GL_COLOR_BUFFER_BIT | gl.GL_DEPTH_BUFFER_BIT)
-        # Draw one cuby at a time
-        for i in self.listWithCubies:
-            self.drawCubies(i)
-
-
-    # Buffer stuff
-    def drawCubies(self, objectToDraw):
-        # Create 4 Vbos (Vertex buffers, memory storage on the GPU for any vertex related data)
-        Vbos = gl.glGenBuffers(4)
+        # Draw all cubies with one single call (the buffer only gets re-uploaded if a cuby moved)
+        self.buffers.draw(self.turningCubies, self.turnMatrix)
+        # Keep track of the frame rate
+        self.scheduler.recordFrame()
 
-        # Get location of both position and color attribute
-        posLoc = gl.glGetAttribLocation(self.program, "position")
-        colorLoc = gl.glGetAttribLocation(self.program, "color")
 
-        # Set the posOffset (offset in amount of bytes), 0 for the position, but as a C variable
-        posOffset = ctypes.c_void_p(0)
-        # .dtype["position"].itemsize (numpy ndarray attribute) returns the size in bytes of the "position" field
-        colorOffset = ctypes.c_void_p(objectToDraw.dtype["position"].itemsize)
-        # .strides[0] returns complete dimension (0) length in bytes
-        objectStride = objectToDraw.strides[0]
+    # Called right before the widget's context gets destroyed
+    def cleanupGL(self):
 
-        # Usage of Vbos
-        # Specifies to which target the buffer is bound (GL_ARRAY_BUFFER)
-        gl.glBindBuffer(gl.GL_ARRAY_BUFFER, Vbos[0])
-        # Upload data to buffer --> target, complete length in bytes of data, data, way of usage (GL_DYNAMIC_DRAW because the image is frequently redrawn)
-        gl.glBufferData(gl.GL_ARRAY_BUFFER, objectToDraw.nbytes, objectToDraw, gl.GL_DYNAMIC_DRAW)
-
-        # Enable "connection" or "communication" between your Buffer and the position attribute in your program, the VertexAttribArray is kind of the interpreter of the buffer data and transmits this data to the program in a specific way
-        gl.glEnableVertexAttribArray(posLoc)
-        # "Interpretation rules" for the VertexAttribArray --> location, value type, don't remember (again, not important), data length in bytes, offset
-        gl.glVertexAttribPointer(posLoc, 3, gl.GL_FLOAT, False, objectStride, posOffset)
-
-        # Same for the color attribute
-        gl.glEnableVertexAttribArray(colorLoc)
-        gl.glVertexAttribPointer(colorLoc, 4, gl.GL_FLOAT, False, objectStride, colorOffset)
-
-        # Finally draw the vertices --> option GL_TRIANGLES: every 3 consecutive vertices form a triangle, amount of entries in data
-        gl.glDrawArrays(gl.GL_TRIANGLES, 0, objectToDraw.size)
+        # The buffers can only be deleted while the context they were created in is current
+        self.makeCurrent()
+        self.buffers.release()
+        if self.stickerTable:
+            self.stickerTable.release()
+        self.programDescriptor.release()
+        self.doneCurrent()
 
 
     # Called by mainWindow
@@ -855,139 +215,346 @@ class Cube(QOpenGLWidget):
                 # Left
         if key == Qt.Key_Left:
 
-            for _ in range(40):
-                self.angles[1] -= 0.25*math.pi/180
-                self.repaint()
-                time.sleep(0.0015)
+            self.rotateWholeCube(1, -10*math.pi/180)
 
                 # Right
         elif key == Qt.Key_Right:
 
-            for _ in range(40):
-                self.angles[1] += 0.25*math.pi/180
-                self.repaint()
-                time.sleep(0.0015)
+            self.rotateWholeCube(1, 10*math.pi/180)
 
                 # Down
         elif key == Qt.Key_Down:
 
-            if abs(self.angles[0] - self.difStartPosXRot) > math.pi/4:
-                self.angles.append(self.angles[1])
-                self.angles.pop(1)
-                temp = self.yRotPos
-                self.yRotPos = self.zRotPos
-                self.zRotPos = temp
-                self.difStartPosXRot += math.pi/2
-
-            for _ in range(40):
-                self.angles[0] += 0.25*math.pi/180
-                self.repaint()
-                time.sleep(0.0015)
+            self.rotateWholeCube(0, 10*math.pi/180)
 
                 # Up
         elif key == Qt.Key_Up:
 
-            if abs(self.angles[0] - self.difStartPosXRot) > math.pi/4:
-                self.angles.append(self.angles[1])
-                self.angles.pop(1)
-                temp = self.yRotPos
-                self.yRotPos = self.zRotPos
-                self.zRotPos = temp
-                self.difStartPosXRot -= math.pi/2
-
-            for _ in range(40):
-                self.angles[0] -= 0.25*math.pi/180
-                self.repaint()
-                time.sleep(0.0015)
+            self.rotateWholeCube(0, -10*math.pi/180)
 
 
         # Side rotations, sides are being turned via the according letter on the keyboard, second condition is for the scramble function
             # Front
         elif key == Qt.Key_F or key == "f":
 
-            self.rotateCubeSide(0, 0)
+            self.queueMove("f")
 
             # Back
         elif key == Qt.Key_B or key == "b":
 
-            self.rotateCubeSide(0, 0, (0,1), 2, True)
+            self.queueMove("b")
 
             # Top
         elif key == Qt.Key_T or key == "t":
 
-            self.rotateCubeSide(2, 0, (0,1), 3)
+            self.queueMove("t")
 
             # Down
         elif key == Qt.Key_D or key == "d":
 
-            self.rotateCubeSide(2, 0, (0,1), 1, True)
+            self.queueMove("d")
 
             # Right
         elif key == Qt.Key_R or key == "r":
 
-            self.rotateCubeSide(1, 0, (0,2), 1)
+            self.queueMove("r")
 
             # Left
         elif key == Qt.Key_L or key == "l":
 
-            self.rotateCubeSide(1, 0, (0,2), 3, True)
+            self.queueMove("l")
 
             # Middle
         elif key == Qt.Key_M or key == "m":
 
-            self.rotateCubeSide(1, 1, (0,2), 3, True)
+            self.queueMove("m")
 
             # Equator
         elif key == Qt.Key_E or key == "e":
 
-            self.rotateCubeSide(2, 1, (0,1), 1, True)
+            self.queueMove("e")
 
             # Standing
         elif key == Qt.Key_S or key == "s":
 
-            self.rotateCubeSide(0, 1)
+            self.queueMove("s")
 
         elif key == Qt.Key_H:
 
             self.scramble(30)
 
+            # Gray: dim everything but the last layer (or show all colors again)
+        elif key == Qt.Key_G:
+
+            self.dimAllButLastLayer(not self.lastLayerOnly)
+
+            # Enter: solve the cube from wherever it is (or will be, once the queued moves are done), in the background, ignored while a solution is still being searched
+        elif key == Qt.Key_Return or key == Qt.Key_Enter:
+
+            self.startSolving()
+
+            # Escape: forget about the moves which haven't started yet
+        elif key == Qt.Key_Escape:
+
+            self.moveQueue.cancel()
+
 
         self.update()
 
-    # Rotates cube side
-    def rotateCubeSide(self, sideRotationMatricesArrayIndex, layer, axes = (0,1), amountForth = 0, invertAngle = False):
-        
-        if invertAngle:
-            self.angleValue = -self.angleValue
+    # Whole cube rotation alongside the x (angleIndex 0) or y (angleIndex 1) axis, animated by the scheduler
+    def rotateWholeCube(self, angleIndex, angleDifference):
+
+        # Progress already applied to the angle (the mouse may change the angles at the same time, therefore only add the difference)
+        appliedProgress = 0.0
 
-        self.cubeOrder = np.rot90(self.cubeOrder, amountForth, axes = axes)
-        self.whatCubesToRotate = self.cubeOrder[layer]
-        self.cubeOrder[layer] = np.rot90(self.cubeOrder[layer], 3)
-        self.cubeOrder = np.rot90(self.cubeOrder, 4-amountForth, axes = axes)
+        # Executed once the animation starts, not when the key is pressed, since the animations before it may still change the angles
+        def start():
 
-        sideRotationMatricesArray = (
-            np.array([[np.cos(self.angleValue),np.sin(self.angleValue),0,0] , [-np.sin(self.angleValue),np.cos(self.angleValue),0,0] , [0,0,1,0] , [0,0,0,1]]),
-            np.array([[1,0,0,0] , [0,np.cos(self.angleValue),np.sin(self.angleValue),0] , [0,-np.sin(self.angleValue),np.cos(self.angleValue),0] , [0,0,0,1]]),
-            np.array([[np.cos(self.angleValue),0,-np.sin(self.angleValue),0] , [0,1,0,0] , [np.sin(self.angleValue),0,np.cos(self.angleValue),0] , [0,0,0,1]])
-        )
+            # x rotations only: once the cube has been turned by more than 45°, the y and z rotation values swap places
+            if angleIndex == 0 and abs(self.angles[0] - self.difStartPosXRot) > math.pi/4:
+                self.angles.append(self.angles[1])
+                self.angles.pop(1)
+                temp = self.yRotPos
+                self.yRotPos = self.zRotPos
+                self.zRotPos = temp
+                self.difStartPosXRot += math.copysign(math.pi/2, angleDifference)
+
+        def update(progress):
+
+            nonlocal appliedProgress
+            self.angles[angleIndex] += (progress - appliedProgress) * angleDifference
+            appliedProgress = progress
+
+        self.scheduler.add(CubeAnimation.Animation(self.wholeCubeRotationDuration, update, start))
+
+
+    # Keeps track of the cubies' positions for a side turn and returns the slots of the cubies which turn
+    def turnCubeOrder(self, layer, axes = (0,1), amountForth = 0, quarterTurns = 1):
+
+        # Precomputed once per turn (see CubeGeometry.cubeOrderTurn): the cubies of the layer, then every cuby to its new grid position with one gather
+        permutation, layerPositions = CubeGeometry.cubeOrderTurn(len(self.cubeOrder), layer, axes, amountForth, quarterTurns)
+        self.whatCubesToRotate = self.cubeOrder.ravel()[layerPositions]
+        self.cubeOrder = self.cubeOrder.ravel()[permutation].reshape(self.cubeOrder.shape)
+
+        # Cubies which haven't been built don't have to be turned
+        turningSlots = self.cubySlots[self.whatCubesToRotate].flatten()
+
+        return turningSlots[turningSlots >= 0]
+
+
+    # Rotates cube side, animated by the scheduler (returns right away, the side turns while the event loop keeps running)
+    def rotateCubeSide(self, sideRotationMatricesArrayIndex, layer, axes = (0,1), amountForth = 0, invertAngle = False, quarterTurns = 1, duration = None):
 
-        oldTime = time.time()
+        # Three quarter turns are animated as one quarter turn the other way round, two as a half turn
+        signedQuarterTurns = CubeGeometry.signedQuarterTurns(quarterTurns, invertAngle)
+        angle = signedQuarterTurns * math.pi/2
+        # A half turn takes longer than a quarter turn, but not twice as long
+        duration = (self.turnDuration if duration is None else duration) * (1 + (abs(signedQuarterTurns) - 1) / 2)
 
-        for _ in range(int(round((math.pi/2)/abs(self.angleValue)))):
-            for cuby in [x for x in self.listWithCubies if np.where(x == self.listWithCubies)[0][0] in self.whatCubesToRotate]:
-                for vertex in cuby:
-                    vertex["position"] = (sideRotationMatricesArray[sideRotationMatricesArrayIndex] @ np.array([vertex["position"][0], vertex["position"][1], vertex["position"][2], 1]))[:3]
-            self.repaint()
-            time.sleep(0.0015)
+        # Executed once the animation starts: the cubies to turn depend on all the turns before this one
+        def start():
 
-        self.angleValue = abs(self.angleValue)
+            self.turningCubies = self.turnCubeOrder(layer, axes, amountForth, quarterTurns)
 
+        # Animate on the GPU: from one tick to the next only the turnMatrix uniform changes, the vertex data stays untouched
+        def update(progress):
 
-    def scramble(self, amountOfMoves):
+            self.turnMatrix = CubeGeometry.sideRotationMatrix(sideRotationMatricesArrayIndex, progress*angle)
 
-        self.angleValue = math.pi/6
-        listWithMoves = [random.choice("fbtdrlmes") for _ in range(amountOfMoves)]
+        # Quarter turn complete: write it into the vertex data once
+        def finish():
+
+            CubeGeometry.rotateCubies(self.listWithCubies, self.turningCubies, CubeGeometry.quarterTurnMatrix(sideRotationMatricesArrayIndex, signedQuarterTurns))
+            # Only the turned cubies have to be sent to the GPU again
+            self.buffers.markDirty(self.turningCubies)
+            self.turningCubies = np.array([], dtype = int)
+            self.turnMatrix = np.identity(4)
+
+        self.scheduler.add(CubeAnimation.Animation(duration, update, start, finish))
+
+
+    # Side moves go through the move queue, which merges them while they wait for their turn
+    def queueMove(self, move, quarterTurns = 1):
+
+        self.moveQueue.push(move, quarterTurns, self.turnDuration)
+
+
+    # Called by the move queue once the move's turn has come
+    def playMove(self, move, quarterTurns, duration):
+
+        self.cubeState.apply(CubeState.keyboardMoves[move], quarterTurns)
+        self.rotateCubeSide(*CubeGeometry.sideMoves[move], quarterTurns, duration)
+
+
+    # Applies moves ([move, quarterTurns] pairs or just move letters) right away: cubeOrder is updated move by move, the vertex data only once at the very end and the cube gets repainted once
+    def applyMovesInstantly(self, moves):
+
+        # A new command: moves which haven't started yet are dropped, the one playing right now is finished first
+        self.moveQueue.cancel()
+        self.scheduler.finishAll()
+
+        # Every cuby collects the rotations of all the turns it takes part in
+        cubyMatrices = np.tile(np.identity(3), (len(self.listWithCubies), 1, 1))
+        for move in moves:
+            move, quarterTurns = (move, 1) if isinstance(move, str) else move
+            sideRotationMatricesArrayIndex, layer, axes, amountForth, invertAngle = CubeGeometry.sideMoves[move]
+
+            turningCubies = self.turnCubeOrder(layer, axes, amountForth, quarterTurns)
+            self.cubeState.apply(CubeState.keyboardMoves[move], quarterTurns)
+            matrix = CubeGeometry.quarterTurnMatrix(sideRotationMatricesArrayIndex, CubeGeometry.signedQuarterTurns(quarterTurns, invertAngle))[:3,:3]
+            cubyMatrices[turningCubies] = matrix @ cubyMatrices[turningCubies]
+
+        CubeGeometry.rotateCubiesIndividually(self.listWithCubies, cubyMatrices)
+        self.buffers.markDirty(np.arange(len(self.listWithCubies)))
+        self.update()
+
+
+    # Plays an algorithm written in the usual notation (e.g. "R U R' U' x2 Rw", see MoveNotation), merged and cancelled first so as few turns as possible get animated
+    # animated False applies it instantly instead (one repaint, no animation at all) --> returns the moves which have been played ([keyboard letter, quarterTurns] pairs)
+    def playAlgorithm(self, text, animated = True):
+
+        listWithMoves = MoveNotation.animationMoves(MoveNotation.compileSequence(text))
+
+        if not animated:
+            self.applyMovesInstantly(listWithMoves)
+            return listWithMoves
+
+        for move, quarterTurns in listWithMoves:
+            self.queueMove(move, quarterTurns)
+
+        return listWithMoves
+
+
+    # Solves the cube from the state it will be in once the queued moves are done (see CubeSolver.solve) and plays the solution like any other moves
+    # Blocks until the solution has been found, the first solve even longer (the tables get loaded, the very first time built, see CubeSolver.loadTables) --> the window uses startSolving instead
+    # animated False applies it instantly instead, the queued moves get dropped then (as by applyMovesInstantly) --> returns the moves which have been played ([keyboard letter, quarterTurns] pairs), None if no solution has been found in time
+    def solve(self, animated = True, maxLength = 22, timeout = 5.0):
+
+        if not animated:
+            self.moveQueue.cancel()
+        solution = CubeSolver.solve(self.queuedState(), maxLength, timeout)
+        if solution is None:
+            return None
+
+        listWithMoves = self.solutionMoves(solution)
+
+        if not animated:
+            self.applyMovesInstantly(listWithMoves)
+            return listWithMoves
+
+        for move, quarterTurns in listWithMoves:
+            self.queueMove(move, quarterTurns)
+
+        return listWithMoves
+
+
+    # Same as solve, but the tables get loaded and the solution searched in a background thread, so the window keeps on turning and painting meanwhile
+    # The solution gets queued once it has been found (see playSolution) --> returns False if a solution is still being searched (nothing new gets started then)
+    def startSolving(self, maxLength = 22, timeout = 5.0):
+
+        if self.solverThread is not None:
+            return False
+
+        cubeState = self.queuedState()
+        def search():
+            self.solutionFound.emit(cubeState, CubeSolver.solve(cubeState, maxLength, timeout))
+
+        # Daemon: closing the window doesn't have to wait for the search
+        self.solverThread = threading.Thread(target = search, daemon = True)
+        self.solverThread.start()
+
+        return True
+
+
+    # Called in the GUI thread once the background search is done, the solution is only queued if the cube is still headed for the state it has been searched for (no moves queued or cancelled meanwhile)
+    def playSolution(self, cubeState, solution):
+
+        self.solverThread = None
+        if solution is None or self.queuedState() != cubeState:
+            return
+
+        for move, quarterTurns in self.solutionMoves(solution):
+            self.queueMove(move, quarterTurns)
+
+
+    # State the cube will be in once the queued moves are done
+    def queuedState(self):
+
+        return self.cubeState.copy().applySequence([(move, quarterTurns) for move, quarterTurns, _ in self.moveQueue.pendingMoves])
+
+
+    # Face move names of CubeSolver.solve --> [keyboard letter, quarterTurns] pairs
+    def solutionMoves(self, solution):
+
+        letters = {name: letter for letter, name in CubeState.keyboardMoves.items()}
+
+        return [[letters[base], quarterTurns] for base, quarterTurns in map(CubeState.splitMoveName, solution)]
+
+
+    # amountOfMoves random moves, seed makes the scramble reproducible, animated plays them one after the other instead of applying them instantly --> returns the moves
+    def scramble(self, amountOfMoves, seed = None, animated = False):
+
+        generator = random.Random(seed)
+        listWithMoves = [generator.choice("fbtdrlmes") for _ in range(amountOfMoves)]
+
+        if not animated:
+            self.applyMovesInstantly(listWithMoves)
+            return listWithMoves
+
+        # Faster turns while scrambling, the moves get queued and played without blocking the window
+        self.turnDuration = 0.05
         for move in listWithMoves:
             self.keyboard(move)
 
-        self.angleValue = 10*math.pi/180
+        self.turnDuration = 0.15
+
+        return listWithMoves
+
+
+    # New color scheme: palette has one color per face and one for the inside (see CubeGeometry.colorPalette)
+    def setColorScheme(self, palette):
+
+        self.stickerColors = CubeGeometry.stickerColors(3, np.asarray(palette, dtype = np.float32))
+        self.dimAllButLastLayer(self.lastLayerOnly)
+
+
+    # Dims the stickers of every cuby which isn't in the top layer right now (the dimmed ones keep their look while they get turned), enabled False shows all colors again
+    def dimAllButLastLayer(self, enabled = True):
+
+        self.lastLayerOnly = enabled
+        self.showStickerColors(CubeGeometry.dimStickers(self.stickerColors, self.cubeOrder[:, 0, :]) if enabled else self.stickerColors)
+
+
+    # Shows the given color of every sticker ((cubeType**3, 6, 4), cuby id order, see CubeGeometry.stickerColors) --> with sticker ids only the sticker table gets sent again, otherwise the colors of every vertex
+    def showStickerColors(self, stickerColors):
+
+        if self.stickerTable:
+            self.stickerTable.setColors(CubeGeometry.stickerTable(stickerColors))
+        else:
+            CubeGeometry.recolorVertices(self.listWithCubies, self.cubySlots, stickerColors)
+            self.buffers.markDirty(np.arange(len(self.listWithCubies)))
+        self.update()
+
+
+    # Whether every face of the cube has one color again (asks the logical state, not the geometry)
+    def isSolved(self):
+
+        return self.cubeState.isSolved()
+
+
+    # Frames per second the cube is currently drawn with
+    def frameRate(self):
+
+        return self.scheduler.frameRate()
+
+
+    # Bytes of vertex data one cuby takes up in the vertex buffer
+    def bytesPerCuby(self):
+
+        return self.listWithCubies[0].nbytes
+
+
+    # Bytes of vertex data sent to the GPU in the last frame and since the start
+    def bytesUploaded(self):
+
+        return self.buffers.bytesUploadedLastFrame, self.buffers.bytesUploadedTotal
@@ -0,0 +1,183 @@
+import os
+import json
+import hashlib
+import tempfile
+import numpy as np
+import CubeGeometry
+
+
+# Built geometry (e.g. CubeGeometry.createRoundedCubies) stored as .npy files, so a cube which has been built once before only needs to be memory mapped on the next start
+# Every file is named after a hash of the builder's name, its parameters and formatVersion, a .json file next to it repeats them and gets checked on load
+
+
+# Has to be increased whenever CubeGeometry builds something different for the same parameters (vertex layout, winding, ...), older files are never loaded again and get evicted over time
+formatVersion = 1
+
+# Where the files go if nothing else is given
+defaultDirectory = os.path.join(os.path.expanduser("~"), ".cache", "DefinitelyNotARubiks", "geometry")
+# The least recently used files get deleted once all of them together take up more than this
+defaultMaxBytes = 512 * 2**20
+
+
+# Parameters -> something json can store and compare, arrays (e.g. face colors) are replaced by a hash of their content
+def describeParameters(parameters):
+
+    description = {}
+    for name, value in sorted(parameters.items()):
+        if isinstance(value, np.ndarray):
+            value = {"array": hashlib.sha256(np.ascontiguousarray(value).tobytes()).hexdigest(), "dtype": str(value.dtype), "shape": list(value.shape)}
+        elif isinstance(value, (tuple, list)):
+            value = [float(element) if isinstance(element, (float, np.floating)) else element for element in value]
+        elif isinstance(value, np.generic):
+            value = value.item()
+        description[name] = value
+
+    return description
+
+
+# File name (without extension) of the geometry name builds from parameters
+def cacheKey(name, description):
+
+    text = json.dumps({"name": name, "version": formatVersion, "parameters": description}, sort_keys = True)
+
+    return name + "-" + hashlib.sha256(text.encode()).hexdigest()[:32]
+
+
+# What the .json file next to an array holds (as json.load gives it back, tuples become lists)
+def arrayInfo(name, description, array):
+
+    info = {"name": name, "version": formatVersion, "parameters": description, "dtype": np.lib.format.dtype_to_descr(array.dtype), "shape": list(array.shape)}
+
+    return json.loads(json.dumps(info))
+
+
+class GeometryCache():
+
+    def __init__(self, directory = defaultDirectory, maxBytes = defaultMaxBytes):
+
+        self.directory = directory
+        self.maxBytes = maxBytes
+
+
+    # builder's result for the given parameters --> from the cache (memory mapped copy on write: changing it, e.g. by a side turn, never touches the file) if possible, otherwise built and stored
+    def fetch(self, name, builder, **parameters):
+
+        description = describeParameters(parameters)
+        key = cacheKey(name, description)
+
+        cached = self.load(key, name, description)
+        if cached is not None:
+            return cached
+
+        array = builder()
+        self.store(key, name, description, array)
+
+        return array
+
+
+    # The stored array, None if there is none or it doesn't match (an outdated or broken file gets deleted)
+    def load(self, key, name, description):
+
+        arrayPath, infoPath = self.paths(key)
+        if not os.path.exists(arrayPath):
+            return None
+
+        try:
+            with open(infoPath) as infoFile:
+                info = json.load(infoFile)
+            array = np.load(arrayPath, mmap_mode = "c")
+            if info != arrayInfo(name, description, array):
+                raise ValueError("Cached geometry doesn't match its parameters")
+        except (OSError, ValueError, TypeError):
+            self.delete(key)
+            return None
+
+        # Marks the file as recently used for the eviction
+        try:
+            os.utime(arrayPath)
+        except OSError:
+            pass
+
+        return array
+
+
+    # Write the array and its info (into temporary files first, so a crash never leaves half a file behind), then make room --> a read only or full disk only means there is no cache
+    def store(self, key, name, description, array):
+
+        # Would only push everything else out and then itself
+        if array.nbytes > self.maxBytes:
+            return
+
+        arrayPath, infoPath = self.paths(key)
+        info = arrayInfo(name, description, array)
+
+        try:
+            os.makedirs(self.directory, exist_ok = True)
+            for path, write in ((arrayPath, lambda file: np.save(file, array)), (infoPath, lambda file: file.write(json.dumps(info).encode()))):
+                fileDescriptor, temporaryPath = tempfile.mkstemp(dir = self.directory, suffix = ".tmp")
+                with os.fdopen(fileDescriptor, "wb") as file:
+                    write(file)
+                os.replace(temporaryPath, path)
+        except OSError:
+            self.delete(key)
+            return
+
+        self.evict()
+
+
+    # Delete the least recently used files until all of them fit into maxBytes (files which are still memory mapped somewhere may refuse, they are tried again next time)
+    def evict(self):
+
+        entries = []
+        for fileName in os.listdir(self.directory):
+            if fileName.endswith(".npy"):
+                status = os.stat(os.path.join(self.directory, fileName))
+                entries.append((status.st_mtime, status.st_size, fileName[:-len(".npy")]))
+
+        totalBytes = sum(size for _, size, _ in entries)
+        for _, size, key in sorted(entries):
+            if totalBytes <= self.maxBytes:
+                break
+            if self.delete(key):
+                totalBytes -= size
+
+
+    # Remove both files of a key --> whether the array file is gone
+    def delete(self, key):
+
+        deleted = True
+        for path in self.paths(key):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            except OSError:
+                deleted = False
+
+        return deleted
+
+
+    # Bytes all the stored arrays take up
+    def size(self):
+
+        if not os.path.isdir(self.directory):
+            return 0
+
+        return sum(os.path.getsize(os.path.join(self.directory, fileName)) for fileName in os.listdir(self.directory) if fileName.endswith(".npy"))
+
+
+    def paths(self, key):
+
+        return os.path.join(self.directory, key + ".npy"), os.path.join(self.directory, key + ".json")
+
+
+# Shared by every cube of the process
+cache = GeometryCache()
+
+
+# CubeGeometry.createRoundedCubies through the cache (same arguments)
+def createRoundedCubies(cubeType, feinKoernigkeit, cubyFaceWidth, cubyRoundedPartWidth, fTRC, faceColors, keptCubies = None):
+
+    return cache.fetch("roundedCubies", lambda: CubeGeometry.createRoundedCubies(cubeType, feinKoernigkeit, cubyFaceWidth, cubyRoundedPartWidth, fTRC, faceColors, keptCubies),
+                       cubeType = cubeType, feinKoernigkeit = feinKoernigkeit, cubyFaceWidth = float(cubyFaceWidth), cubyRoundedPartWidth = float(cubyRoundedPartWidth), fTRC = tuple(fTRC),
+                       faceColors = np.asarray(faceColors), keptCubies = None if keptCubies is None else np.asarray(keptCubies, dtype = bool))
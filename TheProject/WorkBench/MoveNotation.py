@@ -0,0 +1,137 @@
+import re
+import itertools
+import CubeState
+
+
+# Standard 3x3x3 move notation (e.g. "R U R' U2 M x y' Rw (R U R' U')3") --> compiled into runs of moves on one axis, which is where moves can be merged, cancelled and reordered
+# Every move is an axis (0: x like R, 1: y like U, 2: z like F) and the quarter turns of the 3 layers along it (layer 0: L/D/B side, 2: R/U/F side), counted the way R, U and F turn
+# Moves on the same axis commute, so a whole run of them is nothing but those 3 numbers: at most 3 layer turns, however long the run was
+# Lowercase side letters are wide moves as usual (r = Rw), not the keyboard letters of CubeWindow.Cube.keyboard
+
+
+axisNames = "xyz"
+
+# Layer moves per axis and layer --> name in the notation (and in CubeState.moveNames), direction relative to the axis (L turns like R', M like L, E like D, S like F)
+layerMoves = (
+    (("L", -1), ("M", -1), ("R", 1)),
+    (("D", -1), ("E", -1), ("U", 1)),
+    (("B", -1), ("S", 1), ("F", 1)),
+)
+# Same for CubeWindow.Cube.keyboard / CubeGeometry.sideMoves
+keyboardLayerMoves = (
+    (("l", -1), ("m", -1), ("r", 1)),
+    (("d", -1), ("e", -1), ("t", 1)),
+    (("b", -1), ("s", 1), ("f", 1)),
+)
+
+# Every move of the notation --> axis, direction and the layers it turns
+notationMoves = {}
+for axis, moves in enumerate(layerMoves):
+    for layer, (name, direction) in enumerate(moves):
+        notationMoves[name] = (axis, direction, (layer,))
+    # Wide moves turn the middle layer along, rotations all of them
+    for name, direction, layers in ((moves[2][0] + "w", 1, (1, 2)), (moves[0][0] + "w", -1, (0, 1)), (axisNames[axis], 1, (0, 1, 2))):
+        notationMoves[name] = (axis, direction, layers)
+for side in "URFDLB":
+    notationMoves[side.lower()] = notationMoves[side + "w"]
+
+# One move: its name, then quarter turns and/or prime ("R2", "R'", "R2'", "R3"), or an opening/closing parenthesis (repeated by the number after it)
+tokenPattern = re.compile(r"\s*(?:(?P<move>[URFDLB]w|[URFDLBMESxyzurfdlb])(?P<amount>\d*)(?P<prime>['’]?)|(?P<open>\()|\)(?P<repeat>\d*))")
+
+
+# Notation --> list of moves as (axis, layer quarter turns) in the order they were written, nothing simplified yet
+def parse(text):
+
+    # Stack of move lists, one per open parenthesis
+    stack = [[]]
+    position = 0
+    text = text.rstrip()
+    while position < len(text):
+        match = tokenPattern.match(text, position)
+        if not match:
+            raise ValueError("Unknown move at position " + str(position) + ": " + text[position:position + 5])
+        position = match.end()
+
+        if match.group("move"):
+            axis, direction, layers = notationMoves[match.group("move")]
+            quarterTurns = direction * int(match.group("amount") or 1) * (-1 if match.group("prime") else 1)
+            stack[-1].append((axis, tuple(quarterTurns % 4 if layer in layers else 0 for layer in range(3))))
+        elif match.group("open"):
+            stack.append([])
+        else:
+            if len(stack) == 1:
+                raise ValueError("Closing parenthesis without an opening one at position " + str(position))
+            moves = stack.pop()
+            stack[-1].extend(moves * int(match.group("repeat") or 1))
+
+    if len(stack) > 1:
+        raise ValueError("Parenthesis not closed")
+
+    return stack[0]
+
+
+# Moves (from parse) --> runs: neighbours on the same axis get merged (their layer turns add up), moves which cancel out disappear, and so can the runs which end up empty (the runs around them may then merge too)
+def simplify(moves):
+
+    runs = []
+    for axis, layerTurns in moves:
+        if runs and runs[-1][0] == axis:
+            layerTurns = tuple((turns + runTurns) % 4 for turns, runTurns in zip(layerTurns, runs.pop()[1]))
+        if any(layerTurns):
+            runs.append((axis, layerTurns))
+
+    return runs
+
+
+# Notation --> runs (see simplify)
+def compileSequence(text):
+
+    return simplify(parse(text))
+
+
+# Quarter turns of a move in its own direction as the suffix of the notation
+def suffix(quarterTurns):
+
+    return ("", "", "2", "'")[quarterTurns % 4]
+
+
+# Runs --> the same moves one layer at a time, as [name, quarterTurns] pairs CubeWindow.Cube.queueMove and applyMovesInstantly take (keyboard letters), every pair is one animated turn
+def animationMoves(runs):
+
+    return [[keyboardLayerMoves[axis][layer][0], turns * keyboardLayerMoves[axis][layer][1] % 4]
+            for axis, layerTurns in runs for layer, turns in enumerate(layerTurns) if turns]
+
+
+# Runs --> the same moves as names of CubeState.moveNames, e.g. for CubeState.CubeState.applySequence
+def stateMoves(runs):
+
+    return [layerMoves[axis][layer][0] + suffix(turns * layerMoves[axis][layer][1])
+            for axis, layerTurns in runs for layer, turns in enumerate(layerTurns) if turns]
+
+
+# Notation --> one facelet permutation (see CubeState.composeFaceletPermutation) the whole sequence does
+def composedPermutation(text):
+
+    return CubeState.composeFaceletPermutation(stateMoves(compileSequence(text)))
+
+
+# Runs --> shortest notation: every run written with as few moves as possible, rotations and wide moves included (e.g. R M' L' --> x, R M' --> Rw)
+def notation(runs):
+
+    names = []
+    for axis, layerTurns in runs:
+        # Turns of a rotation (all layers), a wide move on the R/U/F side (layers 1, 2) and on the L/D/B side (layers 0, 1), in the axis' direction, the rest are single layers
+        best = None
+        for rotation, highWide, lowWide in itertools.product(range(4), repeat = 3):
+            rest = [(layerTurns[0] - rotation - lowWide) % 4, (layerTurns[1] - rotation - highWide - lowWide) % 4, (layerTurns[2] - rotation - highWide) % 4]
+            amount = sum(turns != 0 for turns in rest + [rotation, highWide, lowWide])
+            if best is None or amount < best[0]:
+                best = (amount, rotation, highWide, lowWide, rest)
+        _, rotation, highWide, lowWide, rest = best
+
+        (lowName, lowDirection), _, (highName, highDirection) = layerMoves[axis]
+        moves = [(axisNames[axis], rotation), (highName + "w", highWide * highDirection), (lowName + "w", lowWide * lowDirection)]
+        moves += [(name, turns * direction) for (name, direction), turns in zip(layerMoves[axis], rest)]
+        names += [name + suffix(turns) for name, turns in moves if turns % 4]
+
+    return " ".join(names)
@@ -1,22 +1,38 @@
 from PyQt5.QtWidgets import (QOpenGLWidget)
 from PyQt5.QtGui import (QOpenGLContext, QSurfaceFormat, QSurface)
 from PyQt5.QtCore import Qt
-import time
 import numpy as np
 import math
-import ctypes
 import OpenGL.GL as gl
 import random
+import CubeBuffers
+import CubeProgram
+import CubeGeometry
+import CubeAnimation
+import CubeStickers
+import GeometryCache
 import threading as th
 
 
 class Cube(QOpenGLWidget):
 
-    def __init__(self, parent = None, windowHeight = 500, windowWidth = 500, cubeType = 3, feinKoernigkeit = 3):
+    # instanced: one shared template mesh drawn once per cuby instead of a private vertex copy per cuby (makes 10x10 and bigger feasible), contexts without instancing fall back to the private copies
+    # vertexFormat: "float", "compact", "palette" or "compactPalette" (see CubeGeometry.vertexFormats), only used without instancing
+    # cullHiddenCubies: don't build the inner cubies which can't be seen, not even mid-turn (see CubeGeometry.visibleCubies)
+    # stickerTexture: no cubies at all, only the outside of the cube with the stickers from a texture (see CubeStickers, makes 100x100 feasible), vertexFormat, instanced and cullHiddenCubies don't matter then
+    # geometryCache: load the built cubies from disk if this cube has been built before (see GeometryCache), only used without instancing and stickerTexture
+    def __init__(self, parent = None, windowHeight = 500, windowWidth = 500, cubeType = 3, feinKoernigkeit = 3, instanced = False, vertexFormat = "float", cullHiddenCubies = True, stickerTexture = False, geometryCache = True):
 
         super().__init__()
+        if vertexFormat not in CubeGeometry.vertexFormats:
+            raise ValueError("Unknown vertex format: " + str(vertexFormat))
+        self.vertexFormat = vertexFormat
         self.cubeType = cubeType
         self.feinKoernigkeit = feinKoernigkeit
+        self.instanced = instanced
+        self.cullHiddenCubies = cullHiddenCubies
+        self.stickerTexture = stickerTexture
+        self.geometryCache = geometryCache
         self.height = windowHeight
         self.width = windowWidth
         self.initUI(self.height, self.width)
@@ -33,596 +49,16 @@ class Cube(QOpenGLWidget):
         # Automatic variable init (especially because of the colors)
         def createAdditionalValuesFromCubeType():
 
-            # cubeFaceWidth in OpenGL units --> add or substract 0.4 for every additional / missing cuby compared to the standard 3x3
-            cubeFaceWidth = (5.7 + (self.cubeType - 3)*0.4) * (10/19)
-
-            # Divide by amount of cubes and multiply by face width ratio
-            cubyFaceWidth = (cubeFaceWidth/self.cubeType)*0.8696
-            # Divide by amount of cubes and multiply by rounded part width ratio
-            cubyRoundedPartWidth = (cubeFaceWidth/self.cubeType)*0.0652
-            # First top right corner, don't ask me why I chose to give it that specific value
-            fTRC = ((cubeFaceWidth/2)-cubyRoundedPartWidth, (cubeFaceWidth/2)-cubyRoundedPartWidth, cubeFaceWidth/2)
-            # Amount of corner / edge / center cubies can directly be extracted from the cubeType
-                # Special case: 1x1 (even though it is actually useless)
-                # Others
-            numpyColors = np.empty((self.cubeType, self.cubeType, self.cubeType), dtype = np.object_)
-            numpyColors.fill(np.zeros((36,4)))
-            colorContainer = np.array([
-                        [
-                        [[(1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0),
-                        (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0)],
-
-                        [(1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0)],
-
-                        [(1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0),
-                        (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0)]],
-
-
-                        [[(1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0),
-                        (0.0,0.0,0.0,0.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0)],
-
-                        [(1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,0.0), (0.0,0.0,0.0,0.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0)],
-
-                        [(1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0),
-                        (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0)]],
-
-
-                        [[(1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0),
-                        (0.0,0.0,0.0,0.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0)],
-
-                        [(1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,0.0), (0.0,0.0,0.0,0.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0)],
-
-                        [(1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0), (1.0,0.0,0.0,1.0),
-                        (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0)]]
-                        ],
-
-
-                        [
-                        [[(0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0),
-                        (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0)],
-
-                        [(0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0)],
-
-                        [(0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0)]],
-
-
-                        [[(0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0),
-                        (0.0,0.0,0.0,0.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0)],
-
-                        [(0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,0.0), (0.0,0.0,0.0,0.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0)],
-
-                        [(0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0)]],
-
-
-                        [[(0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0),
-                        (0.0,0.0,0.0,0.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0)],
-
-                        [(0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,0.0), (0.0,0.0,0.0,0.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0)],
-
-                        [(0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0)]]
-                        ],
-
-
-
-                        [
-                        [[(0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0),
-                        (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0),
-                        (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0)],
-
-                        [(0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0)],
-
-                        [(0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0),
-                        (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0), (1.0,1.0,1.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0)]],
-
-
-                        [[(0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0),
-                        (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0),
-                        (0.0,0.0,0.0,0.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0)],
-
-                        [(0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,0.0), (0.0,0.0,0.0,0.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0)],
-
-                        [(0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0),
-                        (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0)]],
-
-
-                        [[(0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0),
-                        (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0), (0.0,1.0,0.0,1.0),
-                        (0.0,0.0,0.0,0.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0)],
-
-                        [(0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,0.0), (0.0,0.0,0.0,0.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0)],
-
-                        [(0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0), (0.0,0.0,1.0,1.0),
-                        (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0), (1.0,0.5,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0), (0.0,0.0,0.0,1.0),
-                        (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0), (1.0,1.0,0.0,1.0)]]
-                        ]
-            ])
-
-            with np.nditer(numpyColors, flags = ["refs_ok", "multi_index"], op_flags = ["readwrite"]) as it:
-                while not it.finished:
-                    colorContainerIndexes = [x if x == 0 else 2 if x+1 == self.cubeType else 1 for x in it.multi_index]
-                    print(it[0])
-                    print(colorContainer[colorContainerIndexes[0], colorContainerIndexes[1], colorContainerIndexes[2]])
-                    it[0] = colorContainer[colorContainerIndexes[0], colorContainerIndexes[1], colorContainerIndexes[2]]
-                    it.iternext()
-
-            colors = []
-            for cubyColor in np.nditer(numpyColors, order = "C"):
-                colors.append(cubyColor)
+            # Face width, rounded part width and first top right corner
+            cubyFaceWidth, cubyRoundedPartWidth, fTRC = CubeGeometry.roundedCubyDimensions(self.cubeType)
+            # Face colors of every cuby from its grid position, correct for any cubeType (not needed without cubies)
+            colors = None if self.stickerTexture else CubeGeometry.stickerColors(self.cubeType)
 
             additionalValues = (cubyFaceWidth, cubyRoundedPartWidth, fTRC, colors)
 
             return additionalValues
 
 
-        def createNewCubeData(cubeType, *additionalValues):
-
-            listWithCubies = []
-
-            for cuby in range(cubeType**3):
-                # 36 : Faces; (self.feinKoernigkeit*6)*12 : Rounded edge parts; ((self.feinKoernigkeit**2)*3)*8 : Rounded corner parts
-                cubyData = np.zeros(36 + (self.feinKoernigkeit*6)*12 + ((self.feinKoernigkeit**2)*3)*8, [("position", np.float32, 3), ("color", np.float32, 4)])
-                tRC = (fTRC[0]-cuby+(cuby//3 * 3), fTRC[1]-(cuby//3)+(cuby//9 * 3), fTRC[2]-(cuby//9))
-                # Colored Faces
-                # Each line one triangle, 2 lines one face, up to the part where the rounded forms are being stored
-                cubyData["position"][:36] = [
-                    # Front
-                    tRC, (tRC[0]-cubyFaceWidth, tRC[1], tRC[2]), (tRC[0]-cubyFaceWidth, tRC[1]-cubyFaceWidth, tRC[2]),
-                    tRC, (tRC[0]-cubyFaceWidth, tRC[1]-cubyFaceWidth, tRC[2]), (tRC[0], tRC[1]-cubyFaceWidth, tRC[2]),
-                    # Right
-                    (tRC[0]+cubyRoundedPartWidth, tRC[1], tRC[2]-cubyRoundedPartWidth-cubyFaceWidth), (tRC[0]+cubyRoundedPartWidth, tRC[1], tRC[2]-cubyRoundedPartWidth), (tRC[0]+cubyRoundedPartWidth, tRC[1]-cubyFaceWidth, tRC[2]-cubyRoundedPartWidth),
-                    (tRC[0]+cubyRoundedPartWidth, tRC[1], tRC[2]-cubyRoundedPartWidth-cubyFaceWidth), (tRC[0]+cubyRoundedPartWidth, tRC[1]-cubyFaceWidth, tRC[2]-cubyRoundedPartWidth), (tRC[0]+cubyRoundedPartWidth, tRC[1]-cubyFaceWidth, tRC[2]-cubyRoundedPartWidth-cubyFaceWidth),
-                    # Back
-                    (tRC[0]-cubyFaceWidth, tRC[1], tRC[2]-2*cubyRoundedPartWidth-cubyFaceWidth), (tRC[0], tRC[1], tRC[2]-2*cubyRoundedPartWidth-cubyFaceWidth), (tRC[0], tRC[1]-cubyFaceWidth, tRC[2]-2*cubyRoundedPartWidth-cubyFaceWidth),
-                    (tRC[0]-cubyFaceWidth, tRC[1], tRC[2]-2*cubyRoundedPartWidth-cubyFaceWidth), (tRC[0], tRC[1]-cubyFaceWidth, tRC[2]-2*cubyRoundedPartWidth-cubyFaceWidth), (tRC[0]-cubyFaceWidth, tRC[1]-cubyFaceWidth, tRC[2]-2*cubyRoundedPartWidth-cubyFaceWidth),
-                    # Left
-                    (tRC[0]-cubyRoundedPartWidth-cubyFaceWidth, tRC[1], tRC[2]-cubyRoundedPartWidth), (tRC[0]-cubyRoundedPartWidth-cubyFaceWidth, tRC[1], tRC[2]-cubyRoundedPartWidth-cubyFaceWidth), (tRC[0]-cubyRoundedPartWidth-cubyFaceWidth, tRC[1]-cubyFaceWidth, tRC[2]-cubyRoundedPartWidth-cubyFaceWidth),
-                    (tRC[0]-cubyRoundedPartWidth-cubyFaceWidth, tRC[1], tRC[2]-cubyRoundedPartWidth), (tRC[0]-cubyRoundedPartWidth-cubyFaceWidth, tRC[1]-cubyFaceWidth, tRC[2]-cubyRoundedPartWidth-cubyFaceWidth), (tRC[0]-cubyRoundedPartWidth-cubyFaceWidth, tRC[1]-cubyFaceWidth, tRC[2]-cubyRoundedPartWidth),
-                    # Top
-                    (tRC[0], tRC[1]+cubyRoundedPartWidth, tRC[2]-cubyRoundedPartWidth-cubyFaceWidth), (tRC[0]-cubyFaceWidth, tRC[1]+cubyRoundedPartWidth, tRC[2]-cubyRoundedPartWidth-cubyFaceWidth), (tRC[0]-cubyFaceWidth, tRC[1]+cubyRoundedPartWidth, tRC[2]-cubyRoundedPartWidth),
-                    (tRC[0], tRC[1]+cubyRoundedPartWidth, tRC[2]-cubyRoundedPartWidth-cubyFaceWidth), (tRC[0]-cubyFaceWidth, tRC[1]+cubyRoundedPartWidth, tRC[2]-cubyRoundedPartWidth), (tRC[0], tRC[1]+cubyRoundedPartWidth, tRC[2]-cubyRoundedPartWidth),
-                    # Down
-                    (tRC[0]-cubyFaceWidth, tRC[1]-cubyRoundedPartWidth-cubyFaceWidth, tRC[2]-cubyRoundedPartWidth-cubyFaceWidth), (tRC[0], tRC[1]-cubyRoundedPartWidth-cubyFaceWidth, tRC[2]-cubyRoundedPartWidth-cubyFaceWidth), (tRC[0], tRC[1]-cubyRoundedPartWidth-cubyFaceWidth, tRC[2]-cubyRoundedPartWidth),
-                    (tRC[0]-cubyFaceWidth, tRC[1]-cubyRoundedPartWidth-cubyFaceWidth, tRC[2]-cubyRoundedPartWidth-cubyFaceWidth), (tRC[0], tRC[1]-cubyRoundedPartWidth-cubyFaceWidth, tRC[2]-cubyRoundedPartWidth), (tRC[0]-cubyFaceWidth, tRC[1]-cubyRoundedPartWidth-cubyFaceWidth, tRC[2]-cubyRoundedPartWidth),
-                ]
-
-                for colorIndex in range(36):
-                    cubyData["color"][colorIndex] = colors[cuby*36 + colorIndex]
-
-                # Rounded edge parts
-                    # Middle
-                        # Front Top
-                oldTopCorners = [(tRC[0], tRC[1]+cubyRoundedPartWidth, tRC[2]-cubyRoundedPartWidth), (tRC[0]-cubyFaceWidth, tRC[1]+cubyRoundedPartWidth, tRC[2]-cubyRoundedPartWidth)]
-                for korn in range(self.feinKoernigkeit):
-
-                    oldBottomCorners = [(tRC[0], tRC[1]+(math.cos((math.pi/2) * (korn+1)/self.feinKoernigkeit))*cubyRoundedPartWidth, tRC[2]-(1-math.sin((math.pi/2) * (korn+1)/self.feinKoernigkeit))*cubyRoundedPartWidth), (tRC[0]-cubyFaceWidth, tRC[1]+(math.cos((math.pi/2) * (korn+1)/self.feinKoernigkeit))*cubyRoundedPartWidth, tRC[2]-(1-math.sin((math.pi/2) * (korn+1)/self.feinKoernigkeit))*cubyRoundedPartWidth)]
-                    cubyData["position"][(36+korn*6):(42+korn*6)] = [*oldTopCorners, oldBottomCorners[0], oldTopCorners[1], *oldBottomCorners]
-                    oldTopCorners = oldBottomCorners
-
-                    cubyData["color"][(36+korn*6):(42+korn*6)] = [(0.0,0.0,0.0,1.0) for _ in range(6)]
-
-                        # Front Down
-                oldTopCorners = [(tRC[0], tRC[1]-cubyRoundedPartWidth-cubyFaceWidth, tRC[2]-cubyRoundedPartWidth), (tRC[0]-cubyFaceWidth, tRC[1]-cubyRoundedPartWidth-cubyFaceWidth, tRC[2]-cubyRoundedPartWidth)]
-                for korn in range(self.feinKoernigkeit):
-
-                    oldBottomCorners = [(tRC[0], tRC[1]-cubyFaceWidth-(math.cos((math.pi/2) * (korn+1)/self.feinKoernigkeit))*cubyRoundedPartWidth, tRC[2]-(1-math.sin((math.pi/2) * (korn+1)/self.feinKoernigkeit))*cubyRoundedPartWidth), (tRC[0]-cubyFaceWidth, tRC[1]-cubyFaceWidth-(math.cos((math.pi/2) * (korn+1)/self.feinKoernigkeit))*cubyRoundedPartWidth, tRC[2]-(1-math.sin((math.pi/2) * (korn+1)/self.feinKoernigkeit))*cubyRoundedPartWidth)]
-                    cubyData["position"][((36+self.feinKoernigkeit*6)+korn*6):((42+self.feinKoernigkeit*6)+korn*6)] = [*oldTopCorners, oldBottomCorners[0], oldTopCorners[1], *oldBottomCorners]
-                    oldTopCorners = oldBottomCorners
-
-                    cubyData["color"][((36+self.feinKoernigkeit*6)+korn*6):((42+self.feinKoernigkeit*6)+korn*6)] = [(0.0,0.0,0.0,1.0) for _ in range(6)]
-
-                        # Back Top
-                oldTopCorners = [(tRC[0], tRC[1]+cubyRoundedPartWidth, tRC[2]-cubyFaceWidth-cubyRoundedPartWidth), (tRC[0]-cubyFaceWidth, tRC[1]+cubyRoundedPartWidth, tRC[2]-cubyFaceWidth-cubyRoundedPartWidth)]
-                for korn in range(self.feinKoernigkeit):
-
-                    oldBottomCorners = [(tRC[0], tRC[1]+(math.cos((math.pi/2) * (korn+1)/self.feinKoernigkeit))*cubyRoundedPartWidth, tRC[2]-cubyFaceWidth-(1+math.sin((math.pi/2) * (korn+1)/self.feinKoernigkeit))*cubyRoundedPartWidth), (tRC[0]-cubyFaceWidth, tRC[1]+(math.cos((math.pi/2) * (korn+1)/self.feinKoernigkeit))*cubyRoundedPartWidth, tRC[2]-cubyFaceWidth-(1+math.sin((math.pi/2) * (korn+1)/self.feinKoernigkeit))*cubyRoundedPartWidth)]
-                    cubyData["position"][((36+self.feinKoernigkeit*6*2)+korn*6):((42+self.feinKoernigkeit*6*2)+korn*6)] = [*oldTopCorners, oldBottomCorners[0], oldTopCorners[1], *oldBottomCorners]
-                    oldTopCorners = oldBottomCorners
-
-                    cubyData["color"][((36+self.feinKoernigkeit*6*2)+korn*6):((42+self.feinKoernigkeit*6*2)+korn*6)] = [(0.0,0.0,0.0,1.0) for _ in range(6)]
-
-                        # Back Down
-                oldTopCorners = [(tRC[0], tRC[1]-cubyRoundedPartWidth-cubyFaceWidth, tRC[2]-cubyFaceWidth-cubyRoundedPartWidth), (tRC[0]-cubyFaceWidth, tRC[1]-cubyRoundedPartWidth-cubyFaceWidth, tRC[2]-cubyFaceWidth-cubyRoundedPartWidth)]
-                for korn in range(self.feinKoernigkeit):
-
-                    oldBottomCorners = [(tRC[0], tRC[1]-cubyFaceWidth-(math.cos((math.pi/2) * (korn+1)/self.feinKoernigkeit))*cubyRoundedPartWidth, tRC[2]-cubyFaceWidth-(1+math.sin((math.pi/2) * (korn+1)/self.feinKoernigkeit))*cubyRoundedPartWidth), (tRC[0]-cubyFaceWidth, tRC[1]-cubyFaceWidth-(math.cos((math.pi/2) * (korn+1)/self.feinKoernigkeit))*cubyRoundedPartWidth, tRC[2]-cubyFaceWidth-(1+math.sin((math.pi/2) * (korn+1)/self.feinKoernigkeit))*cubyRoundedPartWidth)]
-                    cubyData["position"][((36+self.feinKoernigkeit*6*3)+korn*6):((42+self.feinKoernigkeit*6*3)+korn*6)] = [*oldTopCorners, oldBottomCorners[0], oldTopCorners[1], *oldBottomCorners]
-                    oldTopCorners = oldBottomCorners
-
-                    cubyData["color"][((36+self.feinKoernigkeit*6*3)+korn*6):((42+self.feinKoernigkeit*6*3)+korn*6)] = [(0.0,0.0,0.0,1.0) for _ in range(6)]
-
-                    # Equator
-                        # Front Right
-                oldTopCorners = [(tRC[0], tRC[1]-cubyFaceWidth, tRC[2]), tRC]
-                for korn in range(self.feinKoernigkeit):
-
-                    oldBottomCorners = [(tRC[0]+(math.sin((math.pi/2) * (korn+1)/self.feinKoernigkeit))*cubyRoundedPartWidth, tRC[1]-cubyFaceWidth, tRC[2]-(1-math.cos((math.pi/2) * (korn+1)/self.feinKoernigkeit))*cubyRoundedPartWidth), (tRC[0]+(math.sin((math.pi/2) * (korn+1)/self.feinKoernigkeit))*cubyRoundedPartWidth, tRC[1], tRC[2]-(1-math.cos((math.pi/2) * (korn+1)/self.feinKoernigkeit))*cubyRoundedPartWidth)]
-                    cubyData["position"][((36+self.feinKoernigkeit*6*4)+korn*6):((42+self.feinKoernigkeit*6*4)+korn*6)] = [*oldTopCorners, oldBottomCorners[0], oldTopCorners[1], *oldBottomCorners]
-                    oldTopCorners = oldBottomCorners
-
-                    cubyData["color"][((36+self.feinKoernigkeit*6*4)+korn*6):((42+self.feinKoernigkeit*6*4)+korn*6)] = [(0.0,0.0,0.0,1.0) for _ in range(6)]
-
-                        # Front Left
-                oldTopCorners = [(tRC[0]-cubyFaceWidth, tRC[1]-cubyFaceWidth, tRC[2]), (tRC[0]-cubyFaceWidth, tRC[1], tRC[2])]
-                for korn in range(self.feinKoernigkeit):
-
-                    oldBottomCorners = [(tRC[0]-cubyFaceWidth-(math.sin((math.pi/2) * (korn+1)/self.feinKoernigkeit))*cubyRoundedPartWidth, tRC[1]-cubyFaceWidth, tRC[2]-(1-math.cos((math.pi/2) * (korn+1)/self.feinKoernigkeit))*cubyRoundedPartWidth), (tRC[0]-cubyFaceWidth-(math.sin((math.pi/2) * (korn+1)/self.feinKoernigkeit))*cubyRoundedPartWidth, tRC[1], tRC[2]-(1-math.cos((math.pi/2) * (korn+1)/self.feinKoernigkeit))*cubyRoundedPartWidth)]
-                    cubyData["position"][((36+self.feinKoernigkeit*6*5)+korn*6):((42+self.feinKoernigkeit*6*5)+korn*6)] = [*oldTopCorners, oldBottomCorners[0], oldTopCorners[1], *oldBottomCorners]
-                    oldTopCorners = oldBottomCorners
-
-                    cubyData["color"][((36+self.feinKoernigkeit*6*5)+korn*6):((42+self.feinKoernigkeit*6*5)+korn*6)] = [(0.0,0.0,0.0,1.0) for _ in range(6)]
-
-                        # Back Right
-                oldTopCorners = [(tRC[0], tRC[1]-cubyFaceWidth, tRC[2]-cubyFaceWidth-2*cubyRoundedPartWidth), (tRC[0], tRC[1], tRC[2]-cubyFaceWidth-2*cubyRoundedPartWidth)]
-                for korn in range(self.feinKoernigkeit):
-
-                    oldBottomCorners = [(tRC[0]+(math.sin((math.pi/2) * (korn+1)/self.feinKoernigkeit))*cubyRoundedPartWidth, tRC[1]-cubyFaceWidth, tRC[2]-cubyFaceWidth-(1+math.cos((math.pi/2) * (korn+1)/self.feinKoernigkeit))*cubyRoundedPartWidth), (tRC[0]+(math.sin((math.pi/2) * (korn+1)/self.feinKoernigkeit))*cubyRoundedPartWidth, tRC[1], tRC[2]-cubyFaceWidth-(1+math.cos((math.pi/2) * (korn+1)/self.feinKoernigkeit))*cubyRoundedPartWidth)]
-                    cubyData["position"][((36+self.feinKoernigkeit*6*6)+korn*6):((42+self.feinKoernigkeit*6*6)+korn*6)] = [*oldTopCorners, oldBottomCorners[0], oldTopCorners[1], *oldBottomCorners]
-                    oldTopCorners = oldBottomCorners
-
-                    cubyData["color"][((36+self.feinKoernigkeit*6*6)+korn*6):((42+self.feinKoernigkeit*6*6)+korn*6)] = [(0.0,0.0,0.0,1.0) for _ in range(6)]
-
-                        # Back Left
-                oldTopCorners = [(tRC[0]-cubyFaceWidth, tRC[1]-cubyFaceWidth, tRC[2]-cubyFaceWidth-2*cubyRoundedPartWidth), (tRC[0]-cubyFaceWidth, tRC[1], tRC[2]-cubyFaceWidth-2*cubyRoundedPartWidth)]
-                for korn in range(self.feinKoernigkeit):
-
-                    oldBottomCorners = [(tRC[0]-cubyFaceWidth-(math.sin((math.pi/2) * (korn+1)/self.feinKoernigkeit))*cubyRoundedPartWidth, tRC[1]-cubyFaceWidth, tRC[2]-cubyFaceWidth-(1+math.cos((math.pi/2) * (korn+1)/self.feinKoernigkeit))*cubyRoundedPartWidth), (tRC[0]-cubyFaceWidth-(math.sin((math.pi/2) * (korn+1)/self.feinKoernigkeit))*cubyRoundedPartWidth, tRC[1], tRC[2]-cubyFaceWidth-(1+math.cos((math.pi/2) * (korn+1)/self.feinKoernigkeit))*cubyRoundedPartWidth)]
-                    cubyData["position"][((36+self.feinKoernigkeit*6*7)+korn*6):((42+self.feinKoernigkeit*6*7)+korn*6)] = [*oldTopCorners, oldBottomCorners[0], oldTopCorners[1], *oldBottomCorners]
-                    oldTopCorners = oldBottomCorners
-
-                    cubyData["color"][((36+self.feinKoernigkeit*6*7)+korn*6):((42+self.feinKoernigkeit*6*7)+korn*6)] = [(0.0,0.0,0.0,1.0) for _ in range(6)]
-
-                    # Standing
-                        # Right Top
-                oldTopCorners = [(tRC[0], tRC[1]+cubyRoundedPartWidth, tRC[2]-cubyRoundedPartWidth), (tRC[0], tRC[1]+cubyRoundedPartWidth, tRC[2]-cubyFaceWidth-cubyRoundedPartWidth)]
-                for korn in range(self.feinKoernigkeit):
-
-                    oldBottomCorners = [(tRC[0]+(math.sin((math.pi/2) * (korn+1)/self.feinKoernigkeit))*cubyRoundedPartWidth, tRC[1]+(math.cos((math.pi/2) * (korn+1)/self.feinKoernigkeit))*cubyRoundedPartWidth, tRC[2]-cubyRoundedPartWidth), (tRC[0]+(math.sin((math.pi/2) * (korn+1)/self.feinKoernigkeit))*cubyRoundedPartWidth, tRC[1]+(math.cos((math.pi/2) * (korn+1)/self.feinKoernigkeit))*cubyRoundedPartWidth, tRC[2]-cubyFaceWidth-cubyRoundedPartWidth)]
-                    cubyData["position"][((36+self.feinKoernigkeit*6*8)+korn*6):((42+self.feinKoernigkeit*6*8)+korn*6)] = [*oldTopCorners, oldBottomCorners[0], oldTopCorners[1], *oldBottomCorners]
-                    oldTopCorners = oldBottomCorners
-
-                    cubyData["color"][((36+self.feinKoernigkeit*6*8)+korn*6):((42+self.feinKoernigkeit*6*8)+korn*6)] = [(0.0,0.0,0.0,1.0) for _ in range(6)]
-
-                        # Left Top
-                oldTopCorners = [(tRC[0]-cubyFaceWidth, tRC[1]+cubyRoundedPartWidth, tRC[2]-cubyRoundedPartWidth), (tRC[0]-cubyFaceWidth, tRC[1]+cubyRoundedPartWidth, tRC[2]-cubyFaceWidth-cubyRoundedPartWidth)]
-                for korn in range(self.feinKoernigkeit):
-
-                    oldBottomCorners = [(tRC[0]-cubyFaceWidth-(math.sin((math.pi/2) * (korn+1)/self.feinKoernigkeit))*cubyRoundedPartWidth, tRC[1]+(math.cos((math.pi/2) * (korn+1)/self.feinKoernigkeit))*cubyRoundedPartWidth, tRC[2]-cubyRoundedPartWidth), (tRC[0]-cubyFaceWidth-(math.sin((math.pi/2) * (korn+1)/self.feinKoernigkeit))*cubyRoundedPartWidth, tRC[1]+(math.cos((math.pi/2) * (korn+1)/self.feinKoernigkeit))*cubyRoundedPartWidth, tRC[2]-cubyFaceWidth-cubyRoundedPartWidth)]
-                    cubyData["position"][((36+self.feinKoernigkeit*6*9)+korn*6):((42+self.feinKoernigkeit*6*9)+korn*6)] = [*oldTopCorners, oldBottomCorners[0], oldTopCorners[1], *oldBottomCorners]
-                    oldTopCorners = oldBottomCorners
-
-                    cubyData["color"][((36+self.feinKoernigkeit*6*9)+korn*6):((42+self.feinKoernigkeit*6*9)+korn*6)] = [(0.0,0.0,0.0,1.0) for _ in range(6)]
-
-                        # Right Down
-                oldTopCorners = [(tRC[0], tRC[1]-cubyFaceWidth-cubyRoundedPartWidth, tRC[2]-cubyRoundedPartWidth), (tRC[0], tRC[1]-cubyFaceWidth-cubyRoundedPartWidth, tRC[2]-cubyFaceWidth-cubyRoundedPartWidth)]
-                for korn in range(self.feinKoernigkeit):
-
-                    oldBottomCorners = [(tRC[0]+(math.sin((math.pi/2) * (korn+1)/self.feinKoernigkeit))*cubyRoundedPartWidth, tRC[1]-cubyFaceWidth-(math.cos((math.pi/2) * (korn+1)/self.feinKoernigkeit))*cubyRoundedPartWidth, tRC[2]-cubyRoundedPartWidth), (tRC[0]+(math.sin((math.pi/2) * (korn+1)/self.feinKoernigkeit))*cubyRoundedPartWidth, tRC[1]-cubyFaceWidth-(math.cos((math.pi/2) * (korn+1)/self.feinKoernigkeit))*cubyRoundedPartWidth, tRC[2]-cubyFaceWidth-cubyRoundedPartWidth)]
-                    cubyData["position"][((36+self.feinKoernigkeit*6*10)+korn*6):((42+self.feinKoernigkeit*6*10)+korn*6)] = [*oldTopCorners, oldBottomCorners[0], oldTopCorners[1], *oldBottomCorners]
-                    oldTopCorners = oldBottomCorners
-
-                    cubyData["color"][((36+self.feinKoernigkeit*6*10)+korn*6):((42+self.feinKoernigkeit*6*10)+korn*6)] = [(0.0,0.0,0.0,1.0) for _ in range(6)]
-
-                        # Left Down
-                oldTopCorners = [(tRC[0]-cubyFaceWidth, tRC[1]-cubyFaceWidth-cubyRoundedPartWidth, tRC[2]-cubyRoundedPartWidth), (tRC[0]-cubyFaceWidth, tRC[1]-cubyFaceWidth-cubyRoundedPartWidth, tRC[2]-cubyFaceWidth-cubyRoundedPartWidth)]
-                for korn in range(self.feinKoernigkeit):
-
-                    oldBottomCorners = [(tRC[0]-cubyFaceWidth-(math.sin((math.pi/2) * (korn+1)/self.feinKoernigkeit))*cubyRoundedPartWidth, tRC[1]-cubyFaceWidth-(math.cos((math.pi/2) * (korn+1)/self.feinKoernigkeit))*cubyRoundedPartWidth, tRC[2]-cubyRoundedPartWidth), (tRC[0]-cubyFaceWidth-(math.sin((math.pi/2) * (korn+1)/self.feinKoernigkeit))*cubyRoundedPartWidth, tRC[1]-cubyFaceWidth-(math.cos((math.pi/2) * (korn+1)/self.feinKoernigkeit))*cubyRoundedPartWidth, tRC[2]-cubyFaceWidth-cubyRoundedPartWidth)]
-                    cubyData["position"][((36+self.feinKoernigkeit*6*11)+korn*6):((42+self.feinKoernigkeit*6*11)+korn*6)] = [*oldTopCorners, oldBottomCorners[0], oldTopCorners[1], *oldBottomCorners]
-                    oldTopCorners = oldBottomCorners
-
-                    cubyData["color"][((36+self.feinKoernigkeit*6*11)+korn*6):((42+self.feinKoernigkeit*6*11)+korn*6)] = [(0.0,0.0,0.0,1.0) for _ in range(6)]
-
-                # Rounded corner parts
-                    # Top
-                        # Right Front
-                oldTopCorners = [(tRC[0], tRC[1]+cubyRoundedPartWidth, tRC[2]-cubyRoundedPartWidth)]
-                for korn in range(self.feinKoernigkeit):
-
-                    oldBottomCorners = [
-                                        (tRC[0]+math.sin((k/(1+korn))*(math.pi/2)) * (math.sin((math.pi/2) * (korn+1)/self.feinKoernigkeit)*cubyRoundedPartWidth),
-                                        tRC[1]+(math.cos((math.pi/2) * (korn+1)/self.feinKoernigkeit))*cubyRoundedPartWidth,
-                                        tRC[2]-(1-math.sin((math.pi/2) * (korn+1)/self.feinKoernigkeit))*cubyRoundedPartWidth-((1-math.cos((k/(1+korn))*(math.pi/2))) * math.sin((math.pi/2) * (korn+1)/self.feinKoernigkeit)*cubyRoundedPartWidth)) for k in range(korn+2)
-                    ]
-
-                    tempList = []
-                    if korn != 0:
-                        tempList = [(oldTopCorners[k], oldTopCorners[k+1], oldBottomCorners[k+1], oldBottomCorners[k+1], oldBottomCorners[k+2], oldTopCorners[k+1]) for k in range(korn)]
-                    tempList.insert(0, (oldTopCorners[0], oldBottomCorners[0], oldBottomCorners[1]))
-
-                    tempList2 = []
-                    for e in tempList:
-                        for d in range(len([*e])):
-                            tempList2.append(e[d])
-
-                    cubyData["position"][((36+self.feinKoernigkeit*6*12-((0**korn)-1)*(korn**2)*3*1)):((36+self.feinKoernigkeit*6*12+((korn+1)**2)*3*1))] = tempList2
-                    cubyData["color"][((36+self.feinKoernigkeit*6*12-((0**korn)-1)*(korn**2)*3*1)):((36+self.feinKoernigkeit*6*12+((korn+1)**2)*3*1))] = [(0.0,0.0,0.0,1.0) for _ in range(len(tempList2))]
-                    oldTopCorners = oldBottomCorners
-                        # Left Front
-                oldTopCorners = [(tRC[0]-cubyFaceWidth, tRC[1]+cubyRoundedPartWidth, tRC[2]-cubyRoundedPartWidth)]
-                for korn in range(self.feinKoernigkeit):
-
-                    oldBottomCorners = [
-                                        (tRC[0]-cubyFaceWidth-math.sin((k/(1+korn))*(math.pi/2)) * (math.sin((math.pi/2) * (korn+1)/self.feinKoernigkeit)*cubyRoundedPartWidth),
-                                        tRC[1]+(math.cos((math.pi/2) * (korn+1)/self.feinKoernigkeit))*cubyRoundedPartWidth,
-                                        tRC[2]-(1-math.sin((math.pi/2) * (korn+1)/self.feinKoernigkeit))*cubyRoundedPartWidth-((1-math.cos((k/(1+korn))*(math.pi/2))) * math.sin((math.pi/2) * (korn+1)/self.feinKoernigkeit)*cubyRoundedPartWidth)) for k in range(korn+2)
-                    ]
-
-                    tempList = []
-                    if korn != 0:
-                        tempList = [(oldTopCorners[k], oldTopCorners[k+1], oldBottomCorners[k+1], oldBottomCorners[k+1], oldBottomCorners[k+2], oldTopCorners[k+1]) for k in range(korn)]
-                    tempList.insert(0, (oldTopCorners[0], oldBottomCorners[0], oldBottomCorners[1]))
-
-                    tempList2 = []
-                    for e in tempList:
-                        for d in range(len([*e])):
-                            tempList2.append(e[d])
-
-                    cubyData["position"][((36+self.feinKoernigkeit*6*12+((self.feinKoernigkeit**2)*3)*1-((0**korn)-1)*(korn**2)*3*1)):((36+self.feinKoernigkeit*6*12+((self.feinKoernigkeit**2)*3)*1+((korn+1)**2)*3*1))] = tempList2
-                    cubyData["color"][((36+self.feinKoernigkeit*6*12+((self.feinKoernigkeit**2)*3)*1-((0**korn)-1)*(korn**2)*3*1)):((36+self.feinKoernigkeit*6*12+((self.feinKoernigkeit**2)*3)*1+((korn+1)**2)*3*1))] = [(0.0,0.0,0.0,1.0) for _ in range(len(tempList2))]
-                    oldTopCorners = oldBottomCorners
-
-                        # Right Back
-                oldTopCorners = [(tRC[0], tRC[1]+cubyRoundedPartWidth, tRC[2]-cubyFaceWidth-cubyRoundedPartWidth)]
-                for korn in range(self.feinKoernigkeit):
-
-                    oldBottomCorners = [
-                                        (tRC[0]+(math.cos((k/(1+korn))*(math.pi/2))) * (math.sin((math.pi/2) * (korn+1)/self.feinKoernigkeit)*cubyRoundedPartWidth),
-                                        tRC[1]+(math.cos((math.pi/2) * (korn+1)/self.feinKoernigkeit))*cubyRoundedPartWidth,
-                                        tRC[2]-cubyFaceWidth-(1-math.sin((math.pi/2) * (korn+1)/self.feinKoernigkeit))*cubyRoundedPartWidth-((1+math.sin((k/(1+korn))*(math.pi/2))) * math.sin((math.pi/2) * (korn+1)/self.feinKoernigkeit)*cubyRoundedPartWidth)) for k in range(korn+2)
-                    ]
-
-                    tempList = []
-                    if korn != 0:
-                        tempList = [(oldTopCorners[k], oldTopCorners[k+1], oldBottomCorners[k+1], oldBottomCorners[k+1], oldBottomCorners[k+2], oldTopCorners[k+1]) for k in range(korn)]
-                    tempList.insert(0, (oldTopCorners[0], oldBottomCorners[0], oldBottomCorners[1]))
-
-                    tempList2 = []
-                    for e in tempList:
-                        for d in range(len([*e])):
-                            tempList2.append(e[d])
-
-                    cubyData["position"][((36+self.feinKoernigkeit*6*12+((self.feinKoernigkeit**2)*3)*2-((0**korn)-1)*(korn**2)*3*1)):((36+self.feinKoernigkeit*6*12+((self.feinKoernigkeit**2)*3)*2+((korn+1)**2)*3*1))] = tempList2
-                    cubyData["color"][((36+self.feinKoernigkeit*6*12+((self.feinKoernigkeit**2)*3)*2-((0**korn)-1)*(korn**2)*3*1)):((36+self.feinKoernigkeit*6*12+((self.feinKoernigkeit**2)*3)*2+((korn+1)**2)*3*1))] = [(0.0,0.0,0.0,1.0) for _ in range(len(tempList2))]
-                    oldTopCorners = oldBottomCorners
-                        # Left Back
-                oldTopCorners = [(tRC[0]-cubyFaceWidth, tRC[1]+cubyRoundedPartWidth, tRC[2]-cubyFaceWidth-cubyRoundedPartWidth)]
-                for korn in range(self.feinKoernigkeit):
-
-                    oldBottomCorners = [
-                                        (tRC[0]-cubyFaceWidth-(math.cos((k/(1+korn))*(math.pi/2))) * (math.sin((math.pi/2) * (korn+1)/self.feinKoernigkeit)*cubyRoundedPartWidth),
-                                        tRC[1]+(math.cos((math.pi/2) * (korn+1)/self.feinKoernigkeit))*cubyRoundedPartWidth,
-                                        tRC[2]-cubyFaceWidth-(1-math.sin((math.pi/2) * (korn+1)/self.feinKoernigkeit))*cubyRoundedPartWidth-((1+math.sin((k/(1+korn))*(math.pi/2))) * math.sin((math.pi/2) * (korn+1)/self.feinKoernigkeit)*cubyRoundedPartWidth)) for k in range(korn+2)
-                    ]
-
-                    tempList = []
-                    if korn != 0:
-                        tempList = [(oldTopCorners[k], oldTopCorners[k+1], oldBottomCorners[k+1], oldBottomCorners[k+1], oldBottomCorners[k+2], oldTopCorners[k+1]) for k in range(korn)]
-                    tempList.insert(0, (oldTopCorners[0], oldBottomCorners[0], oldBottomCorners[1]))
-
-                    tempList2 = []
-                    for e in tempList:
-                        for d in range(len([*e])):
-                            tempList2.append(e[d])
-
-                    cubyData["position"][((36+self.feinKoernigkeit*6*12+((self.feinKoernigkeit**2)*3)*3-((0**korn)-1)*(korn**2)*3*1)):((36+self.feinKoernigkeit*6*12+((self.feinKoernigkeit**2)*3)*3+((korn+1)**2)*3*1))] = tempList2
-                    cubyData["color"][((36+self.feinKoernigkeit*6*12+((self.feinKoernigkeit**2)*3)*3-((0**korn)-1)*(korn**2)*3*1)):((36+self.feinKoernigkeit*6*12+((self.feinKoernigkeit**2)*3)*3+((korn+1)**2)*3*1))] = [(0.0,0.0,0.0,1.0) for _ in range(len(tempList2))]
-                    oldTopCorners = oldBottomCorners
-
-                    # Down
-                        # Right Front
-                oldTopCorners = [(tRC[0], tRC[1]-cubyFaceWidth-cubyRoundedPartWidth, tRC[2]-cubyRoundedPartWidth)]
-                for korn in range(self.feinKoernigkeit):
-
-                    oldBottomCorners = [
-                                        (tRC[0]+math.sin((k/(1+korn))*(math.pi/2)) * (math.sin((math.pi/2) * (korn+1)/self.feinKoernigkeit)*cubyRoundedPartWidth),
-                                        tRC[1]-cubyFaceWidth-(math.cos((math.pi/2) * (korn+1)/self.feinKoernigkeit))*cubyRoundedPartWidth,
-                                        tRC[2]-(1-math.sin((math.pi/2) * (korn+1)/self.feinKoernigkeit))*cubyRoundedPartWidth-((1-math.cos((k/(1+korn))*(math.pi/2))) * math.sin((math.pi/2) * (korn+1)/self.feinKoernigkeit)*cubyRoundedPartWidth)) for k in range(korn+2)
-                    ]
-
-                    tempList = []
-                    if korn != 0:
-                        tempList = [(oldTopCorners[k], oldTopCorners[k+1], oldBottomCorners[k+1], oldBottomCorners[k+1], oldBottomCorners[k+2], oldTopCorners[k+1]) for k in range(korn)]
-                    tempList.insert(0, (oldTopCorners[0], oldBottomCorners[0], oldBottomCorners[1]))
-
-                    tempList2 = []
-                    for e in tempList:
-                        for d in range(len([*e])):
-                            tempList2.append(e[d])
-
-                    cubyData["position"][((36+self.feinKoernigkeit*6*12+((self.feinKoernigkeit**2)*3)*4-((0**korn)-1)*(korn**2)*3*1)):((36+self.feinKoernigkeit*6*12+((self.feinKoernigkeit**2)*3)*4+((korn+1)**2)*3*1))] = tempList2
-                    cubyData["color"][((36+self.feinKoernigkeit*6*12+((self.feinKoernigkeit**2)*3)*4-((0**korn)-1)*(korn**2)*3*1)):((36+self.feinKoernigkeit*6*12+((self.feinKoernigkeit**2)*3)*4+((korn+1)**2)*3*1))] = [(0.0,0.0,0.0,1.0) for _ in range(len(tempList2))]
-                    oldTopCorners = oldBottomCorners
-                        # Left Front
-                oldTopCorners = [(tRC[0]-cubyFaceWidth, tRC[1]-cubyFaceWidth-cubyRoundedPartWidth, tRC[2]-cubyRoundedPartWidth)]
-                for korn in range(self.feinKoernigkeit):
-
-                    oldBottomCorners = [
-                                        (tRC[0]-cubyFaceWidth-math.sin((k/(1+korn))*(math.pi/2)) * (math.sin((math.pi/2) * (korn+1)/self.feinKoernigkeit)*cubyRoundedPartWidth),
-                                        tRC[1]-cubyFaceWidth-(math.cos((math.pi/2) * (korn+1)/self.feinKoernigkeit))*cubyRoundedPartWidth,
-                                        tRC[2]-(1-math.sin((math.pi/2) * (korn+1)/self.feinKoernigkeit))*cubyRoundedPartWidth-((1-math.cos((k/(1+korn))*(math.pi/2))) * math.sin((math.pi/2) * (korn+1)/self.feinKoernigkeit)*cubyRoundedPartWidth)) for k in range(korn+2)
-                    ]
-
-                    tempList = []
-                    if korn != 0:
-                        tempList = [(oldTopCorners[k], oldTopCorners[k+1], oldBottomCorners[k+1], oldBottomCorners[k+1], oldBottomCorners[k+2], oldTopCorners[k+1]) for k in range(korn)]
-                    tempList.insert(0, (oldTopCorners[0], oldBottomCorners[0], oldBottomCorners[1]))
-
-                    tempList2 = []
-                    for e in tempList:
-                        for d in range(len([*e])):
-                            tempList2.append(e[d])
-
-                    cubyData["position"][((36+self.feinKoernigkeit*6*12+((self.feinKoernigkeit**2)*3)*5-((0**korn)-1)*(korn**2)*3*1)):((36+self.feinKoernigkeit*6*12+((self.feinKoernigkeit**2)*3)*5+((korn+1)**2)*3*1))] = tempList2
-                    cubyData["color"][((36+self.feinKoernigkeit*6*12+((self.feinKoernigkeit**2)*3)*5-((0**korn)-1)*(korn**2)*3*1)):((36+self.feinKoernigkeit*6*12+((self.feinKoernigkeit**2)*3)*5+((korn+1)**2)*3*1))] = [(0.0,0.0,0.0,1.0) for _ in range(len(tempList2))]
-                    oldTopCorners = oldBottomCorners
-
-                        # Right Back
-                oldTopCorners = [(tRC[0], tRC[1]-cubyFaceWidth-cubyRoundedPartWidth, tRC[2]-cubyFaceWidth-cubyRoundedPartWidth)]
-                for korn in range(self.feinKoernigkeit):
-
-                    oldBottomCorners = [
-                                        (tRC[0]+(math.cos((k/(1+korn))*(math.pi/2))) * (math.sin((math.pi/2) * (korn+1)/self.feinKoernigkeit)*cubyRoundedPartWidth),
-                                        tRC[1]-cubyFaceWidth-(math.cos((math.pi/2) * (korn+1)/self.feinKoernigkeit))*cubyRoundedPartWidth,
-                                        tRC[2]-cubyFaceWidth-(1-math.sin((math.pi/2) * (korn+1)/self.feinKoernigkeit))*cubyRoundedPartWidth-((1+math.sin((k/(1+korn))*(math.pi/2))) * math.sin((math.pi/2) * (korn+1)/self.feinKoernigkeit)*cubyRoundedPartWidth)) for k in range(korn+2)
-                    ]
-
-                    tempList = []
-                    if korn != 0:
-                        tempList = [(oldTopCorners[k], oldTopCorners[k+1], oldBottomCorners[k+1], oldBottomCorners[k+1], oldBottomCorners[k+2], oldTopCorners[k+1]) for k in range(korn)]
-                    tempList.insert(0, (oldTopCorners[0], oldBottomCorners[0], oldBottomCorners[1]))
-
-                    tempList2 = []
-                    for e in tempList:
-                        for d in range(len([*e])):
-                            tempList2.append(e[d])
-
-                    cubyData["position"][((36+self.feinKoernigkeit*6*12+((self.feinKoernigkeit**2)*3)*6-((0**korn)-1)*(korn**2)*3*1)):((36+self.feinKoernigkeit*6*12+((self.feinKoernigkeit**2)*3)*6+((korn+1)**2)*3*1))] = tempList2
-                    cubyData["color"][((36+self.feinKoernigkeit*6*12+((self.feinKoernigkeit**2)*3)*6-((0**korn)-1)*(korn**2)*3*1)):((36+self.feinKoernigkeit*6*12+((self.feinKoernigkeit**2)*3)*6+((korn+1)**2)*3*1))] = [(0.0,0.0,0.0,1.0) for _ in range(len(tempList2))]
-                    oldTopCorners = oldBottomCorners
-                        # Left Back
-                oldTopCorners = [(tRC[0]-cubyFaceWidth, tRC[1]-cubyFaceWidth-cubyRoundedPartWidth, tRC[2]-cubyFaceWidth-cubyRoundedPartWidth)]
-                for korn in range(self.feinKoernigkeit):
-
-                    oldBottomCorners = [
-                                        (tRC[0]-cubyFaceWidth-(math.cos((k/(1+korn))*(math.pi/2))) * (math.sin((math.pi/2) * (korn+1)/self.feinKoernigkeit)*cubyRoundedPartWidth),
-                                        tRC[1]-cubyFaceWidth-(math.cos((math.pi/2) * (korn+1)/self.feinKoernigkeit))*cubyRoundedPartWidth,
-                                        tRC[2]-cubyFaceWidth-(1-math.sin((math.pi/2) * (korn+1)/self.feinKoernigkeit))*cubyRoundedPartWidth-((1+math.sin((k/(1+korn))*(math.pi/2))) * math.sin((math.pi/2) * (korn+1)/self.feinKoernigkeit)*cubyRoundedPartWidth)) for k in range(korn+2)
-                    ]
-
-                    tempList = []
-                    if korn != 0:
-                        tempList = [(oldTopCorners[k], oldTopCorners[k+1], oldBottomCorners[k+1], oldBottomCorners[k+1], oldBottomCorners[k+2], oldTopCorners[k+1]) for k in range(korn)]
-                    tempList.insert(0, (oldTopCorners[0], oldBottomCorners[0], oldBottomCorners[1]))
-
-                    tempList2 = []
-                    for e in tempList:
-                        for d in range(len([*e])):
-                            tempList2.append(e[d])
-
-                    cubyData["position"][((36+self.feinKoernigkeit*6*12+((self.feinKoernigkeit**2)*3)*7-((0**korn)-1)*(korn**2)*3*1)):((36+self.feinKoernigkeit*6*12+((self.feinKoernigkeit**2)*3)*7+((korn+1)**2)*3*1))] = tempList2
-                    cubyData["color"][((36+self.feinKoernigkeit*6*12+((self.feinKoernigkeit**2)*3)*7-((0**korn)-1)*(korn**2)*3*1)):((36+self.feinKoernigkeit*6*12+((self.feinKoernigkeit**2)*3)*7+((korn+1)**2)*3*1))] = [(0.0,0.0,0.0,1.0) for _ in range(len(tempList2))]
-                    oldTopCorners = oldBottomCorners
-
-                listWithCubies.append(cubyData)
-
-            return listWithCubies
-
         # Cuby data
         dataIndices = np.array([0,1,3, 1,2,3, 5,0,4, 0,3,4, 6,5,7, 5,4,7, 1,6,2, 6,7,2, 5,6,0, 6,1,0, 7,4,2, 4,3,2], dtype = np.int32)
         edgeDataIndices = np.array([0,1, 1,2, 2,3, 3,0, 4,7, 7,6, 6,5, 5,4, 0,5, 1,6, 2,7, 3,4], dtype = np.int32)
@@ -633,23 +69,56 @@ class Cube(QOpenGLWidget):
 
 
         # Final Rubik's Cube
-        listWithConditionsInitiales = [dataIndices, edgeDataIndices, axesData, createNewCubeData(3, *createAdditionalValuesFromCubeType())]
+        cubyFaceWidth, cubyRoundedPartWidth, fTRC, colors = createAdditionalValuesFromCubeType()
+        # Without instancing support (see CubeBuffers.instancingSupported) every cuby gets its own vertices instead
+        if self.instanced and not CubeBuffers.instancingSupported():
+            self.instanced = False
+        self.stickerColors = colors
+        self.lastLayerOnly = False
+        if self.stickerTexture:
+            keptCubies = None
+            self.builtCubies = None
+        else:
+            keptCubies = CubeGeometry.visibleCubies(self.cubeType) if self.cullHiddenCubies else np.ones(self.cubeType**3, dtype = bool)
+            # Cuby id of every built cuby (= of every row of listWithCubies or cubyMatrices)
+            self.builtCubies = np.flatnonzero(keptCubies)
+        if self.stickerTexture:
+            # Palette index of every sticker, the geometry is at most 3 boxes (the resting part(s) of the cube and the turning slab)
+            self.stickerCube = CubeStickers.StickerCube(self.cubeType)
+            self.cellWidth = cubyFaceWidth + 2*cubyRoundedPartWidth
+            listWithCubies = CubeStickers.createSlabBoxes(self.cubeType, self.cellWidth)
+        elif self.instanced:
+            # Only one cuby mesh, every cuby is a matrix plus its 6 face colors
+            self.cubyTemplate = CubeGeometry.createRoundedCubyMesh(self.feinKoernigkeit, cubyFaceWidth, cubyRoundedPartWidth)
+            self.cubyMatrices = CubeGeometry.createCubyMatrices(self.cubeType, cubyFaceWidth, cubyRoundedPartWidth, fTRC, keptCubies)
+            self.cubyColors = colors[self.builtCubies]
+            listWithCubies = None
+        else:
+            createRoundedCubies = GeometryCache.createRoundedCubies if self.geometryCache else CubeGeometry.createRoundedCubies
+            listWithCubies = createRoundedCubies(self.cubeType, self.feinKoernigkeit, cubyFaceWidth, cubyRoundedPartWidth, fTRC, colors, keptCubies)
+        listWithConditionsInitiales = [dataIndices, edgeDataIndices, axesData, listWithCubies]
 
         # Set important variables and launch both init funcs
         self.objectIndices = listWithConditionsInitiales[0]
         self.lineIndices = listWithConditionsInitiales[1]
         self.coordinateAxes = listWithConditionsInitiales[2]
-        self.listWithCubies = np.array([*listWithConditionsInitiales[3]])
-        self.cubeOrder = np.arange(27).reshape(3,3,3)
+        self.listWithCubies = listWithConditionsInitiales[3]
+        self.positionScale = 1.0
+        if self.vertexFormat != "float" and not self.instanced and not self.stickerTexture:
+            self.listWithCubies, self.positionScale = CubeGeometry.convertVertices(self.listWithCubies, self.vertexFormat, self.builtCubies)
+        # The sticker texture mode doesn't keep track of cubies (cubeType**3 of them would be too many)
+        self.cubeOrder, self.cubySlots = CubeGeometry.createCubeIndex(self.cubeType, keptCubies) if not self.stickerTexture else (None, None)
         self.angles = [0.0,0.0,0.0]
         self.xRotPos, self.yRotPos, self.zRotPos = 0,1,2
         self.difStartPosXRot, self.difStartYRot, self.difStartZRot = 0.0, 0.0, 0.0
 
-        for i in range(27):
-            self.cubeOrder[i//9][(i - i%3 - 2*(i//3))%3][2-i%3] = i
-
         self.whatCubesToRotate = np.array([])
-        self.angleValue = 10*math.pi/180
+        self.turningCubies = np.array([], dtype = int)
+        self.turnMatrix = np.identity(4)
+        self.turnDuration = 0.15
+        self.wholeCubeRotationDuration = 0.1
+        self.scheduler = CubeAnimation.AnimationScheduler(self)
+        self.moveQueue = CubeAnimation.MoveQueue(self.scheduler, self.playMove, {move: sideMove[0] for move, sideMove in CubeGeometry.sideMoves.items()})
 
         self.oldMouseXPos = 0
         self.oldMouseYPos = 0
@@ -658,74 +127,44 @@ class Cube(QOpenGLWidget):
         gl.glEnable(gl.GL_DEPTH_TEST)
         gl.glDepthMask(gl.GL_TRUE)
         gl.glDepthFunc(gl.GL_LESS)
+        # Outward counter clockwise winding everywhere (see CubeGeometry.windingErrors), the axes are lines and don't get culled
+        gl.glEnable(gl.GL_CULL_FACE)
+        gl.glFrontFace(gl.GL_CCW)
+        gl.glCullFace(gl.GL_BACK)
 
         self.initProgram()
 
+        # Persistent buffer holding all cubies, drawn with one single call and only re-uploaded after a side turn
+        self.stickerTable = None
+        self.faceStateTexture = None
+        if self.stickerTexture:
+            # Colors of the palette indexes in the sticker table, the sticker states in their own texture
+            self.cubyProgramDescriptor = CubeProgram.ProgramDescriptor(CubeProgram.stickerShellVertexShaderCode, CubeProgram.stickerShellFragmentShaderCode, CubeProgram.stickerShellUniformNames, CubeProgram.stickerShellAttributeNames)
+            self.stickerTable = CubeBuffers.StickerTable(self.cubyProgramDescriptor, CubeGeometry.colorPalette, 8)
+            self.faceStateTexture = CubeBuffers.FaceStateTexture(self.cubyProgramDescriptor, self.stickerCube.faceStates)
+            self.buffers = CubeBuffers.BufferManager(self.cubyProgramDescriptor, self.listWithCubies, textures = [self.stickerTable, self.faceStateTexture])
+        elif self.instanced:
+            self.cubyProgramDescriptor = CubeProgram.ProgramDescriptor(CubeProgram.instancedVertexShaderCode, CubeProgram.fragmentShaderCode, CubeProgram.instancedUniformNames, CubeProgram.instancedAttributeNames)
+            self.buffers = CubeBuffers.InstancedBufferManager(self.cubyProgramDescriptor, self.cubyTemplate, self.cubyMatrices, self.cubyColors)
+        elif "sticker" in self.listWithCubies.dtype.names:
+            # Sticker ids instead of colors, the colors come from the sticker table
+            self.cubyProgramDescriptor = CubeProgram.programDescriptorFor(self.listWithCubies.dtype)
+            self.stickerTable = CubeBuffers.StickerTable(self.cubyProgramDescriptor, CubeGeometry.stickerTable(self.stickerColors))
+            self.buffers = CubeBuffers.BufferManager(self.cubyProgramDescriptor, self.listWithCubies, positionScale = self.positionScale, textures = [self.stickerTable])
+        else:
+            self.cubyProgramDescriptor = self.programDescriptor
+            self.buffers = CubeBuffers.BufferManager(self.programDescriptor, self.listWithCubies, positionScale = self.positionScale)
+        self.axesBuffers = CubeBuffers.BufferManager(self.programDescriptor, np.array([self.coordinateAxes]), gl.GL_LINES)
+        self.context().aboutToBeDestroyed.connect(self.cleanupGL)
+
 
 
     def initProgram(self):
 
-        # Shader code
-        vertexShaderCode = """
-            uniform vec3 angles;
-            attribute float change;
-            attribute vec3 position;
-            attribute vec4 color;
-            varying vec4 v_color;
-            mat4 modelMatrix;
-            mat4 viewMatrix;
-            mat4 projectionMatrix;
-            void main() {
-                modelMatrix = mat4(1,0,0,0,  0,cos(angles.x),-sin(angles.x),0,  0,sin(angles.x),cos(angles.x),0,  0,0,0,1) *
-                              mat4(cos(angles.y),0,sin(angles.y),0,  0,1,0,0,  -sin(angles.y),0,cos(angles.y),0,  0,0,0,1) *
-                              mat4(cos(angles.z),-sin(angles.z),0,0,  sin(angles.z),cos(angles.z),0,0,  0,0,1,0,  0,0,0,1);
-                viewMatrix = mat4(1,0,0,0,  0,1,0,0,  0,0,1,0,  0,0,-4.5,1);
-                projectionMatrix = mat4(1,0,0,0,  0,1,0,0,  0,0,0,-1, 0,0,-1.5,0);
-                vec4 temporary = projectionMatrix * viewMatrix * modelMatrix * vec4(position, 1.0);
-                gl_Position = temporary / temporary.w;
-                v_color = color;
-            }
-        """
-
-        fragmentShaderCode = """
-            varying vec4 v_color;
-            void main() {
-                gl_FragColor = v_color;
-            }
-        """
-
-        # Compile and link shader code
-        self.program = gl.glCreateProgram()
-        vertexShader = gl.glCreateShader(gl.GL_VERTEX_SHADER)
-        fragmentShader = gl.glCreateShader(gl.GL_FRAGMENT_SHADER)
-
-        gl.glShaderSource(vertexShader, vertexShaderCode)
-        gl.glShaderSource(fragmentShader, fragmentShaderCode)
-
-        gl.glCompileShader(vertexShader)
-        if not gl.glGetShaderiv(vertexShader, gl.GL_COMPILE_STATUS):
-            error = gl.glGetShaderInfoLog(vertexShader).decode()
-            print(error)
-            raise RuntimeError("Vertex shader compilation error")
-
-        gl.glCompileShader(fragmentShader)
-        if not gl.glGetShaderiv(fragmentShader, gl.GL_COMPILE_STATUS):
-            error = gl.glGetShaderInfoLog(fragmentShader).decode()
-            print(error)
-            raise RuntimeError("Fragment shader compilation error")
-
-        gl.glAttachShader(self.program, vertexShader)
-        gl.glAttachShader(self.program, fragmentShader)
-
-        gl.glLinkProgram(self.program)
-        if not gl.glGetProgramiv(self.program, gl.GL_LINK_STATUS):
-            print(gl.glGetProgramInfoLog(self.program))
-            raise RuntimeError("Linking error")
-
-        gl.glDetachShader(self.program, vertexShader)
-        gl.glDetachShader(self.program, fragmentShader)
-
-        gl.glUseProgram(self.program)
+        # Shared shader code, every location gets resolved once
+        self.programDescriptor = CubeProgram.ProgramDescriptor()
+        self.program = self.programDescriptor.program
+        self.programDescriptor.use()
 
 
     def resizeGL(self, width, height):
@@ -742,86 +181,36 @@ class Cube(QOpenGLWidget):
         else:
             gl.glViewport(int((self.width/2) - (self.height/2)), 0, self.height, self.height)
 
-        loc = gl.glGetUniformLocation(self.program, "angles")
-        gl.glUniform3f(loc, self.angles[self.xRotPos], self.angles[self.yRotPos], self.angles[self.zRotPos])
+        mvpMatrix = CubeGeometry.modelViewProjectionMatrix(self.angles[self.xRotPos], self.angles[self.yRotPos], self.angles[self.zRotPos])
 
         gl.glClear(gl.GL_COLOR_BUFFER_BIT | gl.GL_DEPTH_BUFFER_BIT)
         #gl.glClearColor(0.0, 0.0, 0.0, 0.0)
         #gl.glClearDepth(1.0)
-        for i in self.listWithCubies:
-            self.drawCubies(i)
-        self.drawAxes()
-
-
-    # Buffer stuff
-    def drawCubies(self, objectToDraw, outLines = True):
-
-        Vbos = gl.glGenBuffers(4)
-
-        posLoc = gl.glGetAttribLocation(self.program, "position")
-        colorLoc = gl.glGetAttribLocation(self.program, "color")
-        posOffset = ctypes.c_void_p(0)
-        colorOffset = ctypes.c_void_p(objectToDraw.dtype["position"].itemsize)
-
-        objectStride = objectToDraw.strides[0]
-
-        # Cube itself
-        gl.glBindBuffer(gl.GL_ARRAY_BUFFER, Vbos[0])
-        gl.glBufferData(gl.GL_ARRAY_BUFFER, objectToDraw.nbytes, objectToDraw, gl.GL_DYNAMIC_DRAW)
-
-        gl.glEnableVertexAttribArray(posLoc)
-        gl.glVertexAttribPointer(posLoc, 3, gl.GL_FLOAT, False, objectStride, posOffset)
-
-        gl.glEnableVertexAttribArray(colorLoc)
-        gl.glVertexAttribPointer(colorLoc, 4, gl.GL_FLOAT, False, objectStride, colorOffset)
-
-        gl.glDrawArrays(gl.GL_TRIANGLES, 0, objectToDraw.size)
-
-        if not outLines:
-
-            outlines = np.zeros(8, [("position", np.float32, 3), ("color", np.float32, 4)])
-            outlines["position"] = objectToDraw["position"]
-            outlines["color"] = np.ones(4, dtype = np.float32)
-
-            # Lines for visibility's sake
-            gl.glBindBuffer(gl.GL_ELEMENT_ARRAY_BUFFER, Vbos[3])
-            gl.glBufferData(gl.GL_ELEMENT_ARRAY_BUFFER, self.lineIndices.nbytes, self.lineIndices, gl.GL_DYNAMIC_DRAW)
-
-            gl.glBindBuffer(gl.GL_ARRAY_BUFFER, Vbos[1])
-            gl.glBufferData(gl.GL_ARRAY_BUFFER, outlines.nbytes, outlines, gl.GL_DYNAMIC_DRAW)
-
-            gl.glEnableVertexAttribArray(posLoc)
-            gl.glVertexAttribPointer(posLoc, 3, gl.GL_FLOAT, False, objectStride, posOffset)
-
-            gl.glEnableVertexAttribArray(colorLoc)
-            gl.glVertexAttribPointer(colorLoc, 4, gl.GL_FLOAT, False, objectStride, colorOffset)
-
-            gl.glBindBuffer(gl.GL_ELEMENT_ARRAY_BUFFER, Vbos[3])
-            gl.glDrawElements(gl.GL_LINES, self.lineIndices.size, gl.GL_UNSIGNED_INT, ctypes.c_void_p(0))
-
-
-    def drawAxes(self):
-
-        Vbo = gl.glGenBuffers(1)
-
-        posLoc = gl.glGetAttribLocation(self.program, "position")
-        colorLoc = gl.glGetAttribLocation(self.program, "color")
-        posOffset = ctypes.c_void_p(0)
-        colorOffset = ctypes.c_void_p(self.coordinateAxes.dtype["position"].itemsize)
-
-        axesStride = self.coordinateAxes.strides[0]
-
-        # Coordinate axes
-        gl.glBindBuffer(gl.GL_ARRAY_BUFFER, Vbo)
-        gl.glBufferData(gl.GL_ARRAY_BUFFER, self.coordinateAxes.nbytes, self.coordinateAxes, gl.GL_DYNAMIC_DRAW)
-
-        gl.glEnableVertexAttribArray(posLoc)
-        gl.glVertexAttribPointer(posLoc, 3, gl.GL_FLOAT, False, axesStride, posOffset)
-
-        gl.glEnableVertexAttribArray(colorLoc)
-        gl.glVertexAttribPointer(colorLoc, 4, gl.GL_FLOAT, False, axesStride, colorOffset)
-
-        gl.glDrawArrays(gl.GL_LINES, 0, 6)
+        # The cubies may use the instanced program, the axes always use the plain one
+        self.cubyProgramDescriptor.use()
+        self.cubyProgramDescriptor.setMatrix("mvpMatrix", mvpMatrix)
+        self.buffers.draw(self.turningCubies, self.turnMatrix)
+        if self.cubyProgramDescriptor is not self.programDescriptor:
+            self.programDescriptor.use()
+            self.programDescriptor.setMatrix("mvpMatrix", mvpMatrix)
+        self.axesBuffers.draw()
+        self.scheduler.recordFrame()
+
+
+    # Called right before the widget's context gets destroyed
+    def cleanupGL(self):
+
+        self.makeCurrent()
+        self.buffers.release()
+        self.axesBuffers.release()
+        if self.stickerTable:
+            self.stickerTable.release()
+        if self.faceStateTexture:
+            self.faceStateTexture.release()
+        if self.cubyProgramDescriptor is not self.programDescriptor:
+            self.cubyProgramDescriptor.release()
+        self.programDescriptor.release()
+        self.doneCurrent()
 
 
     def mouseClicked(self, mouseClickEvent):
@@ -854,136 +243,261 @@ class Cube(QOpenGLWidget):
         # Left
         if key == Qt.Key_Left:
 
-            for _ in range(40):
-                self.angles[1] -= 0.25*math.pi/180
-                self.repaint()
-                time.sleep(0.0015)
+            self.rotateWholeCube(1, -10*math.pi/180)
 
         # Right
         elif key == Qt.Key_Right:
 
-            for _ in range(40):
-                self.angles[1] += 0.25*math.pi/180
-                self.repaint()
-                time.sleep(0.0015)
+            self.rotateWholeCube(1, 10*math.pi/180)
 
         # Down
         elif key == Qt.Key_Down:
 
-            if abs(self.angles[0] - self.difStartPosXRot) > math.pi/4:
-                self.angles.append(self.angles[1])
-                self.angles.pop(1)
-                temp = self.yRotPos
-                self.yRotPos = self.zRotPos
-                self.zRotPos = temp
-                self.difStartPosXRot += math.pi/2
-
-            for _ in range(40):
-                self.angles[0] += 0.25*math.pi/180
-                self.repaint()
-                time.sleep(0.0015)
+            self.rotateWholeCube(0, 10*math.pi/180)
 
         # Up
         elif key == Qt.Key_Up:
 
-            if abs(self.angles[0] - self.difStartPosXRot) > math.pi/4:
-                self.angles.append(self.angles[1])
-                self.angles.pop(1)
-                temp = self.yRotPos
-                self.yRotPos = self.zRotPos
-                self.zRotPos = temp
-                self.difStartPosXRot -= math.pi/2
-
-            for _ in range(40):
-                self.angles[0] -= 0.25*math.pi/180
-                self.repaint()
-                time.sleep(0.0015)
+            self.rotateWholeCube(0, -10*math.pi/180)
 
 
         # Side rotations
         # Front
         elif key == Qt.Key_F or key == "f":
 
-            self.rotateCubeSide(0, 0)
+            self.queueMove("f")
         # Back
         elif key == Qt.Key_B or key == "b":
 
-            self.rotateCubeSide(0, 0, (0,1), 2, True)
+            self.queueMove("b")
 
         # Top
         elif key == Qt.Key_T or key == "t":
 
-            self.rotateCubeSide(2, 0, (0,1), 3)
+            self.queueMove("t")
         # Down
         elif key == Qt.Key_D or key == "d":
 
-            self.rotateCubeSide(2, 0, (0,1), 1, True)
+            self.queueMove("d")
 
         # Right
         elif key == Qt.Key_R or key == "r":
 
-            self.rotateCubeSide(1, 0, (0,2), 1)
+            self.queueMove("r")
         # Left
         elif key == Qt.Key_L or key == "l":
 
-            self.rotateCubeSide(1, 0, (0,2), 3, True)
+            self.queueMove("l")
 
         # Middle
         elif key == Qt.Key_M or key == "m":
 
-            self.rotateCubeSide(1, 1, (0,2), 3, True)
+            self.queueMove("m")
         # Equator
         elif key == Qt.Key_E or key == "e":
 
-            self.rotateCubeSide(2, 1, (0,1), 1, True)
+            self.queueMove("e")
         # Standing
         elif key == Qt.Key_S or key == "s":
 
-            self.rotateCubeSide(0, 1)
+            self.queueMove("s")
 
         elif key == Qt.Key_H:
 
             self.scramble(30)
 
+        elif key == Qt.Key_G:
+
+            self.dimAllButLastLayer(not self.lastLayerOnly)
+
+        elif key == Qt.Key_Escape:
+
+            self.moveQueue.cancel()
+
 
         self.update()
 
 
-    def rotateCubeSide(self, sideRotationMatricesArrayIndex, layer, axes = (0,1), amountForth = 0, invertAngle = False):
+    def rotateWholeCube(self, angleIndex, angleDifference):
+
+        appliedProgress = 0.0
+
+        def start():
+
+            if angleIndex == 0 and abs(self.angles[0] - self.difStartPosXRot) > math.pi/4:
+                self.angles.append(self.angles[1])
+                self.angles.pop(1)
+                temp = self.yRotPos
+                self.yRotPos = self.zRotPos
+                self.zRotPos = temp
+                self.difStartPosXRot += math.copysign(math.pi/2, angleDifference)
+
+        def update(progress):
+
+            nonlocal appliedProgress
+            self.angles[angleIndex] += (progress - appliedProgress) * angleDifference
+            appliedProgress = progress
+
+        self.scheduler.add(CubeAnimation.Animation(self.wholeCubeRotationDuration, update, start))
+
+
+    def turnCubeOrder(self, layer, axes = (0,1), amountForth = 0, quarterTurns = 1):
+
+        permutation, layerPositions = CubeGeometry.cubeOrderTurn(len(self.cubeOrder), layer, axes, amountForth, quarterTurns)
+        self.whatCubesToRotate = self.cubeOrder.ravel()[layerPositions]
+        self.cubeOrder = self.cubeOrder.ravel()[permutation].reshape(self.cubeOrder.shape)
+
+        # Cubies which haven't been built have the slot -1
+        turningSlots = self.cubySlots[self.whatCubesToRotate].flatten()
+
+        return turningSlots[turningSlots >= 0]
+
+
+    def rotateCubeSide(self, sideRotationMatricesArrayIndex, layer, axes = (0,1), amountForth = 0, invertAngle = False, quarterTurns = 1, duration = None):
+
+        signedQuarterTurns = CubeGeometry.signedQuarterTurns(quarterTurns, invertAngle)
+        angle = signedQuarterTurns * math.pi/2
+        duration = (self.turnDuration if duration is None else duration) * (1 + (abs(signedQuarterTurns) - 1) / 2)
+
+        # Sticker texture mode: the slab which turns
+        axis, slab = CubeStickers.turnedSlab(self.cubeType, layer, axes, amountForth) if self.stickerTexture else (None, None)
+
+        def start():
+
+            if self.stickerTexture:
+                # Cut the cube into the slab in front, the turning slab and the one behind it
+                self.listWithCubies[:] = CubeStickers.createSlabBoxes(self.cubeType, self.cellWidth, axis, slab)
+                self.buffers.markDirty(np.arange(len(self.listWithCubies)))
+                self.turningCubies = np.array([1])
+            else:
+                self.turningCubies = self.turnCubeOrder(layer, axes, amountForth, quarterTurns)
+
+        # Animate on the GPU: from one tick to the next only the turnMatrix uniform changes, the vertex data stays untouched
+        def update(progress):
+
+            self.turnMatrix = CubeGeometry.sideRotationMatrix(sideRotationMatricesArrayIndex, progress*angle)
+
+        # Quarter turn complete: write it into the vertex data once
+        def finish():
 
-        if invertAngle:
-            self.angleValue = -self.angleValue
+            matrix = CubeGeometry.quarterTurnMatrix(sideRotationMatricesArrayIndex, signedQuarterTurns)
+            if self.stickerTexture:
+                # Only the stickers of the slab move (O(cubeType) texels, plus a whole face for an outer slab), the cube becomes one box again
+                self.faceStateTexture.markDirty(self.stickerCube.turn(axis, slab, matrix[:3,:3]))
+                self.listWithCubies[:] = CubeStickers.createSlabBoxes(self.cubeType, self.cellWidth)
+                self.buffers.markDirty(np.arange(len(self.listWithCubies)))
+            elif self.instanced:
+                CubeGeometry.rotateCubyMatrices(self.cubyMatrices, self.turningCubies, matrix)
+            else:
+                CubeGeometry.rotateCubies(self.listWithCubies, self.turningCubies, matrix)
+            if not self.stickerTexture:
+                self.buffers.markDirty(self.turningCubies)
+            self.turningCubies = np.array([], dtype = int)
+            self.turnMatrix = np.identity(4)
 
-        self.cubeOrder = np.rot90(self.cubeOrder, amountForth, axes = axes)
-        self.whatCubesToRotate = self.cubeOrder[layer]
-        self.cubeOrder[layer] = np.rot90(self.cubeOrder[layer], 3)
-        self.cubeOrder = np.rot90(self.cubeOrder, 4-amountForth, axes = axes)
+        self.scheduler.add(CubeAnimation.Animation(duration, update, start, finish))
 
-        sideRotationMatricesArray = (
-            np.array([[np.cos(self.angleValue),np.sin(self.angleValue),0,0] , [-np.sin(self.angleValue),np.cos(self.angleValue),0,0] , [0,0,1,0] , [0,0,0,1]]),
-            np.array([[1,0,0,0] , [0,np.cos(self.angleValue),np.sin(self.angleValue),0] , [0,-np.sin(self.angleValue),np.cos(self.angleValue),0] , [0,0,0,1]]),
-            np.array([[np.cos(self.angleValue),0,-np.sin(self.angleValue),0] , [0,1,0,0] , [np.sin(self.angleValue),0,np.cos(self.angleValue),0] , [0,0,0,1]])
-        )
 
-        oldTime = time.time()
+    def queueMove(self, move, quarterTurns = 1):
 
-        for _ in range(int(round((math.pi/2)/abs(self.angleValue)))):
-            for cuby in [x for x in self.listWithCubies if np.where(x == self.listWithCubies)[0][0] in self.whatCubesToRotate]:
-                for vertex in cuby:
-                    vertex["position"] = (sideRotationMatricesArray[sideRotationMatricesArrayIndex] @ np.array([vertex["position"][0], vertex["position"][1], vertex["position"][2], 1]))[:3]
-            self.repaint()
-            time.sleep(0.0015)
+        self.moveQueue.push(move, quarterTurns, self.turnDuration)
 
-        print(time.time()-oldTime)
 
-        self.angleValue = abs(self.angleValue)
+    def playMove(self, move, quarterTurns, duration):
 
+        self.rotateCubeSide(*CubeGeometry.sideMoves[move], quarterTurns, duration)
 
-    def scramble(self, amountOfMoves):
 
-        self.angleValue = math.pi/6
-        listWithMoves = [random.choice("fbtdrlmes") for _ in range(amountOfMoves)]
+    def applyMovesInstantly(self, moves):
+
+        self.moveQueue.cancel()
+        self.scheduler.finishAll()
+
+        if self.stickerTexture:
+            for move in moves:
+                move, quarterTurns = (move, 1) if isinstance(move, str) else move
+                sideRotationMatricesArrayIndex, layer, axes, amountForth, invertAngle = CubeGeometry.sideMoves[move]
+                matrix = CubeGeometry.quarterTurnMatrix(sideRotationMatricesArrayIndex, CubeGeometry.signedQuarterTurns(quarterTurns, invertAngle))[:3,:3]
+                self.faceStateTexture.markDirty(self.stickerCube.turn(*CubeStickers.turnedSlab(self.cubeType, layer, axes, amountForth), matrix))
+            self.update()
+            return
+
+        cubyMatrices = np.tile(np.identity(3), (len(self.builtCubies), 1, 1))
+        for move in moves:
+            move, quarterTurns = (move, 1) if isinstance(move, str) else move
+            sideRotationMatricesArrayIndex, layer, axes, amountForth, invertAngle = CubeGeometry.sideMoves[move]
+
+            turningCubies = self.turnCubeOrder(layer, axes, amountForth, quarterTurns)
+            matrix = CubeGeometry.quarterTurnMatrix(sideRotationMatricesArrayIndex, CubeGeometry.signedQuarterTurns(quarterTurns, invertAngle))[:3,:3]
+            cubyMatrices[turningCubies] = matrix @ cubyMatrices[turningCubies]
+
+        if self.instanced:
+            CubeGeometry.rotateCubyMatricesIndividually(self.cubyMatrices, cubyMatrices)
+        else:
+            CubeGeometry.rotateCubiesIndividually(self.listWithCubies, cubyMatrices)
+        self.buffers.markDirty(np.arange(len(self.builtCubies)))
+        self.update()
+
+
+    def scramble(self, amountOfMoves, seed = None, animated = False):
+
+        generator = random.Random(seed)
+        listWithMoves = [generator.choice("fbtdrlmes") for _ in range(amountOfMoves)]
+
+        if not animated:
+            self.applyMovesInstantly(listWithMoves)
+            return listWithMoves
+
+        self.turnDuration = 0.05
         for move in listWithMoves:
             self.keyboard(move)
 
-        self.angleValue = 10*math.pi/180
+        self.turnDuration = 0.15
+
+        return listWithMoves
+
+
+    # palette: one color per face and one for the inside (see CubeGeometry.colorPalette)
+    def setColorScheme(self, palette):
+
+        # Sticker texture mode: the palette is all there is to change
+        if self.stickerTexture:
+            self.stickerTable.setColors(palette)
+            self.update()
+            return
+
+        self.stickerColors = CubeGeometry.stickerColors(self.cubeType, np.asarray(palette, dtype = np.float32))
+        self.dimAllButLastLayer(self.lastLayerOnly)
+
+
+    # Not available in the sticker texture mode, there are no cubies to tell apart
+    def dimAllButLastLayer(self, enabled = True):
+
+        if self.stickerTexture:
+            return
+
+        self.lastLayerOnly = enabled
+        self.showStickerColors(CubeGeometry.dimStickers(self.stickerColors, self.cubeOrder[:, 0, :]) if enabled else self.stickerColors)
+
+
+    # Instanced: new face colors per instance, sticker table: only the table, otherwise the colors of every vertex
+    def showStickerColors(self, stickerColors):
+
+        if self.instanced:
+            self.buffers.setColors(np.asarray(stickerColors)[self.builtCubies])
+        elif self.stickerTable:
+            self.stickerTable.setColors(CubeGeometry.stickerTable(stickerColors))
+        else:
+            CubeGeometry.recolorVertices(self.listWithCubies, self.cubySlots, stickerColors)
+            self.buffers.markDirty(np.arange(len(self.listWithCubies)))
+        self.update()
+
+
+    def frameRate(self):
+
+        return self.scheduler.frameRate()
+
+
+    def bytesUploaded(self):
+
+        return self.buffers.bytesUploadedLastFrame, self.buffers.bytesUploadedTotal
@@ -58,8 +58,13 @@ class MainWindow(QMainWindow):
             # All about Cube Window
         # Container for layout
         self.cubeContainerWidget = QWidget()
-        # Cube window
-        self.qOpenGLWidget = CubeWindow.Cube(self, 500, 500)
+        # Cube window (start with --compact-vertices for the smaller vertex format, with --sticker-table for sticker ids instead of vertex colors)
+        compactVertices = "--compact-vertices" in sys.argv
+        if "--sticker-table" in sys.argv:
+            vertexFormat = "compactPalette" if compactVertices else "palette"
+        else:
+            vertexFormat = "compact" if compactVertices else "float"
+        self.qOpenGLWidget = CubeWindow.Cube(self, 500, 500, vertexFormat)
         # Place holder to reduce the cube windows's height
         self.placeHoldingWidget = QWidget()
         # Layout
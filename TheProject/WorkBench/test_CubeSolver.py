@@ -0,0 +1,60 @@
+import random
+import pytest
+import CubeState
+import CubeSolver
+
+
+# Solutions have to solve the cube within the move limit, whatever it has been turned with
+# The tables get built the first time (some seconds) and are loaded from disk afterwards (see CubeSolver.loadTables)
+# Run from this folder: python -m pytest
+
+
+@pytest.fixture(scope = "module", autouse = True)
+def tables():
+
+    return CubeSolver.loadTables()
+
+
+def solveAndCheck(cubeState, maxLength = 22):
+
+    solution = CubeSolver.solve(cubeState, maxLength, timeout = 30.0)
+
+    assert solution is not None
+    assert len(solution) <= maxLength
+    assert all(move in CubeSolver.faceMoves for move in solution)
+    assert cubeState.copy().applySequence(solution).isSolved()
+
+    return solution
+
+
+def testSolved():
+
+    assert CubeSolver.solve(CubeState.CubeState()) == []
+
+
+# Random face move scrambles
+@pytest.mark.parametrize("seed", range(10))
+def testScrambles(seed):
+
+    generator = random.Random(seed)
+    solveAndCheck(CubeState.CubeState().applySequence([generator.choice(CubeSolver.faceMoves) for _ in range(30)]))
+
+
+# Slices and rotations move the centers: the solution solves the cube in its new orientation
+@pytest.mark.parametrize("seed", range(5))
+def testSlicesAndRotations(seed):
+
+    generator = random.Random(seed)
+    solveAndCheck(CubeState.CubeState().applySequence([generator.choice(CubeState.moveNames) for _ in range(30)]))
+
+
+@pytest.mark.parametrize("sequence", [["M"], ["E2"], ["S'"], ["x"], ["y", "z'"], ["M", "E", "S"]])
+def testOnlySlicesAndRotations(sequence):
+
+    solveAndCheck(CubeState.CubeState().applySequence(sequence))
+
+
+# The first solution found may be longer than the scramble, but within a tight limit the short one still gets found
+def testShortScramble():
+
+    solveAndCheck(CubeState.CubeState().applySequence(["R", "U2", "F'"]), maxLength = 3)
@@ -0,0 +1,74 @@
+import random
+import numpy as np
+import pytest
+import CubeState
+
+
+# The logical cube state every move of CubeWindow updates, compared with the facelet move tables it is built from
+# Run from this folder: python -m pytest
+
+
+# Every move turned 4 times is no move at all, twice it is the move's "2" version
+@pytest.mark.parametrize("base", CubeState.baseMoves)
+def testQuarterTurns(base):
+
+    assert CubeState.CubeState().apply(base, 4).isSolved()
+    assert CubeState.CubeState().apply(base, 2) == CubeState.CubeState().apply(base + "2")
+    assert CubeState.CubeState().apply(base, 3) == CubeState.CubeState().apply(base + "'")
+    assert CubeState.moveIndex(base, 4) is None
+
+
+# Moves change the state, their inverses undo them (e.g. the sexy move 6 times is solved again)
+@pytest.mark.parametrize("sequence, solved", [
+    (["R", "U", "R'", "U'"], False),
+    (["R", "U", "R'", "U'"] * 6, True),
+    (["M", "E", "S", "M'", "E'", "S'"], False),
+    (["x", "y", "z", "z'", "y'", "x'"], True),
+    (["R", "M'", "L'", "x'"], True),
+])
+def testSequences(sequence, solved):
+
+    assert CubeState.CubeState().applySequence(sequence).isSolved() == solved
+
+
+# Applying move by move, applying a whole sequence at once and permuting the facelets have to end up at the same state
+@pytest.mark.parametrize("seed", range(5))
+def testSequenceMatchesFacelets(seed):
+
+    generator = random.Random(seed)
+    sequence = [generator.choice(CubeState.moveNames) for _ in range(40)]
+
+    moveByMove = CubeState.CubeState()
+    facelets = CubeState.CubeState().facelets()
+    for move in sequence:
+        moveByMove.apply(move)
+        facelets = facelets[CubeState.faceletMoveTable[CubeState.moveIndexes[move]]]
+
+    assert moveByMove == CubeState.CubeState().applySequence(sequence)
+    assert np.array_equal(moveByMove.facelets(), facelets)
+    assert np.array_equal(facelets, CubeState.CubeState().facelets()[CubeState.composeFaceletPermutation(sequence)])
+    assert CubeState.CubeState.fromFacelets(facelets) == moveByMove
+
+
+# Keyboard letters, names and [move, quarterTurns] pairs are the same moves
+def testMoveForms():
+
+    letters = CubeState.CubeState().applySequence(["r", "t", "f"])
+    names = CubeState.CubeState().applySequence(["R", "U", "F"])
+    pairs = CubeState.CubeState().applySequence([("R", 5), ["t", 1], ("F", -3)])
+
+    assert letters == names == pairs
+    assert CubeState.splitMoveName("R2") == ("R", 2)
+    assert CubeState.splitMoveName("r") == ("R", 1)
+    with pytest.raises(ValueError):
+        CubeState.splitMoveName("Q")
+
+
+# Facelets no real cube can have
+def testImpossibleFacelets():
+
+    facelets = CubeState.CubeState().facelets()
+    facelets[CubeState.cornerFacelets[0]] = 0
+
+    with pytest.raises(ValueError):
+        CubeState.CubeState.fromFacelets(facelets)
@@ -0,0 +1,62 @@
+import random
+import pytest
+import CubeState
+import MoveNotation
+
+
+# The notation gets merged and cancelled, which must never change what the sequence does to the cube
+# Run from this folder: python -m pytest
+
+
+# Written notation --> shortest notation
+@pytest.mark.parametrize("text, shortest", [
+    ("R R R'", "R"),
+    ("R R'", ""),
+    ("U U2", "U'"),
+    ("R M' L'", "x"),
+    ("R M'", "Rw"),
+    ("(R U R' U')2", "R U R' U' R U R' U'"),
+    ("(R U R' U')6", "R U R' U' R U R' U' R U R' U' R U R' U' R U R' U' R U R' U'"),
+    ("R L R' L'", ""),
+    ("F2 B2 F2", "B2"),
+])
+def testNotation(text, shortest):
+
+    assert MoveNotation.notation(MoveNotation.compileSequence(text)) == shortest
+
+
+# Every form of a compiled sequence turns the cube the same way as the written moves
+@pytest.mark.parametrize("seed", range(5))
+def testCompiledMovesMatch(seed):
+
+    generator = random.Random(seed)
+    names = list(MoveNotation.notationMoves)
+    text = " ".join(generator.choice(names) + generator.choice(("", "2", "'", "3", "2'")) for _ in range(60))
+    runs = MoveNotation.compileSequence(text)
+
+    # Written moves, nothing merged (parse gives single moves in the same form as runs)
+    expected = CubeState.CubeState().applySequence(MoveNotation.stateMoves(MoveNotation.parse(text)))
+    animated = CubeState.CubeState().applySequence(MoveNotation.animationMoves(runs))
+    rewritten = CubeState.CubeState().applySequence(MoveNotation.stateMoves(MoveNotation.compileSequence(MoveNotation.notation(runs))))
+    permuted = CubeState.CubeState.fromFacelets(CubeState.CubeState().facelets()[MoveNotation.composedPermutation(text)])
+
+    assert expected == animated == rewritten == permuted
+    # Runs never repeat an axis and never are empty
+    assert all(first[0] != second[0] for first, second in zip(runs, runs[1:]))
+    assert all(any(layerTurns) for _, layerTurns in runs)
+
+
+# Wide moves turn the middle layer along, lowercase side letters are wide moves
+def testWideMoves():
+
+    wide = CubeState.CubeState().applySequence(MoveNotation.stateMoves(MoveNotation.compileSequence("Rw")))
+
+    assert wide == CubeState.CubeState().applySequence(["R", "M'"])
+    assert MoveNotation.compileSequence("r") == MoveNotation.compileSequence("Rw")
+
+
+@pytest.mark.parametrize("text", ["R(", "Q", "R)", "(R U"])
+def testErrors(text):
+
+    with pytest.raises(ValueError):
+        MoveNotation.parse(text)
@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+import CubeGeometry
+import CubeStickers
+
+
+# Every generated triangle has to wind counter clockwise seen from outside, otherwise GL_CULL_FACE (enabled in every window) hides visible parts of the cube
+# Run from this folder: python -m pytest
+
+
+@pytest.mark.parametrize("cubeType", (2, 3, 4, 7))
+@pytest.mark.parametrize("feinKoernigkeit", (1, 2, 3, 5, 8))
+def testRoundedCubies(cubeType, feinKoernigkeit):
+
+    cubyFaceWidth, cubyRoundedPartWidth, fTRC = CubeGeometry.roundedCubyDimensions(cubeType)
+    listWithCubies = CubeGeometry.createRoundedCubies(cubeType, feinKoernigkeit, cubyFaceWidth, cubyRoundedPartWidth, fTRC, CubeGeometry.stickerColors(cubeType), CubeGeometry.visibleCubies(cubeType))
+
+    assert np.sum(CubeGeometry.windingErrors(listWithCubies)) == 0
+
+
+# Integer positions get rounded, which must not flip (or flatten) any triangle
+@pytest.mark.parametrize("vertexFormat", [name for name in CubeGeometry.vertexFormats if name != "float"])
+def testCompactVertices(vertexFormat):
+
+    cubyFaceWidth, cubyRoundedPartWidth, fTRC = CubeGeometry.roundedCubyDimensions(3)
+    listWithCubies = CubeGeometry.createRoundedCubies(3, 3, cubyFaceWidth, cubyRoundedPartWidth, fTRC, CubeGeometry.stickerColors(3))
+    converted, _ = CubeGeometry.convertVertices(listWithCubies, vertexFormat)
+
+    assert np.sum(CubeGeometry.windingErrors(converted)) == 0
+
+
+# The template every instanced cuby is drawn with (the cuby matrices are rotations, which keep the winding)
+@pytest.mark.parametrize("feinKoernigkeit", (1, 2, 3, 5, 8))
+def testInstancedTemplate(feinKoernigkeit):
+
+    cubyFaceWidth, cubyRoundedPartWidth, _ = CubeGeometry.roundedCubyDimensions(3)
+    mesh = CubeGeometry.createRoundedCubyMesh(feinKoernigkeit, cubyFaceWidth, cubyRoundedPartWidth)
+
+    assert np.sum(CubeGeometry.windingErrors(mesh[None])) == 0
+
+
+# At rest and for every slab a layer turn can cut out
+@pytest.mark.parametrize("cubeType", (2, 3, 4))
+def testSlabBoxes(cubeType):
+
+    cuts = [(0, None)] + [(axis, slab) for axis in range(3) for slab in range(cubeType)]
+    for axis, slab in cuts:
+        boxes = CubeStickers.createSlabBoxes(cubeType, 3 / cubeType, axis, slab)
+        positions = boxes["position"].astype(float)
+        hasVolume = np.all(np.ptp(positions, axis = 1) > 0, axis = 1)
+        assert np.sum(CubeGeometry.windingErrors(boxes[hasVolume])) == 0
+
+        # Boxes without volume (nothing before or behind the slab) are flat, their 2 faces with area still have to point along their normals
+        triangles = positions.reshape(len(boxes), 6, 2, 3, 3)
+        normals = np.cross(triangles[..., 1, :] - triangles[..., 0, :], triangles[..., 2, :] - triangles[..., 0, :])
+        alongNormals = np.einsum("bftj,fj->bft", normals, CubeGeometry.faceNormals)
+        hasArea = np.linalg.norm(normals, axis = -1) > 1e-9
+        assert np.all(alongNormals[hasArea] > 0)